@@ -0,0 +1,139 @@
+"""Configuration backup and restore for the Weishaupt WCM-COM integration.
+
+Ein Backup enthält alle Konfig-, User-, Expert-, Urlaubs- und
+Sommerzeit-Parameter als JSON im Home-Assistant-Konfigurationsverzeichnis.
+Beim Restore werden nur die Abweichungen zurückgeschrieben.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import BACKUP_VERSION, DOMAIN
+from .coordinator import WeishauptPollScheduler
+from .protocol import BACKUP_PARAMETERS, MAX_TELEGRAMS_PER_REQUEST, in_circuits, restorable_settings
+from .writer import WriteRateLimitError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def default_backup_filename() -> str:
+    """Return a timestamped file name for a new backup."""
+    return f"{DOMAIN}_backup_{dt_util.now():%Y%m%d_%H%M%S}.json"
+
+
+def _backup_parameters(scheduler: WeishauptPollScheduler) -> list[str]:
+    """Return the backup parameters of the boiler and the configured heating circuits."""
+    return [name for name in BACKUP_PARAMETERS if in_circuits(name, scheduler.api.circuits)]
+
+
+async def async_backup_configuration(
+    hass: HomeAssistant, scheduler: WeishauptPollScheduler, filename: str
+) -> dict:
+    """Read all settings from the WCM-COM and store them in ``filename``.
+
+    Die Parameter werden frisch gelesen (so wenige Requests wie möglich),
+    nicht aus dem ggf. älteren Snapshot übernommen.
+    """
+
+    names = _backup_parameters(scheduler)
+    values = await scheduler.async_refresh_parameters(names)
+    parameters = {name: values[name] for name in names if values.get(name) is not None}
+    missing = [name for name in names if name not in parameters]
+    if missing:
+        _LOGGER.debug("Backup: no value for %s", missing)
+
+    backup = {
+        "version": BACKUP_VERSION,
+        "created": dt_util.now().isoformat(),
+        "parameters": parameters,
+    }
+    path = hass.config.path(filename)
+
+    def _write() -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(backup, file, indent=2, ensure_ascii=False)
+
+    await hass.async_add_executor_job(_write)
+    _LOGGER.info("Saved %s WCM-COM settings to %s", len(parameters), path)
+    return {"path": path, "parameters": len(parameters)}
+
+
+async def async_restore_configuration(
+    hass: HomeAssistant, scheduler: WeishauptPollScheduler, filename: str
+) -> dict:
+    """Write back the settings from ``filename`` that differ from the device.
+
+    Die aktuellen Werte werden vorher frisch gelesen; die Abweichungen
+    werden in Blöcken von höchstens einem Request geschrieben. Greift das Schreiblimit, bricht der
+    Restore ab – ein erneuter Aufruf setzt dort fort, da nur Abweichungen
+    geschrieben werden.
+    """
+
+    path = hass.config.path(filename)
+
+    def _read() -> dict:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+
+    try:
+        backup = await hass.async_add_executor_job(_read)
+    except FileNotFoundError as err:
+        raise HomeAssistantError(f"Backup file {path} not found") from err
+    except (OSError, ValueError) as err:
+        raise HomeAssistantError(f"Cannot read backup file {path}: {err}") from err
+
+    if not isinstance(backup, dict) or not isinstance(backup.get("parameters"), dict):
+        raise HomeAssistantError(f"{path} is not a WCM-COM configuration backup")
+    if backup.get("version") != BACKUP_VERSION:
+        raise HomeAssistantError(f"Unsupported backup version {backup.get('version')} in {path}")
+
+    # Parameter nicht (mehr) konfigurierter Heizkreise werden übersprungen
+    try:
+        parameters, skipped = restorable_settings(backup["parameters"], scheduler.api.circuits)
+    except ValueError as err:
+        raise HomeAssistantError(str(err)) from err
+    if skipped:
+        _LOGGER.warning("Restore: skipping parameters of heating circuits that are not configured: %s", skipped)
+
+    await scheduler.async_refresh_parameters(list(parameters))
+    try:
+        changed = scheduler.changed_settings(parameters)
+    except ValueError as err:
+        raise HomeAssistantError(str(err)) from err
+
+    result = {
+        "changed": {},
+        "unchanged": [name for name in parameters if name not in changed],
+        "failed": [],
+        "skipped": skipped,
+    }
+    items = list(changed.items())
+    for start in range(0, len(items), MAX_TELEGRAMS_PER_REQUEST):
+        try:
+            batch = await scheduler.async_apply_settings(dict(items[start:start + MAX_TELEGRAMS_PER_REQUEST]))
+        except WriteRateLimitError as err:
+            raise HomeAssistantError(
+                f"Restore stopped after {len(result['changed'])} changes: {err}. "
+                "Run restore_configuration again to write the remaining differences."
+            ) from err
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        result["changed"].update(batch["changed"])
+        result["unchanged"].extend(batch["unchanged"])
+        result["failed"].extend(batch["failed"])
+
+    _LOGGER.info(
+        "Restored %s WCM-COM settings from %s (%s unchanged, %s failed, %s skipped)",
+        len(result["changed"]),
+        path,
+        len(result["unchanged"]),
+        len(result["failed"]),
+        len(skipped),
+    )
+    return result
@@ -1,9 +1,26 @@
 """Base entity for Weishaupt WCM-COM integration."""
 
 import logging
+from time import perf_counter
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .protocol import is_polled
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def register_entity_parameters(entry_data, entities):
+    """Remember which parameters each entity shows (unique_id -> names).
+
+    Wird von Services genutzt, die Entity-IDs statt Parameternamen annehmen.
+    """
+    mapping = entry_data.setdefault("entity_parameters", {})
+    for entity in entities:
+        mapping[entity.unique_id] = entity.parameter_names
+
+
 class WeishauptBaseEntity:
     """Basisklasse für Weishaupt-Entitäten."""
 
@@ -16,7 +33,118 @@ class WeishauptBaseEntity:
         """Gibt die API-Instanz zurück."""
         return self._api
 
-    async def async_update(self):
-        """Aktualisiert die Zustandsdaten der Entität."""
-        _LOGGER.debug("Updating entity")
-        await self.hass.async_add_executor_job(self._api.update)
+    @property
+    def parameter_names(self) -> list[str]:
+        """Return the parameters the entity is built from."""
+        return [self._sensor_name]
+
+    @property
+    def _allow_write(self) -> bool:
+        """Return True if writes are enabled (follows the options live)."""
+        return self._scheduler.allow_write
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state; with advanced logging the duration is recorded.
+
+        Gemessen wird der ganze State-Write, also inkl. ``native_value`` bzw.
+        ``current_option`` und der Attribute.
+        """
+
+        stats = self._scheduler.stats
+        if not stats.enabled:
+            super().async_write_ha_state()
+            return
+        start = perf_counter()
+        super().async_write_ha_state()
+        stats.record_write(self.entity_id, perf_counter() - start)
+
+    # Optimistisch angezeigter Wert, solange ein Schreibzugriff läuft
+    _optimistic_value = None
+
+    def _reported_value(self):
+        """Return the value the device currently reports for the parameter."""
+        return (self.coordinator.data or {}).get(self._sensor_name)
+
+    def _value_matches(self, reported, requested) -> bool:
+        """Return True if the reported value confirms the requested one."""
+        return reported == requested
+
+    async def _async_write_optimistic(self, value, code: int) -> None:
+        """Show ``value`` immediately, write ``code`` and roll back if needed.
+
+        Der neue Wert wird sofort angezeigt; nach dem Nachlesen gilt wieder
+        der Gerätewert. Weicht dieser ab oder lehnt das Gerät den Wert ab,
+        wird eine Warnung geloggt. Parameter, die nicht gepollt werden
+        (z.B. virtuelle), werden nur geschrieben: ohne Nachlesen gäbe es
+        nichts, womit sich der Wert bestätigen ließe.
+        """
+
+        if not is_polled(self._sensor_name):
+            await self._async_write_unconfirmed(value, code)
+            return
+
+        self._optimistic_value = value
+        self.async_write_ha_state()
+        try:
+            ok = await self._scheduler.async_write_parameter(
+                self._parameter_id,
+                self._bus,
+                self._modultyp,
+                code,
+            )
+        except HomeAssistantError:
+            # z.B. Schreib-Limit erreicht: sofort den Gerätewert zeigen
+            if self._optimistic_value == value:
+                self._optimistic_value = None
+                self.async_write_ha_state()
+            raise
+        finally:
+            superseded = self._optimistic_value != value
+            if not superseded:
+                self._optimistic_value = None
+
+        if superseded:
+            # Ein neuerer Wert wartet bereits auf seinen Schreibzugriff
+            return
+
+        reported = self._reported_value()
+        if not ok:
+            _LOGGER.warning("WCM-COM rejected %s = %s, rolling back to %s", self._sensor_name, value, reported)
+        elif not self._value_matches(reported, value):
+            _LOGGER.warning("WCM-COM reports %s = %s after writing %s, rolling back", self._sensor_name, reported, value)
+        self.async_write_ha_state()
+
+    async def _async_write_unconfirmed(self, value, code: int) -> None:
+        """Write ``code`` without optimistic display or roll back."""
+
+        try:
+            ok = await self._scheduler.async_write_parameter(
+                self._parameter_id,
+                self._bus,
+                self._modultyp,
+                code,
+            )
+        finally:
+            # Evtl. schon vorab angezeigten Wert (Number-Debounce) verwerfen
+            if self._optimistic_value == value:
+                self._optimistic_value = None
+                self.async_write_ha_state()
+        if not ok:
+            _LOGGER.warning("WCM-COM rejected %s = %s", self._sensor_name, value)
+
+    async def _async_apply_settings(self, values: dict) -> None:
+        """Write several parameters through the batched write path.
+
+        Unveränderte Werte werden übersprungen, der Rest geht gemeinsam in
+        einem Request raus und wird einmal nachgelesen.
+        """
+
+        if not self._allow_write:
+            raise HomeAssistantError("Weishaupt WCM-COM integration is in read-only mode.")
+        try:
+            result = await self._scheduler.async_apply_settings(values)
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        if result["failed"]:
+            _LOGGER.warning("WCM-COM did not confirm %s", result["failed"])
@@ -0,0 +1,110 @@
+"""Per-circuit views of the snapshot (no Home Assistant dependency).
+
+Climate- und Warmwasser-Entitäten brauchen Werte aus mehreren Gruppen
+(HK-Prozesswerte, User-Parameter, Kessel-Status). Statt auf jede Gruppe
+einzeln zu hören, wird pro Heizkreis eine kleine, unveränderliche Sicht
+berechnet; nur wenn sie sich ändert, werden die Entitäten benachrichtigt.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .protocol import shared_addresses
+
+# Codes der Betriebsart (HK_USER_OPERATION_MODE_MAP)
+MODE_STANDBY = 1
+MODE_NORMAL = 3
+MODE_ABSENK = 4
+MODE_SOMMER = 5
+MODE_PROGRAM_1 = 11
+MODE_WIE_LEITSTELLE = 255
+
+# Betriebsarten, in denen der Heizkreis nicht heizt
+HEATING_OFF_MODES = (MODE_STANDBY, MODE_SOMMER)
+# Betriebsarten mit festem Sollwert (Normal- bzw. Absenktemperatur)
+HEATING_MANUAL_MODES = (MODE_NORMAL, MODE_ABSENK)
+
+# Parameter einer Sicht ohne "HKn "-Präfix ...
+_CIRCUIT_FIELDS = {
+    "room_temperature": "Raumtemperatur",
+    "target_temperature": "Solltemperatur",
+    "comfort_temperature": "User Normal Raumtemperatur",
+    "eco_temperature": "User Absenk Raumtemperatur",
+    "heating_mode": "User Betriebsart HK",
+    "hot_water_temperature": "Warmwassertemperatur",
+}
+# ... und Kessel-Werte, die für alle Heizkreise gelten
+_BOILER_FIELDS = {
+    "heating": "Heizung",
+    "hot_water": "Warmwasser",
+    "boiler_hot_water_temperature": "Warmwassertemperatur",
+}
+
+
+@dataclass(frozen=True)
+class CircuitView:
+    """Values of one heating circuit as shown by climate/water_heater."""
+
+    circuit: int
+    room_temperature: float | None = None
+    target_temperature: float | None = None
+    comfort_temperature: float | None = None
+    eco_temperature: float | None = None
+    heating_mode: int | None = None
+    hot_water_temperature: float | None = None
+    heating: bool = False
+    hot_water: bool = False
+
+    def parameter(self, field: str) -> str:
+        """Return the parameter name behind a circuit field (e.g. for writes)."""
+        return f"HK{self.circuit} {_CIRCUIT_FIELDS[field]}"
+
+    @property
+    def setpoint_field(self) -> str:
+        """Return the field the target temperature is read from/written to."""
+        return setpoint_field(self.heating_mode)
+
+
+def setpoint_field(heating_mode: int | None) -> str:
+    """Return the setpoint field of an operation mode.
+
+    In Absenk gilt die Absenk-, sonst die Normal-Raumtemperatur.
+    """
+    return "eco_temperature" if heating_mode == MODE_ABSENK else "comfort_temperature"
+
+
+def circuit_view_parameters(circuit: int) -> list[str]:
+    """Return the parameter names a circuit view is built from.
+
+    Raises ValueError if two fields would read the same telegram address.
+    """
+
+    names = [f"HK{circuit} {name}" for name in _CIRCUIT_FIELDS.values()] + list(_BOILER_FIELDS.values())
+    shared = shared_addresses(names)
+    if shared:
+        raise ValueError(f"Circuit view fields share a telegram address: {shared}")
+    return names
+
+
+def _number(value) -> float | int | None:
+    """Return numeric snapshot values; mapped texts count as missing."""
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def circuit_view(data: dict, circuit: int) -> CircuitView:
+    """Build the view of ``circuit`` from a snapshot."""
+
+    values = {field: _number(data.get(f"HK{circuit} {name}")) for field, name in _CIRCUIT_FIELDS.items()}
+    boiler = {field: data.get(name) for field, name in _BOILER_FIELDS.items()}
+
+    # Warmwassertemperatur am Heizkreis, sonst die des Kessels
+    if values["hot_water_temperature"] is None:
+        values["hot_water_temperature"] = _number(boiler["boiler_hot_water_temperature"])
+
+    return CircuitView(
+        circuit=circuit,
+        heating=bool(boiler["heating"]),
+        hot_water=bool(boiler["hot_water"]),
+        **values,
+    )
@@ -0,0 +1,194 @@
+"""Climate platform for Weishaupt WCM-COM heating circuits.
+
+Eine Climate-Entität pro Heizkreis, gespeist aus der vorberechneten Sicht
+des Heizkreises (siehe ``circuits``):
+- Ist-Temperatur: HKn Raumtemperatur
+- Soll-Temperatur: HKn User Normal/Absenk Raumtemperatur (je nach Betriebsart)
+- Betriebsart HK als Preset, zusammengefasst als HVAC-Modus
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.climate import (
+    ATTR_HVAC_MODE,
+    ClimateEntity,
+    ClimateEntityFeature,
+    HVACAction,
+    HVACMode,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .base_entity import WeishauptBaseEntity, register_entity_parameters
+from .circuits import (
+    HEATING_MANUAL_MODES,
+    HEATING_OFF_MODES,
+    MODE_NORMAL,
+    MODE_PROGRAM_1,
+    MODE_STANDBY,
+    CircuitView,
+    circuit_view_parameters,
+    setpoint_field,
+)
+from .const import DOMAIN, HK_USER_OPERATION_MODE_MAP
+from .coordinator import WeishauptCircuitCoordinator, WeishauptPollScheduler
+from .devices import WeishauptDevices
+from .entity_metadata import OptionMap
+
+_LOGGER = logging.getLogger(__name__)
+
+_HEATING_MODES = OptionMap(HK_USER_OPERATION_MODE_MAP)
+
+# Betriebsart, die beim Umschalten des HVAC-Modus geschrieben wird
+_HVAC_MODE_CODES = {
+    HVACMode.OFF: MODE_STANDBY,
+    HVACMode.HEAT: MODE_NORMAL,
+    HVACMode.AUTO: MODE_PROGRAM_1,
+}
+
+
+def _hvac_mode(code: int | None) -> HVACMode | None:
+    """Return the HVAC mode for an operation mode code."""
+    if code is None:
+        return None
+    if code in HEATING_OFF_MODES:
+        return HVACMode.OFF
+    if code in HEATING_MANUAL_MODES:
+        return HVACMode.HEAT
+    # Zeitprogramme und "Wie Leitstelle"
+    return HVACMode.AUTO
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up one climate entity per heating circuit."""
+
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    scheduler: WeishauptPollScheduler = entry_data["coordinator"]
+    devices: WeishauptDevices = entry_data["devices"]
+
+    entities = [
+        WeishauptCircuitClimate(scheduler, entry_data["api"], devices, coordinator)
+        for coordinator in scheduler.circuit_coordinators.values()
+    ]
+
+    register_entity_parameters(entry_data, entities)
+    async_add_entities(entities)
+
+
+class WeishauptCircuitClimate(CoordinatorEntity, WeishauptBaseEntity, ClimateEntity):
+    """Heating circuit as a climate entity."""
+
+    _attr_hvac_modes = list(_HVAC_MODE_CODES)
+    _attr_preset_modes = _HEATING_MODES.options
+    _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    # Grenzen wie bei den Number-Entitäten der User-Raumtemperaturen
+    _attr_min_temp = 10.0
+    _attr_max_temp = 35.0
+    _attr_target_temperature_step = 0.5
+    _attr_icon = "mdi:radiator"
+    _enable_turn_on_off_backwards_compatibility = False
+
+    def __init__(
+        self,
+        scheduler: WeishauptPollScheduler,
+        api,
+        devices: WeishauptDevices,
+        coordinator: WeishauptCircuitCoordinator,
+    ) -> None:
+        """Initialize the climate entity."""
+
+        CoordinatorEntity.__init__(self, coordinator)
+        WeishauptBaseEntity.__init__(self, api)
+        self._scheduler = scheduler
+
+        circuit = coordinator.circuit
+        self._attr_name = f"HK{circuit} Heizkreis"
+        self._attr_unique_id = f"weishaupt_hk{circuit}_climate"
+        self._attr_device_info = devices.device_info(f"HK{circuit} Heizkreis")
+
+    @property
+    def parameter_names(self) -> list[str]:
+        """Return the parameters the circuit view is built from."""
+        return circuit_view_parameters(self.coordinator.circuit)
+
+    @property
+    def _view(self) -> CircuitView:
+        """Return the current view of the heating circuit."""
+        return self.coordinator.data
+
+    @property
+    def available(self) -> bool:
+        """Return True once the operation mode is known."""
+        return super().available and self._view.heating_mode is not None
+
+    @property
+    def current_temperature(self) -> float | None:
+        """Return the room temperature of the circuit."""
+        return self._view.room_temperature
+
+    @property
+    def target_temperature(self) -> float | None:
+        """Return the room setpoint of the current operation mode."""
+        view = self._view
+        return getattr(view, view.setpoint_field)
+
+    @property
+    def hvac_mode(self) -> HVACMode | None:
+        """Return the HVAC mode derived from the operation mode."""
+        return _hvac_mode(self._view.heating_mode)
+
+    @property
+    def hvac_action(self) -> HVACAction | None:
+        """Return heating while the boiler heats and the circuit is on."""
+        view = self._view
+        if view.heating_mode is None:
+            return None
+        if view.heating_mode in HEATING_OFF_MODES:
+            return HVACAction.OFF
+        return HVACAction.HEATING if view.heating else HVACAction.IDLE
+
+    @property
+    def preset_mode(self) -> str | None:
+        """Return the operation mode of the circuit."""
+        return _HEATING_MODES.label(self._view.heating_mode)
+
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        """Write the room setpoint (and optionally the mode) in one request."""
+
+        view = self._view
+        values = {}
+        hvac_mode = kwargs.get(ATTR_HVAC_MODE)
+        if hvac_mode is not None and hvac_mode != self.hvac_mode:
+            values[view.parameter("heating_mode")] = _HVAC_MODE_CODES[hvac_mode]
+        temperature = kwargs.get(ATTR_TEMPERATURE)
+        if temperature is not None:
+            # Der Sollwert der neuen Betriebsart, falls sie mitgeschrieben wird
+            mode = values.get(view.parameter("heating_mode"), view.heating_mode)
+            values[view.parameter(setpoint_field(mode))] = temperature
+        if values:
+            await self._async_apply_settings(values)
+
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Switch the operation mode; keeps e.g. "Programm 2" while in AUTO."""
+        if hvac_mode == self.hvac_mode:
+            return
+        await self._async_apply_settings({self._view.parameter("heating_mode"): _HVAC_MODE_CODES[hvac_mode]})
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Write the selected operation mode."""
+        code = _HEATING_MODES.code(preset_mode)
+        if code is None:
+            _LOGGER.warning("Unknown preset '%s' for HK%s", preset_mode, self.coordinator.circuit)
+            return
+        await self._async_apply_settings({self._view.parameter("heating_mode"): code})
@@ -1,10 +1,15 @@
 """Config flow for Weishaupt WCM-COM integration."""
+import ipaddress
 import logging
+
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_SCAN_INTERVAL
+from homeassistant.components import network
 from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
 
 from .const import (
     DOMAIN,
@@ -13,49 +18,183 @@ from .const import (
     DEFAULT_ALLOW_WRITE,
     CONF_ADVANCED_LOGGING,
     DEFAULT_ADVANCED_LOGGING,
+    CONF_SLOW_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
+    CONF_VERSION_SCAN_INTERVAL,
+    DEFAULT_VERSION_SCAN_INTERVAL,
+    CONF_ACTIVE_SCAN_INTERVAL,
+    DEFAULT_ACTIVE_SCAN_INTERVAL,
+    CONF_HEARTBEAT_INTERVAL,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    CONF_POLL_BUDGET,
+    DEFAULT_POLL_BUDGET,
+    CONF_WRITE_SKIP_MAX_AGE,
+    DEFAULT_WRITE_SKIP_MAX_AGE,
+    CONF_WRITE_RATE,
+    DEFAULT_WRITE_RATE,
+    CONF_WRITE_BURST,
+    DEFAULT_WRITE_BURST,
+    CONF_WRITE_MIN_SPACING,
+    DEFAULT_WRITE_MIN_SPACING,
+    CONF_NETWORK,
+    CONF_HEATING_CIRCUITS,
+    DEFAULT_HEATING_CIRCUITS,
+    MAX_HEATING_CIRCUITS,
+    CONF_CASCADE_MEMBERS,
+    DEFAULT_CASCADE_MEMBERS,
+    EXPERT_BOILER_ADDRESS_MAP,
+)
+from .discovery import DiscoveredDevice, async_discover
+from .protocol import (
+    WeishauptAuthError,
+    WeishauptBusyError,
+    WeishauptConnectionError,
+    WeishauptError,
+    detect_heating_circuits,
 )
 from .weishaupt_api import WeishauptAPI
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def _device_label(device: DiscoveredDevice) -> str:
+    """Return the label of a discovered unit in the selection list."""
+    if device.auth_required:
+        return f"{device.host} (login required)"
+    if device.firmware:
+        return f"{device.host} (firmware {device.firmware})"
+    return device.host
+
+
 class WeishauptConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Weishaupt WCM-COM."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        # Ergebnis der Netzwerksuche (Host -> Gerät) und die dabei genutzten Zugangsdaten
+        self._discovered: dict[str, DiscoveredDevice] = {}
+        self._credentials: dict[str, str] = {}
+        # Beim Verbindungstest erkannte Heizkreise
+        self._circuits: list[int] = list(DEFAULT_HEATING_CIRCUITS)
+
     async def async_step_user(self, user_input=None):
-        """Handle the initial step."""
+        """Handle the initial step: search the network or enter the host."""
+        return self.async_show_menu(step_id="user", menu_options=["discovery", "manual"])
+
+    async def async_step_manual(self, user_input=None):
+        """Enter host and credentials by hand."""
         errors = {}
 
         if user_input is not None:
-            host = user_input[CONF_HOST]
-            username = user_input.get(CONF_USERNAME)
-            password = user_input.get(CONF_PASSWORD)
+            errors = await self._async_probe(user_input)
+            if not errors:
+                return self.async_create_entry(
+                    title="Weishaupt WCM-COM", data={**user_input, CONF_HEATING_CIRCUITS: self._circuits}
+                )
 
-            # Validierung der Verbindung
-            api = WeishauptAPI(host, username, password)
+        return self._show_manual_form(user_input or {}, errors)
+
+    async def async_step_discovery(self, user_input=None):
+        """Scan a network for WCM-COM units."""
+        errors = {}
+
+        if user_input is not None:
+            self._credentials = {
+                key: user_input[key] for key in (CONF_USERNAME, CONF_PASSWORD) if user_input.get(key)
+            }
             try:
-                # Da get_data eine blockierende Methode ist, führen wir sie im Executor aus
-                data = await self.hass.async_add_executor_job(api.get_data)
-                if not data:
-                    errors["base"] = "cannot_connect"
-                else:
-                    # Erfolgreiche Verbindung
-                    return self.async_create_entry(title="Weishaupt WCM-COM", data=user_input)
-            except Exception as e:
-                _LOGGER.error(f"Error connecting to Weishaupt WCM-COM: {e}")
-                errors["base"] = "cannot_connect"
+                devices = await async_discover(
+                    self.hass,
+                    user_input[CONF_NETWORK],
+                    self._credentials.get(CONF_USERNAME),
+                    self._credentials.get(CONF_PASSWORD),
+                )
+            except ValueError as err:
+                _LOGGER.debug("Invalid network for discovery: %s", err)
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                # Bereits eingerichtete Geräte nicht erneut anbieten
+                configured = {entry.data.get(CONF_HOST) for entry in self._async_current_entries()}
+                self._discovered = {device.host: device for device in devices if device.host not in configured}
+                if self._discovered:
+                    return await self.async_step_select()
+                errors["base"] = "no_devices_found"
 
+        network_default = user_input[CONF_NETWORK] if user_input else await self._async_default_network()
         data_schema = vol.Schema({
-            vol.Required(CONF_HOST): str,
+            vol.Required(CONF_NETWORK, default=network_default): str,
             vol.Optional(CONF_USERNAME): str,
             vol.Optional(CONF_PASSWORD): str,
         })
 
         return self.async_show_form(
-            step_id="user", data_schema=data_schema, errors=errors
+            step_id="discovery", data_schema=data_schema, errors=errors
         )
 
+    async def async_step_select(self, user_input=None):
+        """Pick one of the discovered units."""
+
+        if user_input is not None:
+            data = {CONF_HOST: user_input[CONF_HOST], **self._credentials}
+            errors = await self._async_probe(data)
+            if not errors:
+                return self.async_create_entry(
+                    title="Weishaupt WCM-COM", data={**data, CONF_HEATING_CIRCUITS: self._circuits}
+                )
+            # z.B. Login nötig: Host vorbelegt in der manuellen Eingabe anbieten
+            return self._show_manual_form(data, errors)
+
+        hosts = {host: _device_label(device) for host, device in self._discovered.items()}
+        return self.async_show_form(
+            step_id="select", data_schema=vol.Schema({vol.Required(CONF_HOST): vol.In(hosts)})
+        )
+
+    def _show_manual_form(self, defaults: dict, errors: dict):
+        """Show the host/credentials form, prefilled with ``defaults``."""
+
+        data_schema = vol.Schema({
+            vol.Required(CONF_HOST, default=defaults.get(CONF_HOST, vol.UNDEFINED)): str,
+            vol.Optional(CONF_USERNAME, description={"suggested_value": defaults.get(CONF_USERNAME)}): str,
+            vol.Optional(CONF_PASSWORD): str,
+        })
+
+        return self.async_show_form(
+            step_id="manual", data_schema=data_schema, errors=errors
+        )
+
+    async def _async_probe(self, data: dict) -> dict:
+        """Validate the connection with one small request; return form errors."""
+
+        host = data[CONF_HOST]
+        api = WeishauptAPI(host, data.get(CONF_USERNAME), data.get(CONF_PASSWORD))
+        try:
+            values = await self.hass.async_add_executor_job(api.probe)
+        except WeishauptAuthError:
+            return {"base": "invalid_auth"}
+        except WeishauptBusyError:
+            return {"base": "device_busy"}
+        except (WeishauptConnectionError, WeishauptError) as err:
+            _LOGGER.warning("Cannot connect to Weishaupt WCM-COM at %s: %s", host, err)
+            return {"base": "cannot_connect"}
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error probing Weishaupt WCM-COM at %s", host)
+            return {"base": "unknown"}
+
+        # Vorhandene Heizkreise aus dem HK-Typ ableiten; meldet der Regler
+        # keinen, bleibt es bei der Voreinstellung (HK1/HK2)
+        self._circuits = detect_heating_circuits(values) or list(DEFAULT_HEATING_CIRCUITS)
+        return {}
+
+    async def _async_default_network(self) -> str:
+        """Return the /24 network of Home Assistant's own address."""
+        try:
+            source_ip = await network.async_get_source_ip(self.hass)
+        except HomeAssistantError:
+            return "192.168.1.0/24"
+        return str(ipaddress.ip_network(f"{source_ip}/24", strict=False))
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -75,17 +214,58 @@ class WeishauptOptionsFlowHandler(config_entries.OptionsFlow):
         """Manage the Weishaupt options (reconfigure connection)."""
         if user_input is not None:
             # Beim Speichern: neuen Host/User/Passwort + Scan-Intervall übernehmen
+            user_input[CONF_HEATING_CIRCUITS] = sorted(int(circuit) for circuit in user_input[CONF_HEATING_CIRCUITS])
+            user_input[CONF_CASCADE_MEMBERS] = sorted(int(member) for member in user_input[CONF_CASCADE_MEMBERS])
             return self.async_create_entry(title="", data=user_input)
 
         # Aktuelle Werte aus Entry / Optionen als Default
-        host = self._config_entry.data.get(CONF_HOST, "")
-        username = self._config_entry.data.get(CONF_USERNAME, "")
-        password = self._config_entry.data.get(CONF_PASSWORD, "")
+        # Wie ``_connection``: in den Optionen geänderte Verbindungsdaten
+        # haben Vorrang vor denen aus dem Einrichten
+        host, username, password = (
+            self._config_entry.options.get(key, self._config_entry.data.get(key)) or ""
+            for key in (CONF_HOST, CONF_USERNAME, CONF_PASSWORD)
+        )
 
         scan_interval = self._config_entry.options.get(
             CONF_SCAN_INTERVAL,
             DEFAULT_SCAN_INTERVAL,
         )
+        active_scan_interval = self._config_entry.options.get(
+            CONF_ACTIVE_SCAN_INTERVAL,
+            DEFAULT_ACTIVE_SCAN_INTERVAL,
+        )
+        heartbeat_interval = self._config_entry.options.get(
+            CONF_HEARTBEAT_INTERVAL,
+            DEFAULT_HEARTBEAT_INTERVAL,
+        )
+        slow_scan_interval = self._config_entry.options.get(
+            CONF_SLOW_SCAN_INTERVAL,
+            DEFAULT_SLOW_SCAN_INTERVAL,
+        )
+        version_scan_interval = self._config_entry.options.get(
+            CONF_VERSION_SCAN_INTERVAL,
+            DEFAULT_VERSION_SCAN_INTERVAL,
+        )
+        poll_budget = self._config_entry.options.get(
+            CONF_POLL_BUDGET,
+            DEFAULT_POLL_BUDGET,
+        )
+        write_skip_max_age = self._config_entry.options.get(
+            CONF_WRITE_SKIP_MAX_AGE,
+            DEFAULT_WRITE_SKIP_MAX_AGE,
+        )
+        write_rate = self._config_entry.options.get(
+            CONF_WRITE_RATE,
+            DEFAULT_WRITE_RATE,
+        )
+        write_burst = self._config_entry.options.get(
+            CONF_WRITE_BURST,
+            DEFAULT_WRITE_BURST,
+        )
+        write_min_spacing = self._config_entry.options.get(
+            CONF_WRITE_MIN_SPACING,
+            DEFAULT_WRITE_MIN_SPACING,
+        )
         allow_write = self._config_entry.options.get(
             CONF_ALLOW_WRITE,
             DEFAULT_ALLOW_WRITE,
@@ -94,20 +274,77 @@ class WeishauptOptionsFlowHandler(config_entries.OptionsFlow):
             CONF_ADVANCED_LOGGING,
             DEFAULT_ADVANCED_LOGGING,
         )
+        heating_circuits = self._config_entry.options.get(
+            CONF_HEATING_CIRCUITS,
+            self._config_entry.data.get(CONF_HEATING_CIRCUITS, DEFAULT_HEATING_CIRCUITS),
+        )
+        circuit_options = {str(circuit): f"HK{circuit}" for circuit in range(1, MAX_HEATING_CIRCUITS + 1)}
+        cascade_members = self._config_entry.options.get(
+            CONF_CASCADE_MEMBERS,
+            DEFAULT_CASCADE_MEMBERS,
+        )
+        # Weitere Kessel der Kaskade (Kesseladresse A..E); Adresse 1 ist der Hauptkessel
+        cascade_options = {
+            str(code): f"Kessel {address}" for code, address in EXPERT_BOILER_ADDRESS_MAP.items() if code
+        }
 
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_HOST, default=host): str,
                 vol.Optional(CONF_USERNAME, default=username): str,
                 vol.Optional(CONF_PASSWORD, default=password): str,
+                vol.Required(
+                    CONF_HEATING_CIRCUITS,
+                    default=[str(circuit) for circuit in heating_circuits],
+                ): cv.multi_select(circuit_options),
+                vol.Required(
+                    CONF_CASCADE_MEMBERS,
+                    default=[str(member) for member in cascade_members],
+                ): cv.multi_select(cascade_options),
                 vol.Required(
                     CONF_SCAN_INTERVAL,
                     default=scan_interval,
                 ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                vol.Required(
+                    CONF_ACTIVE_SCAN_INTERVAL,
+                    default=active_scan_interval,
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                vol.Required(
+                    CONF_HEARTBEAT_INTERVAL,
+                    default=heartbeat_interval,
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=300)),
+                vol.Required(
+                    CONF_SLOW_SCAN_INTERVAL,
+                    default=slow_scan_interval,
+                ): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
+                vol.Required(
+                    CONF_VERSION_SCAN_INTERVAL,
+                    default=version_scan_interval,
+                ): vol.All(vol.Coerce(int), vol.Range(min=600, max=604800)),
+                vol.Required(
+                    CONF_POLL_BUDGET,
+                    default=poll_budget,
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
                 vol.Required(
                     CONF_ALLOW_WRITE,
                     default=allow_write,
                 ): bool,
+                vol.Required(
+                    CONF_WRITE_SKIP_MAX_AGE,
+                    default=write_skip_max_age,
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                vol.Required(
+                    CONF_WRITE_RATE,
+                    default=write_rate,
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=600)),
+                vol.Required(
+                    CONF_WRITE_BURST,
+                    default=write_burst,
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=200)),
+                vol.Required(
+                    CONF_WRITE_MIN_SPACING,
+                    default=write_min_spacing,
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
                 vol.Required(
                     CONF_ADVANCED_LOGGING,
                     default=advanced_logging,
@@ -1,10 +1,20 @@
 """Constants for the Weishaupt WCM-COM integration."""
 
-from homeassistant.const import CONF_SCAN_INTERVAL
-
 DOMAIN = 'weishaupt_wcm_com'
 NAME_PREFIX = "Weishaupt "
 
+# Heizkreise (Buskennung 1..MAX_HEATING_CIRCUITS). Neue Einträge übernehmen
+# die beim Einrichten erkannten Heizkreise, ältere Einträge HK1/HK2.
+CONF_HEATING_CIRCUITS = "heating_circuits"
+DEFAULT_HEATING_CIRCUITS = (1, 2)
+MAX_HEATING_CIRCUITS = 8
+
+# Kaskade: weitere Kessel hinter demselben WCM-COM, in den Optionen gewählt
+# über ihre Kesseladresse A..E (Code 1..5, siehe EXPERT_BOILER_ADDRESS_MAP).
+# Der Kessel mit Adresse 1 ist der bisherige Kessel (Bus 0).
+CONF_CASCADE_MEMBERS = "cascade_members"
+DEFAULT_CASCADE_MEMBERS = ()
+
 # Standard Scan Interval in Sekunden
 DEFAULT_SCAN_INTERVAL = 60
 
@@ -19,6 +29,107 @@ DEFAULT_ALLOW_WRITE = False
 CONF_ADVANCED_LOGGING = "advanced_logging"
 DEFAULT_ADVANCED_LOGGING = False
 
+# Abfrage-Stufen (Tiers) für selten veränderliche Parametergruppen in Sekunden.
+# Die schnelle Stufe läuft mit CONF_SCAN_INTERVAL.
+CONF_SLOW_SCAN_INTERVAL = "slow_scan_interval"
+DEFAULT_SLOW_SCAN_INTERVAL = 900
+
+CONF_VERSION_SCAN_INTERVAL = "version_scan_interval"
+DEFAULT_VERSION_SCAN_INTERVAL = 86400
+
+# Aktivitätsabhängiges Polling: solange Flamme/Heizung/Warmwasser aktiv sind,
+# wird mit dem kürzeren Intervall abgefragt.
+CONF_ACTIVE_SCAN_INTERVAL = "active_scan_interval"
+DEFAULT_ACTIVE_SCAN_INTERVAL = 15
+
+# Hysterese: so lange (Sekunden) nach der letzten Aktivität bleibt das
+# kurze Intervall aktiv, damit ein taktender Brenner nicht ständig umschaltet.
+ACTIVITY_HOLD_TIME = 180
+
+# Prozesswerte, die eine laufende Anforderung anzeigen
+ACTIVITY_KEYS = ("Flamme", "Heizung", "Warmwasser")
+
+# Heartbeat: kleiner Schnell-Request mit wenigen Statuswerten. Ein
+# vollständiger Refresh läuft nur bei einer Änderung oder wenn das normale
+# Intervall abgelaufen ist. 0 = deaktiviert.
+CONF_HEARTBEAT_INTERVAL = "heartbeat_interval"
+DEFAULT_HEARTBEAT_INTERVAL = 15
+HEARTBEAT_KEYS = ("Status", "Flamme", "Betriebsphase", "Pumpe")
+
+# Zeitbudget pro Abfragezyklus in Sekunden. Gruppen, die nicht mehr ins
+# Budget passen, werden im nächsten Zyklus (dann mit höherer Priorität) gelesen.
+CONF_POLL_BUDGET = "poll_budget"
+DEFAULT_POLL_BUDGET = 30
+
+# Schreibzugriffe mit dem bereits bekannten Gerätewert werden übersprungen,
+# solange dieser Wert höchstens so alt ist (Sekunden, 0 = immer schreiben)
+CONF_WRITE_SKIP_MAX_AGE = "write_skip_max_age"
+DEFAULT_WRITE_SKIP_MAX_AGE = 300
+
+# Schreib-Ratenbegrenzung pro Gerät (Token-Bucket): ``write_rate`` Writes
+# pro Minute bei maximal ``write_burst`` Writes am Stück, dazu ein
+# Mindestabstand in Sekunden zwischen zwei Writes desselben Parameters
+# (EEPROM-Schonung). 0 = keine Begrenzung.
+CONF_WRITE_RATE = "write_rate"
+DEFAULT_WRITE_RATE = 6
+CONF_WRITE_BURST = "write_burst"
+DEFAULT_WRITE_BURST = 20
+CONF_WRITE_MIN_SPACING = "write_min_spacing"
+DEFAULT_WRITE_MIN_SPACING = 5
+
+# Zeitfenster (Sekunden), in dem Schreibzugriffe gesammelt und als ein
+# gemeinsamer Request gesendet werden
+WRITE_BATCH_WINDOW = 0.2
+
+# Ruhezeit (Sekunden) nach der letzten Slider-Änderung, bevor ein
+# Number-Wert geschrieben wird; schützt das EEPROM vor Schreibstürmen
+NUMBER_WRITE_DEBOUNCE = 1.5
+
+# Parametergruppen – jede Gruppe wird in einem eigenen Request abgefragt
+GROUP_PROCESS = "process"        # globale Prozesswerte (Kessel)
+GROUP_HK_PROCESS = "hk_process"  # Heizkreis-Prozesswerte (HK1/HK2)
+GROUP_VERSIONS = "versions"      # FS/EM-Versionen (Rohwerte)
+GROUP_CONFIG = "config"          # Heizkreis-Konfiguration inkl. Urlaub
+GROUP_USER = "user"              # HK-Userparameter (Form_Heizung_Benutzer)
+GROUP_DATE = "date"              # Systemdatum/-zeit, Sommerzeit, Urlaubsniveau
+GROUP_EXPERT = "expert"          # Fachmann-/Expert-Parameter
+
+# Gruppen mit Einstellungen (EEPROM), die über Services geschrieben werden
+# dürfen; Prozesswerte und Versionen sind nur lesbar
+SETTING_GROUPS = (GROUP_CONFIG, GROUP_USER, GROUP_DATE, GROUP_EXPERT)
+
+# Netzwerksuche im Config Flow: parallele Verbindungsversuche, Timeouts
+# (Sekunden) und maximale Netzgröße (/22)
+CONF_NETWORK = "network"
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_CONNECT_TIMEOUT = 1.0
+DISCOVERY_PROBE_TIMEOUT = 3
+DISCOVERY_MAX_HOSTS = 1024
+
+# Persistenter Snapshot (HA Store) für einen schnellen Start
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+
+# Format-Version der Konfigurations-Backups (backup_configuration)
+BACKUP_VERSION = 1
+
+# Polling-Stufen
+POLL_TIER_FAST = "fast"
+POLL_TIER_SLOW = "slow"
+POLL_TIER_VERY_SLOW = "very_slow"
+
+# Zuordnung Gruppe -> Stufe. Konfig/User/Expert und Datum ändern sich nur,
+# wenn jemand am Kessel etwas einstellt; Versionen praktisch nie.
+GROUP_POLL_TIERS = {
+    GROUP_PROCESS: POLL_TIER_FAST,
+    GROUP_HK_PROCESS: POLL_TIER_FAST,
+    GROUP_VERSIONS: POLL_TIER_VERY_SLOW,
+    GROUP_CONFIG: POLL_TIER_SLOW,
+    GROUP_USER: POLL_TIER_SLOW,
+    GROUP_DATE: POLL_TIER_SLOW,
+    GROUP_EXPERT: POLL_TIER_SLOW,
+}
+
 
 # Sensor Keys
 OUTSIDE_TEMPERATURE_KEY = "Outside Temperature"
@@ -67,7 +178,7 @@ PARAMETERS = [
     {"id": 1,    "name": "Status",                    "type": "code"},
     {"id": 12,   "name": "Außentemperatur",           "type": "temperature"},
     {"id": 14,   "name": "Warmwassertemperatur",      "type": "temperature"},
-    # Raumtemperatur wird unten pro Heizkreis (HK1/HK2) erfasst
+    # Raumtemperatur wird pro Heizkreis erfasst (CIRCUIT_PARAMETER_TEMPLATES)
     {"id": 81,   "name": "Flamme",                    "type": "binary"},
     {"id": 82,   "name": "Heizung",                   "type": "binary"},
     {"id": 83,   "name": "Warmwasser",                "type": "binary"},
@@ -100,102 +211,13 @@ PARAMETERS = [
     {"id": 345,  "name": "Expert Max Power WW",            "type": "percent"},
     {"id": 384,  "name": "Expert Max Charge Time WW",      "type": "minutes"},
 
-    # Heizkreis-Konfiguration HK1/HK2
-    # Pumpen-/Spannungs- und Regelungsparameter (abgeleitet aus WTC WebApp Dumps)
-    {"id": 857,   "name": "HK1 Config Pump",              "type": "value", "bus": 1, "modultyp": 12},
-    {"id": 65019, "name": "HK1 Config Voltage",           "type": "value", "bus": 1, "modultyp": 12},
-    {"id": 16,    "name": "HK1 Config HK Type",           "type": "value", "bus": 1, "modultyp": 6},
-    {"id": 2419,  "name": "HK1 Config Regelvariante",     "type": "value", "bus": 1, "modultyp": 6},
-    {"id": 321,   "name": "HK1 Config Ext Room Sensor",   "type": "value", "bus": 1, "modultyp": 6},
-
-    {"id": 857,   "name": "HK2 Config Pump",              "type": "value", "bus": 2, "modultyp": 12},
-    {"id": 65019, "name": "HK2 Config Voltage",           "type": "value", "bus": 2, "modultyp": 12},
-    {"id": 16,    "name": "HK2 Config HK Type",           "type": "value", "bus": 2, "modultyp": 6},
-    {"id": 2419,  "name": "HK2 Config Regelvariante",     "type": "value", "bus": 2, "modultyp": 6},
-    {"id": 321,   "name": "HK2 Config Ext Room Sensor",   "type": "value", "bus": 2, "modultyp": 6},
-
-    # Benutzer-Betriebsarten HK/WW (Form_Heizung_Benutzer)
-    {"id": 274,  "name": "HK1 User Betriebsart HK", "type": "value", "bus": 1, "modultyp": 6},
-    {"id": 274,  "name": "HK1 User Betriebsart WW", "type": "value", "bus": 1, "modultyp": 6},
-    {"id": 274,  "name": "HK2 User Betriebsart HK", "type": "value", "bus": 2, "modultyp": 6},
-    {"id": 274,  "name": "HK2 User Betriebsart WW", "type": "value", "bus": 2, "modultyp": 6},
-
     # Rohwerte für Versionsanzeigen (werden intern zu Major.Minor kombiniert)
     # Kessel (Bus 0) – Rohwerte für FS-Version
     {"id": 409, "name": "Kessel Version FS High", "type": "value", "bus": 0, "modultyp": 6,  "internal": True},
     {"id": 410, "name": "Kessel Version FS Low",  "type": "value", "bus": 0, "modultyp": 6,  "internal": True},
-
-    # HK1/HK2 – Rohwerte für FS/EM-Versionen
-    {"id": 409, "name": "HK1 Version FS High", "type": "value", "bus": 1, "modultyp": 6,  "internal": True},
-    {"id": 410, "name": "HK1 Version FS Low",  "type": "value", "bus": 1, "modultyp": 6,  "internal": True},
-    {"id": 409, "name": "HK1 Version EM High", "type": "value", "bus": 1, "modultyp": 12, "internal": True},
-    {"id": 410, "name": "HK1 Version EM Low",  "type": "value", "bus": 1, "modultyp": 12, "internal": True},
-    {"id": 409, "name": "HK2 Version FS High", "type": "value", "bus": 2, "modultyp": 6,  "internal": True},
-    {"id": 410, "name": "HK2 Version FS Low",  "type": "value", "bus": 2, "modultyp": 6,  "internal": True},
-    {"id": 409, "name": "HK2 Version EM High", "type": "value", "bus": 2, "modultyp": 12, "internal": True},
-    {"id": 410, "name": "HK2 Version EM Low",  "type": "value", "bus": 2, "modultyp": 12, "internal": True},
-
-    # Virtuelle Parameter für Versionsanzeigen (werden aus den Rohwerten berechnet)
     {"id": 0, "name": "Kessel Config Version FS", "type": "value", "virtual": True},
-    {"id": 0, "name": "HK1 Config Version FS", "type": "value", "virtual": True},
-    {"id": 0, "name": "HK2 Config Version FS", "type": "value", "virtual": True},
-    {"id": 0, "name": "HK1 Config Version EM", "type": "value", "virtual": True},
-    {"id": 0, "name": "HK2 Config Version EM", "type": "value", "virtual": True},
-
-    # Heizkreis-Prozesswerte HK1/HK2 (Form_Heizkreis_Prozesswerte)
-    # HK1 (Buskennung 1)
-    {"id": 2586, "name": "HK1 Gemischte Außentemperatur", "type": "temperature", "bus": 1, "modultyp": 6},
-    {"id": 17,   "name": "HK1 Raumtemperatur",            "type": "temperature", "bus": 1, "modultyp": 6, "destination": 6},
-    {"id": 15,   "name": "HK1 Vorlauftemperatur",         "type": "temperature", "bus": 1, "modultyp": 12},
-    {"id": 14,   "name": "HK1 Warmwassertemperatur",      "type": "temperature", "bus": 1, "modultyp": 6},
-    {"id": 1257, "name": "HK1 Zirkulationstemperatur",    "type": "temperature", "bus": 1, "modultyp": 12},
-    {"id": 4,    "name": "HK1 Solltemperatur",            "type": "temperature", "bus": 1, "modultyp": 6},
-    {"id": 2,    "name": "HK1 Solltemperatur System",     "type": "temperature", "bus": 1, "modultyp": 6},
-    # HK2 (Buskennung 2)
-    {"id": 2586, "name": "HK2 Gemischte Außentemperatur", "type": "temperature", "bus": 2, "modultyp": 6},
-    {"id": 17,   "name": "HK2 Raumtemperatur",            "type": "temperature", "bus": 2, "modultyp": 6, "destination": 6},
-    {"id": 15,   "name": "HK2 Vorlauftemperatur",         "type": "temperature", "bus": 2, "modultyp": 12},
-    {"id": 14,   "name": "HK2 Warmwassertemperatur",      "type": "temperature", "bus": 2, "modultyp": 6},
-    {"id": 1257, "name": "HK2 Zirkulationstemperatur",    "type": "temperature", "bus": 2, "modultyp": 12},
-    {"id": 4,    "name": "HK2 Solltemperatur",            "type": "temperature", "bus": 2, "modultyp": 6},
-    {"id": 2,    "name": "HK2 Solltemperatur System",     "type": "temperature", "bus": 2, "modultyp": 6},
-    #{"id": 3793, "name": "Ölzähler", "type": "value"}
-
-    # HK1/HK2 Benutzerparameter Heizung (Form_Heizung_Benutzer)
-    # HK1 (Bus=1)
-    {"id": 5,    "name": "HK1 User Normal Raumtemperatur",  "type": "temperature", "bus": 1, "modultyp": 6},
-    {"id": 8,    "name": "HK1 User Absenk Raumtemperatur",  "type": "temperature", "bus": 1, "modultyp": 6},
-    {"id": 297,  "name": "HK1 User Normal VL Soll",         "type": "temperature", "bus": 1, "modultyp": 6},
-    {"id": 298,  "name": "HK1 User Absenk VL Soll",         "type": "temperature", "bus": 1, "modultyp": 6},
-    {"id": 270,  "name": "HK1 User Steilheit",              "type": "temperature", "bus": 1, "modultyp": 6},
-    {"id": 2580, "name": "HK1 User Raumfrosttemperatur",    "type": "temperature", "bus": 1, "modultyp": 6},
-    {"id": 278,  "name": "HK1 User SoWi Umschaltung",       "type": "temperature", "bus": 1, "modultyp": 6},
-    {"id": 129,  "name": "HK1 User Sollwert Solar",         "type": "temperature", "bus": 1, "modultyp": 6},
-    # HK2 (Bus=2)
-    {"id": 5,    "name": "HK2 User Normal Raumtemperatur",  "type": "temperature", "bus": 2, "modultyp": 6},
-    {"id": 8,    "name": "HK2 User Absenk Raumtemperatur",  "type": "temperature", "bus": 2, "modultyp": 6},
-    {"id": 297,  "name": "HK2 User Normal VL Soll",         "type": "temperature", "bus": 2, "modultyp": 6},
-    {"id": 298,  "name": "HK2 User Absenk VL Soll",         "type": "temperature", "bus": 2, "modultyp": 6},
-    {"id": 270,  "name": "HK2 User Steilheit",              "type": "temperature", "bus": 2, "modultyp": 6},
-    {"id": 2580, "name": "HK2 User Raumfrosttemperatur",    "type": "temperature", "bus": 2, "modultyp": 6},
-    {"id": 278,  "name": "HK2 User SoWi Umschaltung",       "type": "temperature", "bus": 2, "modultyp": 6},
-    {"id": 129,  "name": "HK2 User Sollwert Solar",         "type": "temperature", "bus": 2, "modultyp": 6},
-
-    # Fachmann / Heizung – Frostheizgrenze / Ein Opti MAX (bus-spezifisch)
-    {"id": 702,  "name": "HK1 Expert Frostheizgrenze",     "type": "temperature", "bus": 1, "modultyp": 6},
-    {"id": 272,  "name": "HK1 Expert Ein Opti MAX",        "type": "minutes",     "bus": 1, "modultyp": 6},
-    {"id": 702,  "name": "HK2 Expert Frostheizgrenze",     "type": "temperature", "bus": 2, "modultyp": 6},
-    {"id": 272,  "name": "HK2 Expert Ein Opti MAX",        "type": "minutes",     "bus": 2, "modultyp": 6},
-
-    # HK1 Holiday / Date / Time / DST (Form_Heizkreis_Datum)
-    {"id": 283,   "name": "HK1 Holiday Start Day",          "type": "value", "bus": 1, "modultyp": 6, "internal": True},
-    {"id": 284,   "name": "HK1 Holiday Start Month",        "type": "value", "bus": 1, "modultyp": 6, "internal": True},
-    {"id": 285,   "name": "HK1 Holiday Start Year",         "type": "value", "bus": 1, "modultyp": 6, "internal": True},
-    {"id": 286,   "name": "HK1 Holiday End Day",            "type": "value", "bus": 1, "modultyp": 6, "internal": True},
-    {"id": 287,   "name": "HK1 Holiday End Month",          "type": "value", "bus": 1, "modultyp": 6, "internal": True},
-    {"id": 288,   "name": "HK1 Holiday End Year",           "type": "value", "bus": 1, "modultyp": 6, "internal": True},
-    {"id": 317,   "name": "HK1 Holiday Temp Level",         "type": "value", "bus": 1, "modultyp": 6, "internal": True},
 
+    # Date / Time / DST (Form_Heizkreis_Datum, über Bus 1)
     {"id": 290,   "name": "System Date Day",                "type": "value", "bus": 1, "modultyp": 6, "internal": True},
     {"id": 291,   "name": "System Date Month",              "type": "value", "bus": 1, "modultyp": 6, "internal": True},
     {"id": 292,   "name": "System Date Year",               "type": "value", "bus": 1, "modultyp": 6, "internal": True},
@@ -207,28 +229,103 @@ PARAMETERS = [
     {"id": 64992, "name": "DST End Day",                    "type": "value", "bus": 1, "modultyp": 6, "internal": True},
     {"id": 64993, "name": "DST End Month",                  "type": "value", "bus": 1, "modultyp": 6, "internal": True},
 
-    # HK2 Holiday (mirror of HK1, bus=2)
-    {"id": 283,   "name": "HK2 Holiday Start Day",          "type": "value", "bus": 2, "modultyp": 6, "internal": True},
-    {"id": 284,   "name": "HK2 Holiday Start Month",        "type": "value", "bus": 2, "modultyp": 6, "internal": True},
-    {"id": 285,   "name": "HK2 Holiday Start Year",         "type": "value", "bus": 2, "modultyp": 6, "internal": True},
-    {"id": 286,   "name": "HK2 Holiday End Day",            "type": "value", "bus": 2, "modultyp": 6, "internal": True},
-    {"id": 287,   "name": "HK2 Holiday End Month",          "type": "value", "bus": 2, "modultyp": 6, "internal": True},
-    {"id": 288,   "name": "HK2 Holiday End Year",           "type": "value", "bus": 2, "modultyp": 6, "internal": True},
-    {"id": 317,   "name": "HK2 Holiday Temp Level",         "type": "value", "bus": 2, "modultyp": 6, "internal": True},
-
     # Virtuelle, aus den Rohwerten berechnete Text-Sensoren (1.2.6b4/b8)
     {"id": 0, "name": "System Date",                 "type": "value", "virtual": True},
     {"id": 0, "name": "System Time",                 "type": "value", "virtual": True},
-    {"id": 0, "name": "HK1 Holiday Start",          "type": "value", "virtual": True},
-    {"id": 0, "name": "HK1 Holiday End",            "type": "value", "virtual": True},
-    {"id": 0, "name": "HK1 Urlaubstemperaturniveau", "type": "value", "virtual": True},
-    {"id": 0, "name": "HK2 Holiday Start",          "type": "value", "virtual": True},
-    {"id": 0, "name": "HK2 Holiday End",            "type": "value", "virtual": True},
-    {"id": 0, "name": "HK2 Urlaubstemperaturniveau", "type": "value", "virtual": True},
     {"id": 0, "name": "DST Start",                  "type": "value", "virtual": True},
     {"id": 0, "name": "DST End",                    "type": "value", "virtual": True},
 ]
 
+# Heizkreis-Parameter als Vorlage: Name ohne "HKn "-Präfix, ohne Bus. Sie
+# werden für jeden Heizkreis (Buskennung 1..MAX_HEATING_CIRCUITS) in
+# PARAMETERS übernommen; abgefragt werden nur die eingerichteten Heizkreise.
+CIRCUIT_PARAMETER_TEMPLATES = [
+    # Heizkreis-Konfiguration
+    # Pumpen-/Spannungs- und Regelungsparameter (abgeleitet aus WTC WebApp Dumps)
+    {"id": 857,   "name": "Config Pump",              "type": "value", "modultyp": 12},
+    {"id": 65019, "name": "Config Voltage",           "type": "value", "modultyp": 12},
+    {"id": 16,    "name": "Config HK Type",           "type": "value", "modultyp": 6},
+    {"id": 2419,  "name": "Config Regelvariante",     "type": "value", "modultyp": 6},
+    {"id": 321,   "name": "Config Ext Room Sensor",   "type": "value", "modultyp": 6},
+
+    # Benutzer-Betriebsart HK (Form_Heizung_Benutzer). Die Betriebsart WW
+    # ist noch nicht im Katalog: unter derselben Adresse (274) liest und
+    # schreibt der Regler die Betriebsart HK. Erst mit der richtigen ID
+    # wieder aufnehmen.
+    {"id": 274,  "name": "User Betriebsart HK", "type": "value", "modultyp": 6},
+    #{"id": ???, "name": "User Betriebsart WW", "type": "value", "modultyp": 6},
+
+    # Rohwerte für FS/EM-Versionen
+    {"id": 409, "name": "Version FS High", "type": "value", "modultyp": 6,  "internal": True},
+    {"id": 410, "name": "Version FS Low",  "type": "value", "modultyp": 6,  "internal": True},
+    {"id": 409, "name": "Version EM High", "type": "value", "modultyp": 12, "internal": True},
+    {"id": 410, "name": "Version EM Low",  "type": "value", "modultyp": 12, "internal": True},
+    {"id": 0, "name": "Config Version FS", "type": "value", "virtual": True},
+    {"id": 0, "name": "Config Version EM", "type": "value", "virtual": True},
+
+    # Heizkreis-Prozesswerte (Form_Heizkreis_Prozesswerte)
+    {"id": 2586, "name": "Gemischte Außentemperatur", "type": "temperature", "modultyp": 6},
+    {"id": 17,   "name": "Raumtemperatur",            "type": "temperature", "modultyp": 6, "destination": 6},
+    {"id": 15,   "name": "Vorlauftemperatur",         "type": "temperature", "modultyp": 12},
+    {"id": 14,   "name": "Warmwassertemperatur",      "type": "temperature", "modultyp": 6},
+    {"id": 1257, "name": "Zirkulationstemperatur",    "type": "temperature", "modultyp": 12},
+    {"id": 4,    "name": "Solltemperatur",            "type": "temperature", "modultyp": 6},
+    {"id": 2,    "name": "Solltemperatur System",     "type": "temperature", "modultyp": 6},
+    #{"id": 3793, "name": "Ölzähler", "type": "value"}
+
+    # Benutzerparameter Heizung (Form_Heizung_Benutzer)
+    {"id": 5,    "name": "User Normal Raumtemperatur",  "type": "temperature", "modultyp": 6},
+    {"id": 8,    "name": "User Absenk Raumtemperatur",  "type": "temperature", "modultyp": 6},
+    {"id": 297,  "name": "User Normal VL Soll",         "type": "temperature", "modultyp": 6},
+    {"id": 298,  "name": "User Absenk VL Soll",         "type": "temperature", "modultyp": 6},
+    {"id": 270,  "name": "User Steilheit",              "type": "temperature", "modultyp": 6},
+    {"id": 2580, "name": "User Raumfrosttemperatur",    "type": "temperature", "modultyp": 6},
+    {"id": 278,  "name": "User SoWi Umschaltung",       "type": "temperature", "modultyp": 6},
+    {"id": 129,  "name": "User Sollwert Solar",         "type": "temperature", "modultyp": 6},
+
+    # Fachmann / Heizung – Frostheizgrenze / Ein Opti MAX (bus-spezifisch)
+    {"id": 702,  "name": "Expert Frostheizgrenze",     "type": "temperature", "modultyp": 6},
+    {"id": 272,  "name": "Expert Ein Opti MAX",        "type": "minutes",     "modultyp": 6},
+
+    # Urlaub (Form_Heizkreis_Datum)
+    {"id": 283,   "name": "Holiday Start Day",          "type": "value", "modultyp": 6, "internal": True},
+    {"id": 284,   "name": "Holiday Start Month",        "type": "value", "modultyp": 6, "internal": True},
+    {"id": 285,   "name": "Holiday Start Year",         "type": "value", "modultyp": 6, "internal": True},
+    {"id": 286,   "name": "Holiday End Day",            "type": "value", "modultyp": 6, "internal": True},
+    {"id": 287,   "name": "Holiday End Month",          "type": "value", "modultyp": 6, "internal": True},
+    {"id": 288,   "name": "Holiday End Year",           "type": "value", "modultyp": 6, "internal": True},
+    {"id": 317,   "name": "Holiday Temp Level",         "type": "value", "modultyp": 6, "internal": True},
+    {"id": 0, "name": "Holiday Start",          "type": "value", "virtual": True},
+    {"id": 0, "name": "Holiday End",            "type": "value", "virtual": True},
+    {"id": 0, "name": "Urlaubstemperaturniveau", "type": "value", "virtual": True},
+]
+
+PARAMETERS += [
+    {**template, "name": f"HK{circuit} {template['name']}", **({} if template.get("virtual") else {"bus": circuit})}
+    for circuit in range(1, MAX_HEATING_CIRCUITS + 1)
+    for template in CIRCUIT_PARAMETER_TEMPLATES
+]
+
+# Virtuelle Parameter und die Rohwerte, aus denen sie berechnet werden
+VIRTUAL_PARAMETER_SOURCES = {
+    "Kessel Config Version FS": ("Kessel Version FS High", "Kessel Version FS Low"),
+    "System Date": ("System Date Day", "System Date Month", "System Date Year"),
+    "System Time": ("System Time Hour", "System Time Minute"),
+    "DST Start": ("DST Start Day", "DST Start Month"),
+    "DST End": ("DST End Day", "DST End Month"),
+}
+# ... und je Heizkreis (ohne "HKn "-Präfix)
+CIRCUIT_VIRTUAL_PARAMETER_SOURCES = {
+    "Config Version FS": ("Version FS High", "Version FS Low"),
+    "Config Version EM": ("Version EM High", "Version EM Low"),
+    "Holiday Start": ("Holiday Start Day", "Holiday Start Month", "Holiday Start Year"),
+    "Holiday End": ("Holiday End Day", "Holiday End Month", "Holiday End Year"),
+    "Urlaubstemperaturniveau": ("Holiday Temp Level",),
+}
+for _circuit in range(1, MAX_HEATING_CIRCUITS + 1):
+    for _virtual, _sources in CIRCUIT_VIRTUAL_PARAMETER_SOURCES.items():
+        VIRTUAL_PARAMETER_SOURCES[f"HK{_circuit} {_virtual}"] = tuple(f"HK{_circuit} {source}" for source in _sources)
+
 # HK-Konfigurations-Mappings (Enums)
 HK_CONFIG_PUMP_MAP = {
     0: "Pumpe stufig",
@@ -291,6 +388,35 @@ EXPERT_BOILER_ADDRESS_MAP = {
     5: "E",
 }
 
+# Prozesswerte und Zähler, die jeder Kessel einer Kaskade selbst liefert.
+# Sie werden je Kaskaden-Kessel als "Kessel <Adresse> <Name>" übernommen und
+# über die Kesseladresse als Buskennung (Modultyp 10) abgefragt; Außen-,
+# Warmwasser- und Puffertemperaturen gelten für die ganze Anlage.
+CASCADE_MEMBER_PARAMETERS = (
+    "Status",
+    "Flamme",
+    "Heizung",
+    "Warmwasser",
+    "Kesseltemperatur",
+    "Betriebsphase",
+    "Pumpe",
+    "Wärmeanforderung",
+    "Vorlauftemperatur",
+    "Laststellung",
+    "Gasventil 1",
+    "Gasventil 2",
+    "Schaltspielzahl Brenner",
+    "Betriebsstunden Brenner",
+    "Zeit seit letzter Wartung",
+)
+
+PARAMETERS += [
+    {**param, "name": f"Kessel {EXPERT_BOILER_ADDRESS_MAP[member]} {param['name']}", "bus": member, "modultyp": 10}
+    for member in range(1, len(EXPERT_BOILER_ADDRESS_MAP))
+    for param in PARAMETERS
+    if param["name"] in CASCADE_MEMBER_PARAMETERS
+]
+
 HOLIDAY_TEMP_LEVEL_MAP = {
     0: "Frostschutz",
     1: "Absenktemperatur",
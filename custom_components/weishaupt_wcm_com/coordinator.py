@@ -0,0 +1,383 @@
+"""Coordinators for the Weishaupt WCM-COM integration.
+
+A scheduler coordinator drives the polling cadence and decides which
+parameter groups are due. Every group has its own coordinator, so the
+entities of a group update as soon as their block has arrived and a slow
+block does not hold back the others. All requests share the API lock, so
+the WCM-COM still only sees one request at a time.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import timedelta
+from time import perf_counter
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .circuits import CircuitView, circuit_view, circuit_view_parameters
+from .const import DEFAULT_POLL_BUDGET, DOMAIN, GROUP_POLL_TIERS, POLL_TIER_FAST
+from .instrumentation import UpdateStats
+from .polling import ActivityPollingPolicy
+from .protocol import PARAMETER_GROUPS, changed_settings, encode_setting, group_for_parameter
+from .weishaupt_api import WeishauptAPI
+from .writer import WeishauptWriteBatcher, WriteRateLimiter
+
+_LOGGER = logging.getLogger(__name__)
+
+# Kürzester Abstand zwischen zwei Scheduler-Takten in Sekunden
+_MIN_TICK = 5
+
+
+@callback
+def _async_timed_update_listeners(coordinator, update_listeners) -> None:
+    """Run ``update_listeners`` and record its duration if enabled."""
+
+    if not coordinator.stats.enabled:
+        update_listeners()
+        return
+    start = perf_counter()
+    update_listeners()
+    coordinator.stats.record_fanout(coordinator.name, perf_counter() - start)
+
+
+class WeishauptGroupCoordinator(DataUpdateCoordinator[dict]):
+    """Coordinator for a single parameter group.
+
+    Hat kein eigenes Intervall – der Scheduler stößt den Refresh an, sobald
+    die Gruppe fällig ist. ``data`` ist der gesamte Snapshot zum Zeitpunkt
+    des letzten Abrufs dieser Gruppe.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: WeishauptAPI, group: str, stats: UpdateStats) -> None:
+        """Initialize the group coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{group}",
+            update_interval=None,
+        )
+        self.api = api
+        self.group = group
+        self.stats = stats
+        # Vom Scheduler gesetztes Ende des Zeitbudgets (time.monotonic())
+        self.deadline: float | None = None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the entities (timed with advanced logging)."""
+        _async_timed_update_listeners(self, super().async_update_listeners)
+
+    async def _async_update_data(self) -> dict:
+        """Fetch this group's block from the WCM-COM."""
+
+        try:
+            ok = await self.hass.async_add_executor_job(self.api.update_group, self.group, self.deadline)
+        except Exception as err:  # pragma: no cover  # pylint: disable=broad-except
+            raise UpdateFailed(f"Error communicating with WCM-COM: {err}") from err
+
+        if not ok:
+            raise UpdateFailed(f"No valid '{self.group}' response from WCM-COM")
+        return self.api.data
+
+
+class WeishauptCircuitCoordinator(DataUpdateCoordinator[CircuitView]):
+    """Coordinator holding the precomputed view of one heating circuit.
+
+    Fragt selbst nichts ab: die Gruppen-Coordinators rufen
+    ``async_update_view`` auf, und die Entitäten werden nur benachrichtigt,
+    wenn sich die Sicht des Heizkreises tatsächlich geändert hat.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: WeishauptAPI, circuit: int, stats: UpdateStats) -> None:
+        """Initialize the circuit coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_hk{circuit}",
+            update_interval=None,
+        )
+        self.api = api
+        self.circuit = circuit
+        self.stats = stats
+        # Gruppen, aus denen die Sicht gebaut wird
+        self.groups = {group_for_parameter(name) for name in circuit_view_parameters(circuit)}
+        self.data = circuit_view(api.data, circuit)
+
+    @callback
+    def async_update_view(self) -> None:
+        """Recompute the view and notify the entities if it changed."""
+
+        view = circuit_view(self.api.data, self.circuit)
+        if view != self.data:
+            self.async_set_updated_data(view)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the entities (timed with advanced logging)."""
+        _async_timed_update_listeners(self, super().async_update_listeners)
+
+
+class WeishauptPollScheduler(DataUpdateCoordinator[dict]):
+    """Device scheduler: decides per tick which group coordinators refresh."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: WeishauptAPI,
+        scan_interval: int,
+        heartbeat_interval: int,
+        policy: ActivityPollingPolicy,
+        poll_budget: int = DEFAULT_POLL_BUDGET,
+        write_limiter: WriteRateLimiter | None = None,
+        allow_write: bool = False,
+        advanced_logging: bool = False,
+    ) -> None:
+        """Initialize the scheduler and one coordinator per parameter group."""
+
+        # Heartbeat nur nutzen, wenn er tatsächlich schneller als das
+        # normale Intervall ist.
+        if not heartbeat_interval or heartbeat_interval >= scan_interval:
+            heartbeat_interval = 0
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=heartbeat_interval or scan_interval),
+        )
+        self.api = api
+        self._heartbeat_interval = heartbeat_interval
+        self._last_heartbeat = 0.0
+        self._policy = policy
+        self._poll_budget = poll_budget
+        # Schreibfreigabe (Optionen); Entitäten und Services prüfen sie live
+        self.allow_write = allow_write
+        # Laufzeit der Entity-Updates (nur mit advanced logging)
+        self.stats = UpdateStats(advanced_logging)
+
+        # Die schnelle Stufe folgt dem normalen bzw. aktiven Intervall; der
+        # Scheduler tickt zum frühesten aus Heartbeat, diesem Intervall und
+        # der nächsten fälligen Gruppe (siehe _next_tick).
+        api.set_tier_intervals({POLL_TIER_FAST: scan_interval})
+
+        self.group_coordinators: dict[str, WeishauptGroupCoordinator] = {
+            group: WeishauptGroupCoordinator(hass, api, group, self.stats)
+            for group in PARAMETER_GROUPS
+        }
+        # Sichten je Heizkreis für Climate/Water Heater
+        self.circuit_coordinators: dict[int, WeishauptCircuitCoordinator] = {
+            circuit: WeishauptCircuitCoordinator(hass, api, circuit, self.stats)
+            for circuit in api.circuits
+        }
+
+        # Schreibzugriffe aus einem kurzen Zeitfenster gemeinsam senden
+        self.writer = WeishauptWriteBatcher(hass, api, self.notify_parameters, write_limiter)
+
+    def set_intervals(
+        self,
+        scan_interval: int,
+        active_scan_interval: int,
+        heartbeat_interval: int,
+        poll_budget: int,
+    ) -> None:
+        """Apply changed polling options to the running scheduler."""
+
+        if not heartbeat_interval or heartbeat_interval >= scan_interval:
+            heartbeat_interval = 0
+        self._heartbeat_interval = heartbeat_interval
+        self._poll_budget = poll_budget
+        self._policy.set_intervals(scan_interval, active_scan_interval)
+
+        interval = self._policy.interval
+        self.api.set_tier_intervals({POLL_TIER_FAST: int(interval.total_seconds())})
+        self.update_interval = self._next_tick(interval)
+
+    def _next_tick(self, interval: timedelta) -> timedelta:
+        """Return the time to the next tick.
+
+        Der nächste Takt kommt mit dem Heartbeat, dem (ggf. aktiven)
+        Intervall der schnellen Stufe oder der nächsten fälligen Gruppe –
+        je nachdem, was zuerst eintritt.
+        """
+
+        seconds = [interval.total_seconds()]
+        if self._heartbeat_interval:
+            seconds.append(self._heartbeat_interval)
+        next_due = self.api.next_due_in()
+        if next_due is not None:
+            seconds.append(next_due)
+        return timedelta(seconds=max(_MIN_TICK, min(seconds)))
+
+    def seed_data(self) -> None:
+        """Hand the (cached) API snapshot to all group coordinators.
+
+        Damit zeigen die Entitäten nach einem Neustart sofort die
+        gespeicherten Werte, bevor die erste Live-Abfrage fertig ist.
+        """
+        for coordinator in self.group_coordinators.values():
+            coordinator.data = self.api.data
+        for coordinator in self.circuit_coordinators.values():
+            coordinator.data = circuit_view(self.api.data, coordinator.circuit)
+
+    def coordinator_for(self, name: str) -> WeishauptGroupCoordinator:
+        """Return the group coordinator an entity for ``name`` subscribes to."""
+        return self.group_coordinators[group_for_parameter(name)]
+
+    async def async_write_parameter(self, parameter_id: int, bus: int, modultyp: int, code: int) -> bool:
+        """Write one parameter through the batching queue."""
+        return await self.writer.async_write(parameter_id, bus, modultyp, code)
+
+    async def async_write_parameters(self, writes) -> list[bool]:
+        """Write several (parameter_id, bus, modultyp, code) tuples in one request."""
+        return await self.writer.async_write_many(writes)
+
+    async def async_apply_settings(self, values: dict) -> dict:
+        """Write a set of parameter values, sending only what differs.
+
+        ``values`` maps parameter names to values in snapshot units (°C, %,
+        codes). Unveränderte Werte werden nicht gesendet; alle Änderungen
+        gehen in einem Request raus und werden gemeinsam nachgelesen.
+        Returns the changed, unchanged and failed parameters.
+        """
+
+        data = self.api.data
+        changed = self.changed_settings(values)
+        unchanged = [name for name in values if name not in changed]
+        changes = []
+        for name, value in changed.items():
+            changes.append((name, data.get(name), encode_setting(name, value)))
+
+        results = await self.async_write_parameters([write for _name, _current, write in changes]) if changes else []
+
+        data = self.api.data
+        return {
+            "changed": {
+                name: {"from": current, "to": data.get(name)}
+                for (name, current, _write), ok in zip(changes, results)
+                if ok
+            },
+            "unchanged": unchanged,
+            "failed": [name for (name, _current, _write), ok in zip(changes, results) if not ok],
+        }
+
+    def changed_settings(self, values: dict) -> dict:
+        """Return the entries of ``values`` that differ from the snapshot.
+
+        Siehe ``protocol.changed_settings``. Raises ValueError for unknown
+        or read-only parameters and for names that share a telegram address.
+        """
+        return changed_settings(self.api.data, values)
+
+    @callback
+    def async_check_write(self, parameter_id: int, bus: int, modultyp: int) -> None:
+        """Raise WriteRateLimitError if the parameter may not be written now."""
+        self.writer.limiter.async_check([(modultyp, bus, parameter_id)])
+
+    def notify_parameters(self, names) -> None:
+        """Push the current snapshot to the coordinators owning ``names``."""
+
+        groups = {group_for_parameter(name) for name in names}
+        for group in groups:
+            self.group_coordinators[group].async_set_updated_data(self.api.data)
+
+    async def async_refresh_parameters(self, names: list[str]) -> dict:
+        """Read only ``names`` from the WCM-COM and update their entities.
+
+        Läuft über denselben Lock wie die reguläre Abfrage, unterbricht also
+        keinen laufenden Zyklus.
+        """
+
+        values = await self.hass.async_add_executor_job(self.api.read_parameters, names)
+        self.notify_parameters(list(names) + list(values))
+        return values
+
+    async def async_read_telegrams(self, addresses) -> list[dict]:
+        """Read raw (modultyp, bus, id) addresses and update known entities."""
+
+        results = await self.hass.async_add_executor_job(self.api.read_telegrams, addresses)
+        names = [result["name"] for result in results if "name" in result]
+        if names:
+            self.notify_parameters(names)
+        return results
+
+    async def async_write_telegrams(self, writes) -> list[dict]:
+        """Write raw (modultyp, bus, id, code) telegrams through the write queue.
+
+        Es gelten dieselben Limits und dasselbe Nachlesen wie bei Entitäten;
+        ``read_back`` ist der danach gelesene Rohwert.
+        """
+
+        results = await self.async_write_parameters(
+            [(parameter_id, bus, modultyp, code) for modultyp, bus, parameter_id, code in writes]
+        )
+        return [
+            {
+                "modultyp": modultyp,
+                "bus": bus,
+                "id": parameter_id,
+                "written": code,
+                "ok": ok,
+                "read_back": self.api.raw_code(parameter_id, bus, modultyp),
+            }
+            for (modultyp, bus, parameter_id, code), ok in zip(writes, results)
+        ]
+
+    async def _async_update_data(self) -> dict:
+        """Run one scheduling tick."""
+
+        api = self.api
+
+        # Der Heartbeat entscheidet nur, ob die schnelle Stufe vorgezogen wird;
+        # ist sie ohnehin fällig (z.B. beim ersten Abruf), entfällt er. Da der
+        # Scheduler auch für andere Stufen tickt, läuft er höchstens im
+        # Heartbeat-Takt.
+        fast_due = any(GROUP_POLL_TIERS[group] == POLL_TIER_FAST for group in api.due_groups())
+        now = time.monotonic()
+        heartbeat_due = now - self._last_heartbeat >= self._heartbeat_interval - _MIN_TICK
+        if self._heartbeat_interval and not fast_due and heartbeat_due:
+            self._last_heartbeat = now
+            try:
+                changed = await self.hass.async_add_executor_job(api.heartbeat)
+            except Exception:  # pragma: no cover  # pylint: disable=broad-except
+                changed = True
+            if changed:
+                api.invalidate_tier(POLL_TIER_FAST)
+
+        # Fällige Gruppen nach Überfälligkeit abfragen; jede Gruppe meldet
+        # ihre Entitäten sofort, sobald ihr Block eingetroffen ist. Was nicht
+        # mehr ins Zeitbudget passt, bleibt fällig und rückt im nächsten
+        # Zyklus nach vorne. Mindestens eine Gruppe wird immer gelesen.
+        deadline = time.monotonic() + self._poll_budget
+        failed = []
+        due = api.due_groups()
+        for index, group in enumerate(due):
+            if index and time.monotonic() >= deadline:
+                _LOGGER.debug(
+                    "Poll budget of %ss exhausted, deferring groups %s",
+                    self._poll_budget,
+                    due[index:],
+                )
+                break
+            coordinator = self.group_coordinators[group]
+            coordinator.deadline = deadline
+            try:
+                await coordinator.async_refresh()
+            finally:
+                coordinator.deadline = None
+            if not coordinator.last_update_success:
+                failed.append(group)
+
+        if self.stats.enabled:
+            self.stats.end_cycle()
+
+        if failed and not api.data:
+            raise UpdateFailed(f"Error communicating with WCM-COM (failed groups: {', '.join(failed)})")
+
+        # Intervall für den nächsten Zyklus anhand des frischen Snapshots wählen
+        interval = self._policy.next_interval(api.data)
+        api.set_tier_intervals({POLL_TIER_FAST: int(interval.total_seconds())})
+        self.update_interval = self._next_tick(interval)
+        return api.data
@@ -0,0 +1,96 @@
+"""Shared device information for the Weishaupt WCM-COM integration.
+
+Jedes Gerät (Kessel, Kaskaden-Kessel, Heizkreise) hat genau ein DeviceInfo-Objekt, das alle
+Entitäten teilen. Die Firmwareversion wird nur neu gesetzt, wenn sie sich
+nach einem Abruf der Versionsgruppe tatsächlich geändert hat.
+"""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .const import DOMAIN
+from .entity_metadata import DEVICE_BOILER, device_key
+from .weishaupt_api import WeishauptAPI
+
+
+def _firmware_version(data: dict, key: str) -> str | None:
+    """Return the FS/EM version string of a device from the snapshot."""
+
+    if key == DEVICE_BOILER:
+        # Kessel (Bus 0): nur FS-Version, EM ist N/V
+        fs = data.get("Kessel Config Version FS")
+        return f"FS {fs}" if fs else None
+    if key.startswith(DEVICE_BOILER):
+        # Kaskaden-Kessel: Versionen werden (noch) nicht abgefragt
+        return None
+
+    prefix = key.upper()
+    fs = data.get(f"{prefix} Config Version FS")
+    em = data.get(f"{prefix} Config Version EM")
+    if fs and em:
+        return f"FS {fs}, EM {em}"
+    if fs:
+        return f"FS {fs}"
+    if em:
+        return f"EM {em}"
+    return None
+
+
+def _device_name(key: str) -> str:
+    """Return the device name shown in Home Assistant."""
+    if key == DEVICE_BOILER:
+        return "Weishaupt Kessel"
+    if key.startswith(DEVICE_BOILER):
+        # "kessel_a" -> "Weishaupt Kessel A"
+        return f"Weishaupt Kessel {key[len(DEVICE_BOILER) + 1:].upper()}"
+    return f"Weishaupt Heizkreis {key[2:]}"
+
+
+class WeishauptDevices:
+    """One shared DeviceInfo per device of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, api: WeishauptAPI) -> None:
+        """Initialize the device map."""
+        self.hass = hass
+        self.api = api
+        self._infos: dict[str, DeviceInfo] = {}
+        self._versions: dict[str, str | None] = {}
+
+    def device_info(self, name: str) -> DeviceInfo:
+        """Return the shared DeviceInfo of the device a parameter belongs to."""
+
+        key = device_key(name)
+        info = self._infos.get(key)
+        if info is None:
+            info = DeviceInfo(
+                identifiers={(DOMAIN, f"weishaupt_{key}")},
+                name=_device_name(key),
+                manufacturer="Weishaupt",
+                model="WCM-COM",
+            )
+            version = self._versions[key] = _firmware_version(self.api.data, key)
+            if version:
+                info["sw_version"] = version
+            self._infos[key] = info
+        return info
+
+    @callback
+    def async_update_versions(self) -> None:
+        """Push changed firmware versions to the DeviceInfo and the registry."""
+
+        data = self.api.data
+        registry = None
+        for key, info in self._infos.items():
+            version = _firmware_version(data, key)
+            if version is None or version == self._versions.get(key):
+                continue
+            self._versions[key] = version
+            info["sw_version"] = version
+
+            registry = registry or dr.async_get(self.hass)
+            device = registry.async_get_device(identifiers=info["identifiers"])
+            if device is not None:
+                registry.async_update_device(device.id, sw_version=version)
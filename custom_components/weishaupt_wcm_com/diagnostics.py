@@ -0,0 +1,41 @@
+"""Diagnostics support for the Weishaupt WCM-COM integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    api = entry_data["api"]
+    scheduler = entry_data["coordinator"]
+    limiter = scheduler.writer.limiter
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "writes": {
+            "skipped_unchanged": api.skipped_writes,
+            "skip_max_age": api.write_skip_max_age,
+            "rate_limited": limiter.rejected,
+            "rate_per_minute": limiter.rate,
+            "burst": limiter.burst,
+            "min_spacing": limiter.min_spacing,
+        },
+        # Laufzeit der Entity-Updates, nur mit advanced logging gefüllt
+        "entity_updates": scheduler.stats.as_dict(),
+        "data": api.data,
+    }
@@ -0,0 +1,139 @@
+"""LAN discovery of WCM-COM units (no Home Assistant dependency).
+
+Zweistufig, damit ein /24 in wenigen Sekunden durch ist: zuerst parallele
+TCP-Verbindungsversuche auf Port 80 (begrenzte Anzahl, kurzer Timeout),
+dann nur an die offenen Hosts ein einzelnes Lese-Telegramm mit der
+Kessel-Firmwareversion (ids 409/410) an ``/parameter.json``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import ipaddress
+import logging
+
+from .const import (
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_CONNECT_TIMEOUT,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_PROBE_TIMEOUT,
+    PARAMETERS,
+)
+from .protocol import (
+    WeishauptAuthError,
+    WeishauptError,
+    build_telegram,
+    compute_versions,
+    decode_telegram,
+    post_telegrams,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_PORT = 80
+
+# Kessel-Firmware (FS High/Low) – jeder WCM-COM beantwortet diese Adressen
+_VERSION_PARAMETERS = [p for p in PARAMETERS if p["name"] in ("Kessel Version FS High", "Kessel Version FS Low")]
+
+# Gleichzeitige Lese-Requests an offene Hosts (synchron, im Executor)
+_PROBE_CONCURRENCY = 8
+
+# Kennungen eines WCM-COM im Login-Realm bzw. Server-Header; ohne sie gilt
+# ein Host mit Login (Router, NAS, Drucker, ...) nicht als WCM-COM
+_AUTH_MARKERS = ("wcm", "weishaupt", "elster")
+
+
+@dataclass
+class DiscoveredDevice:
+    """A WCM-COM found on the network."""
+
+    host: str
+    firmware: str | None = None
+    auth_required: bool = False
+
+
+def discovery_hosts(network: str) -> list[str]:
+    """Return the host addresses of ``network`` (e.g. "192.168.1.0/24").
+
+    Raises ValueError for invalid or too large networks.
+    """
+
+    net = ipaddress.ip_network(network, strict=False)
+    if net.version != 4:
+        raise ValueError("Only IPv4 networks can be scanned")
+    if net.num_addresses > DISCOVERY_MAX_HOSTS:
+        raise ValueError(f"Network {net} has more than {DISCOVERY_MAX_HOSTS} addresses")
+    if net.num_addresses == 1:
+        return [str(net.network_address)]
+    return [str(host) for host in net.hosts()]
+
+
+async def _async_port_open(host: str, semaphore: asyncio.Semaphore, timeout: float) -> bool:
+    """Return True if ``host`` accepts TCP connections on port 80."""
+
+    async with semaphore:
+        try:
+            _reader, writer = await asyncio.wait_for(asyncio.open_connection(host, _PORT), timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            # z.B. Verbindung vom Gerät zurückgesetzt; der Port war offen
+            pass
+        return True
+
+
+def probe_device(host: str, username: str | None = None, password: str | None = None) -> DiscoveredDevice | None:
+    """Read the firmware version from ``host``; None if it is no WCM-COM."""
+
+    try:
+        messages = post_telegrams(
+            host, build_telegram(_VERSION_PARAMETERS)["telegramm"], username, password, DISCOVERY_PROBE_TIMEOUT
+        )
+    except WeishauptAuthError as err:
+        # Login eines WCM-COM: Version erst mit Zugangsdaten
+        if not any(marker in err.challenge.lower() for marker in _AUTH_MARKERS):
+            _LOGGER.debug("Discovery: %s asks for a login that is no WCM-COM's (%s)", host, err.challenge)
+            return None
+        return DiscoveredDevice(host, auth_required=True)
+    except WeishauptError as err:
+        _LOGGER.debug("Discovery: %s is no WCM-COM (%s)", host, err)
+        return None
+
+    values = dict(decoded for decoded in map(decode_telegram, messages) if decoded is not None)
+    if not values:
+        return None
+    compute_versions(values)
+    return DiscoveredDevice(host, firmware=values.get("Kessel Config Version FS"))
+
+
+async def async_discover(
+    hass,
+    network: str,
+    username: str | None = None,
+    password: str | None = None,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+    timeout: float = DISCOVERY_CONNECT_TIMEOUT,
+) -> list[DiscoveredDevice]:
+    """Scan ``network`` for WCM-COM units and return them ordered by address.
+
+    ``hass`` wird nur für den Executor der Lese-Requests gebraucht.
+    """
+
+    hosts = discovery_hosts(network)
+    semaphore = asyncio.Semaphore(concurrency)
+    open_ports = await asyncio.gather(*(_async_port_open(host, semaphore, timeout) for host in hosts))
+    candidates = [host for host, is_open in zip(hosts, open_ports) if is_open]
+    _LOGGER.debug("Discovery: %s of %s hosts in %s have port %s open", len(candidates), len(hosts), network, _PORT)
+
+    probe_semaphore = asyncio.Semaphore(_PROBE_CONCURRENCY)
+
+    async def _async_probe(host: str) -> DiscoveredDevice | None:
+        async with probe_semaphore:
+            return await hass.async_add_executor_job(probe_device, host, username, password)
+
+    devices = await asyncio.gather(*(_async_probe(host) for host in candidates))
+    return [device for device in devices if device is not None]
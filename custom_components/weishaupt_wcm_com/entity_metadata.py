@@ -0,0 +1,166 @@
+"""Lookup tables for entity metadata (icons, names, devices, options).
+
+Die Tabellen werden einmal beim Import aufgebaut; Entitäten holen sich ihre
+Metadaten per Dict-Lookup statt über lange Stringvergleichsketten.
+Heizkreis-Parameter stehen ohne "HKn "-Präfix in den Tabellen und gelten
+damit für jeden Heizkreis, Kessel-Parameter analog für jeden Kaskaden-Kessel.
+"""
+
+from __future__ import annotations
+
+from .const import EXPERT_BOILER_ADDRESS_MAP
+from .protocol import cascade_member_of, cascade_suffix, circuit_of, circuit_suffix
+
+# Gerätegruppen: Kessel (inkl. Fachmann-Werte), je ein Gerät pro
+# Kaskaden-Kessel ("kessel_a", ...) und pro Heizkreis
+DEVICE_BOILER = "kessel"
+
+
+def device_key(name: str) -> str:
+    """Return the device group ("kessel", "kessel_a", "hk1", ...) of a parameter."""
+    circuit = circuit_of(name)
+    if circuit is not None:
+        return f"hk{circuit}"
+    member = cascade_member_of(name)
+    if member is not None:
+        return f"{DEVICE_BOILER}_{EXPERT_BOILER_ADDRESS_MAP[member].lower()}"
+    return DEVICE_BOILER
+
+
+# Firmware-/Versionsanzeigen (Diagnose-Entities)
+_VERSION_SENSORS = {"Kessel Config Version FS", "Config Version FS", "Config Version EM"}
+
+SENSOR_ICONS = {
+    # Kessel-Prozesswerte: Icons, wo es eindeutig ist
+    "Status": "mdi:alert-circle-outline",
+    "Außentemperatur": "mdi:thermometer",
+    "Warmwassertemperatur": "mdi:thermometer-water",
+    "Flamme": "mdi:fire",
+    "Heizung": "mdi:radiator",
+    "Warmwasser": "mdi:water-thermometer",
+    "Kesseltemperatur": "mdi:thermometer",
+    "Betriebsphase": "mdi:cog-play",
+    "Puffer Oben": "mdi:thermometer-lines",
+    "Laststellung": "mdi:chart-line",
+    "Gedämpfte Außentemperatur": "mdi:thermometer",
+    "Schaltspielzahl Brenner": "mdi:counter",
+    "Betriebsstunden Brenner": "mdi:clock-time-eight-outline",
+    "Zeit seit letzter Wartung": "mdi:calendar-clock",
+    "Kessel Config Version FS": "mdi:chip",
+    # Systemzeit / Datum / DST (abgeleitete Textsensoren)
+    "System Date": "mdi:calendar-clock",
+    "System Time": "mdi:clock-time-four-outline",
+    "DST Start": "mdi:calendar-clock",
+    "DST End": "mdi:calendar-clock",
+}
+
+CIRCUIT_SENSOR_ICONS = {
+    "Config Version FS": "mdi:chip",
+    "Config Version EM": "mdi:chip",
+    # HK-Konfigurations-Sensoren
+    "Config Pump": "mdi:pump",
+    "Config Voltage": "mdi:flash-triangle-outline",
+    "Config HK Type": "mdi:radiator",
+    "Config Regelvariante": "mdi:chart-bell-curve",
+    "Config Ext Room Sensor": "mdi:home-thermometer-outline",
+    # Urlaub
+    "Holiday Start": "mdi:calendar-star",
+    "Holiday End": "mdi:calendar-star",
+    "Urlaubstemperaturniveau": "mdi:snowflake",
+    # HK-Prozesswerte
+    "Gemischte Außentemperatur": "mdi:thermometer",
+    "Raumtemperatur": "mdi:home-thermometer",
+    "Vorlauftemperatur": "mdi:thermometer",
+    "Warmwassertemperatur": "mdi:thermometer-water",
+    "Zirkulationstemperatur": "mdi:pipe",
+    "Solltemperatur": "mdi:thermostat",
+    "Solltemperatur System": "mdi:thermostat",
+}
+
+NUMBER_ICONS = {
+    # Allgemeine Expert-Parameter
+    "Expert Spec Level Heating Mode": "mdi:thermometer",
+    "Expert Corr Outside Sensor": "mdi:thermometer-minus",
+    "Expert Min VL Target": "mdi:thermometer",
+    "Expert Max VL Target": "mdi:thermometer",
+    "Expert Switch Diff VL": "mdi:thermometer-lines",
+    "Expert Burner Pulse Lock": "mdi:clock-outline",
+    "Expert Max Power Heating": "mdi:gauge",
+    "Expert Max Power WW": "mdi:gauge",
+    "Expert Max Charge Time WW": "mdi:clock-outline",
+    # Fachmann / Heizung (je Heizkreis)
+    "Expert Frostheizgrenze": "mdi:snowflake-thermometer",
+    "Expert Ein Opti MAX": "mdi:clock-outline",
+    # User Heizparameter (Form_Heizung_Benutzer)
+    "User Normal Raumtemperatur": "mdi:home-thermometer",
+    "User Absenk Raumtemperatur": "mdi:home-thermometer-outline",
+    "User Normal VL Soll": "mdi:thermostat",
+    # etwas abgesetzter Thermostat für den Absenk-Bereich
+    "User Absenk VL Soll": "mdi:thermostat-box-outline",
+    "User Steilheit": "mdi:chart-bell-curve",
+    "User Raumfrosttemperatur": "mdi:snowflake-thermometer",
+    "User SoWi Umschaltung": "mdi:weather-sunny-alert",
+    "User Sollwert Solar": "mdi:solar-power",
+}
+
+# Fallback: generisches Tuning-Icon für sonstige Slider
+DEFAULT_NUMBER_ICON = "mdi:tune-variant"
+
+
+def sensor_icon(name: str) -> str | None:
+    """Return the icon of a sensor (None = Home Assistant default)."""
+    if name in SENSOR_ICONS:
+        return SENSOR_ICONS[name]
+    if circuit_of(name) is not None:
+        return CIRCUIT_SENSOR_ICONS.get(circuit_suffix(name))
+    if cascade_member_of(name) is not None:
+        return SENSOR_ICONS.get(cascade_suffix(name))
+    return None
+
+
+def sensor_is_diagnostic(name: str) -> bool:
+    """Return True for expert values and firmware versions."""
+    return name.startswith("Expert ") or circuit_suffix(name) in _VERSION_SENSORS
+
+
+def number_icon(name: str) -> str:
+    """Return the icon of a number entity."""
+    return NUMBER_ICONS.get(circuit_suffix(name), DEFAULT_NUMBER_ICON)
+
+
+def option_label(text) -> str:
+    """Strip the left label part (before ":") from a mapped string.
+
+    z.B. "Externer Raumfühler: Witterungsführung" -> "Witterungsführung"
+    """
+    if not isinstance(text, str):
+        return str(text)
+    if ":" in text:
+        return text.split(":", 1)[1].strip()
+    return text
+
+
+class OptionMap:
+    """Code <-> option label map of a select entity, built once per value map."""
+
+    def __init__(self, value_map: dict[int, str]) -> None:
+        """Precompute labels and the reverse lookup."""
+        self.label_by_code = {code: option_label(text) for code, text in value_map.items()}
+        # Bei doppelten Labels gilt (wie bisher) der erste Code
+        self.code_by_label: dict[str, int] = {}
+        for code, label in self.label_by_code.items():
+            self.code_by_label.setdefault(label, code)
+        self.options = list(self.label_by_code.values())
+
+    def label(self, value) -> str | None:
+        """Return the option for a reported value (code or mapped text)."""
+        if isinstance(value, str):
+            label = option_label(value)
+            return label if label in self.code_by_label else None
+        if isinstance(value, int):
+            return self.label_by_code.get(value)
+        return None
+
+    def code(self, option: str) -> int | None:
+        """Return the raw code for an option label."""
+        return self.code_by_label.get(option)
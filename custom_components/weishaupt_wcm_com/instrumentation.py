@@ -0,0 +1,100 @@
+"""Optional timing of the Home Assistant side of each poll.
+
+Nur aktiv mit "advanced logging": misst die Zeit, die die Coordinators
+beim Benachrichtigen ihrer Entitäten verbrauchen, die Dauer jedes
+State-Writes pro Entität (inkl. ``native_value``/``current_option``) und
+zählt die State-Writes pro Abfragezyklus.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import logging
+from time import perf_counter
+
+_LOGGER = logging.getLogger(__name__)
+
+# Anzahl der Zyklen und Entitäten in der Diagnose
+STATS_CYCLES = 20
+STATS_SLOWEST_ENTITIES = 15
+
+
+class _EntityStats:
+    """Accumulated state write times of one entity."""
+
+    __slots__ = ("writes", "total", "max")
+
+    def __init__(self) -> None:
+        self.writes = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class UpdateStats:
+    """Counters for listener fan-out and entity state writes."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize empty statistics."""
+        self.enabled = enabled
+        self._entities: dict[str, _EntityStats] = {}
+        self._cycles: deque[dict] = deque(maxlen=STATS_CYCLES)
+        self._fanout: dict[str, float] = {}
+        self._writes = 0
+        self._write_time = 0.0
+        self._started = perf_counter()
+
+    def record_fanout(self, coordinator: str, seconds: float) -> None:
+        """Add the time a coordinator spent notifying its listeners."""
+        self._fanout[coordinator] = self._fanout.get(coordinator, 0.0) + seconds
+
+    def record_write(self, entity_id: str, seconds: float) -> None:
+        """Add one state write of an entity."""
+
+        stats = self._entities.get(entity_id)
+        if stats is None:
+            stats = self._entities[entity_id] = _EntityStats()
+        stats.writes += 1
+        stats.total += seconds
+        stats.max = max(stats.max, seconds)
+        self._writes += 1
+        self._write_time += seconds
+
+    def end_cycle(self) -> None:
+        """Close the current poll cycle and log its totals."""
+
+        cycle = {
+            "duration_ms": round((perf_counter() - self._started) * 1000, 1),
+            "state_writes": self._writes,
+            "state_write_ms": round(self._write_time * 1000, 2),
+            "fanout_ms": {name: round(seconds * 1000, 2) for name, seconds in self._fanout.items()},
+        }
+        self._cycles.append(cycle)
+        _LOGGER.debug(
+            "Poll cycle: %s state writes (%.2f ms), listener fan-out %s",
+            cycle["state_writes"],
+            cycle["state_write_ms"],
+            cycle["fanout_ms"],
+        )
+        self._fanout = {}
+        self._writes = 0
+        self._write_time = 0.0
+        self._started = perf_counter()
+
+    def as_dict(self) -> dict:
+        """Return the statistics for the diagnostics download."""
+
+        slowest = sorted(self._entities.items(), key=lambda item: item[1].total, reverse=True)
+        return {
+            "enabled": self.enabled,
+            "cycles": list(self._cycles),
+            "slowest_entities": [
+                {
+                    "entity_id": entity_id,
+                    "state_writes": stats.writes,
+                    "avg_ms": round(stats.total / stats.writes * 1000, 3),
+                    "max_ms": round(stats.max * 1000, 3),
+                    "total_ms": round(stats.total * 1000, 2),
+                }
+                for entity_id, stats in slowest[:STATS_SLOWEST_ENTITIES]
+            ],
+        }
@@ -0,0 +1,618 @@
+"""Home Assistant setup of the Weishaupt WCM-COM integration.
+
+Uses a scheduler coordinator with one DataUpdateCoordinator per parameter
+group; all requests to the WCM-COM device are serialized. Wird erst beim
+Einrichten eines Eintrags geladen (siehe ``__init__``).
+"""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_ENTITY_ID, CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+import voluptuous as vol
+
+from .const import (
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    CONF_ALLOW_WRITE,
+    DEFAULT_ALLOW_WRITE,
+    CONF_ADVANCED_LOGGING,
+    DEFAULT_ADVANCED_LOGGING,
+    CONF_SLOW_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
+    CONF_VERSION_SCAN_INTERVAL,
+    DEFAULT_VERSION_SCAN_INTERVAL,
+    POLL_TIER_SLOW,
+    POLL_TIER_VERY_SLOW,
+    CONF_ACTIVE_SCAN_INTERVAL,
+    DEFAULT_ACTIVE_SCAN_INTERVAL,
+    CONF_HEARTBEAT_INTERVAL,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    CONF_POLL_BUDGET,
+    DEFAULT_POLL_BUDGET,
+    CONF_WRITE_SKIP_MAX_AGE,
+    DEFAULT_WRITE_SKIP_MAX_AGE,
+    CONF_WRITE_RATE,
+    DEFAULT_WRITE_RATE,
+    CONF_WRITE_BURST,
+    DEFAULT_WRITE_BURST,
+    CONF_WRITE_MIN_SPACING,
+    DEFAULT_WRITE_MIN_SPACING,
+    CONF_HEATING_CIRCUITS,
+    DEFAULT_HEATING_CIRCUITS,
+    CONF_CASCADE_MEMBERS,
+    DEFAULT_CASCADE_MEMBERS,
+    GROUP_VERSIONS,
+)
+from .backup import async_backup_configuration, async_restore_configuration, default_backup_filename
+from .coordinator import WeishauptPollScheduler
+from .devices import WeishauptDevices
+from .polling import ActivityPollingPolicy
+from .snapshot_store import WeishauptSnapshotStore
+from .writer import WriteRateLimiter
+from .weishaupt_api import WeishauptAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+PLATFORMS: list[str] = ["sensor", "select", "number", "climate", "water_heater"]
+
+ATTR_PARAMETERS = "parameters"
+
+ATTR_VALUES = "values"
+
+SERVICE_APPLY_PROFILE = "apply_profile"
+APPLY_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_VALUES): vol.All(
+            {cv.string: vol.Any(bool, vol.Coerce(float))},
+            vol.Length(min=1),
+        ),
+    }
+)
+
+ATTR_FILENAME = "filename"
+
+# Backups liegen direkt im HA-Konfigurationsverzeichnis, keine Pfade
+_BACKUP_FILENAME = vol.Match(r"^[\w.-]+\.json$", msg="filename must be a plain *.json file name")
+
+SERVICE_BACKUP_CONFIGURATION = "backup_configuration"
+BACKUP_CONFIGURATION_SCHEMA = vol.Schema({vol.Optional(ATTR_FILENAME): _BACKUP_FILENAME})
+
+SERVICE_RESTORE_CONFIGURATION = "restore_configuration"
+RESTORE_CONFIGURATION_SCHEMA = vol.Schema({vol.Required(ATTR_FILENAME): _BACKUP_FILENAME})
+
+ATTR_TELEGRAMS = "telegrams"
+
+_BYTE = vol.All(vol.Coerce(int), vol.Range(min=0, max=255))
+_INFONR = vol.All(vol.Coerce(int), vol.Range(min=0, max=65535))
+# Rohwert wie im Telegramm (0..65535), negative Werte als Zweierkomplement
+_RAW_CODE = vol.All(vol.Coerce(int), vol.Range(min=-32768, max=65535), lambda code: code & 0xFFFF)
+
+SERVICE_READ_TELEGRAMS = "read_telegrams"
+READ_TELEGRAMS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_TELEGRAMS): vol.All(
+            [vol.ExactSequence([_BYTE, _BYTE, _INFONR])],
+            vol.Length(min=1),
+        ),
+    }
+)
+
+SERVICE_WRITE_TELEGRAMS = "write_telegrams"
+WRITE_TELEGRAMS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_TELEGRAMS): vol.All(
+            [vol.ExactSequence([_BYTE, _BYTE, _INFONR, _RAW_CODE])],
+            vol.Length(min=1),
+        ),
+    }
+)
+
+SERVICE_REFRESH_PARAMETERS = "refresh_parameters"
+REFRESH_PARAMETERS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID, default=[]): cv.entity_ids,
+        vol.Optional(ATTR_PARAMETERS, default=[]): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Weishaupt WCM-COM from a config entry."""
+
+    host, username, password = _connection(entry)
+
+    # Read scan interval, write flag and advanced logging from options (or use defaults)
+    scan_interval: int = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    allow_write: bool = entry.options.get(CONF_ALLOW_WRITE, DEFAULT_ALLOW_WRITE)
+    advanced_logging: bool = entry.options.get(CONF_ADVANCED_LOGGING, DEFAULT_ADVANCED_LOGGING)
+
+    # Selten veränderliche Gruppen (Konfig/User/Expert/Datum, Versionen) in
+    # eigenen, langsameren Stufen abfragen; Prozesswerte laufen im scan_interval.
+    tier_intervals = {
+        POLL_TIER_SLOW: entry.options.get(CONF_SLOW_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL),
+        POLL_TIER_VERY_SLOW: entry.options.get(CONF_VERSION_SCAN_INTERVAL, DEFAULT_VERSION_SCAN_INTERVAL),
+    }
+
+    api = WeishauptAPI(
+        host,
+        username,
+        password,
+        advanced_logging=advanced_logging,
+        tier_intervals=tier_intervals,
+        write_skip_max_age=entry.options.get(CONF_WRITE_SKIP_MAX_AGE, DEFAULT_WRITE_SKIP_MAX_AGE),
+        circuits=_heating_circuits(entry),
+        cascade_members=_cascade_members(entry),
+    )
+
+    # Während eines Brennerzyklus schneller abfragen (aktives Intervall),
+    # sonst im normalen scan_interval.
+    policy = ActivityPollingPolicy(
+        idle_interval=scan_interval,
+        active_interval=entry.options.get(CONF_ACTIVE_SCAN_INTERVAL, DEFAULT_ACTIVE_SCAN_INTERVAL),
+    )
+
+    heartbeat_interval: int = entry.options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL)
+
+    # Scheduler mit einem Coordinator pro Parametergruppe
+    coordinator = WeishauptPollScheduler(
+        hass,
+        api,
+        scan_interval=scan_interval,
+        heartbeat_interval=heartbeat_interval,
+        policy=policy,
+        poll_budget=entry.options.get(CONF_POLL_BUDGET, DEFAULT_POLL_BUDGET),
+        # Schutz des Reglers vor zu vielen Schreibzugriffen
+        allow_write=allow_write,
+        advanced_logging=advanced_logging,
+        write_limiter=WriteRateLimiter(
+            rate=entry.options.get(CONF_WRITE_RATE, DEFAULT_WRITE_RATE),
+            burst=entry.options.get(CONF_WRITE_BURST, DEFAULT_WRITE_BURST),
+            min_spacing=entry.options.get(CONF_WRITE_MIN_SPACING, DEFAULT_WRITE_MIN_SPACING),
+        ),
+    )
+
+    # Letzten Snapshot laden: mit Cache entstehen die Entitäten sofort und
+    # die erste Live-Abfrage läuft im Hintergrund. Ohne Cache (Erstinstallation)
+    # wie bisher vor dem Anlegen der Entitäten abfragen.
+    store = WeishauptSnapshotStore(hass, entry.entry_id, api)
+    cached = await store.async_load()
+    if cached:
+        coordinator.seed_data()
+    else:
+        await coordinator.async_config_entry_first_refresh()
+
+    # Die Entitäten hören auf die Gruppen-Coordinators; der Scheduler selbst
+    # braucht einen Listener, damit DataUpdateCoordinator ihn weiter taktet.
+    entry.async_on_unload(coordinator.async_add_listener(lambda: None))
+
+    # Jede Aktualisierung einer Gruppe speichert den Snapshot (verzögert)
+    for group_coordinator in coordinator.group_coordinators.values():
+        entry.async_on_unload(group_coordinator.async_add_listener(store.async_schedule_save))
+
+    # Ein DeviceInfo pro Gerät; Firmware nur nach einem Versionsabruf prüfen
+    devices = WeishauptDevices(hass, api)
+    entry.async_on_unload(
+        coordinator.group_coordinators[GROUP_VERSIONS].async_add_listener(devices.async_update_versions)
+    )
+
+    # Heizkreis-Sichten (Climate/Water Heater) hören nur auf ihre Gruppen
+    # und melden sich nur, wenn sich ein Wert der Sicht geändert hat.
+    for circuit_coordinator in coordinator.circuit_coordinators.values():
+        circuit_coordinator.async_update_view()
+        for group in circuit_coordinator.groups:
+            entry.async_on_unload(
+                coordinator.group_coordinators[group].async_add_listener(circuit_coordinator.async_update_view)
+            )
+
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][entry.entry_id] = {
+        "api": api,
+        "coordinator": coordinator,
+        "coordinators": coordinator.group_coordinators,
+        "store": store,
+        "devices": devices,
+        "advanced_logging": advanced_logging,
+        "connection": (host, username, password),
+    }
+
+    # Register services only once per integration domain
+    if not hass.services.has_service(DOMAIN, "set_holiday_date"):
+        _register_services(hass)
+
+    entry.async_on_unload(coordinator.writer.async_cancel)
+    entry.async_on_unload(entry.add_update_listener(update_listener))
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    if cached:
+        first_refresh = hass.async_create_background_task(
+            coordinator.async_refresh(), f"{DOMAIN} first refresh {entry.entry_id}"
+        )
+        entry.async_on_unload(first_refresh.cancel)
+
+    return True
+
+
+def _register_services(hass: HomeAssistant) -> None:
+    """Register integration-level services (called once)."""
+
+    async def async_set_holiday_date(call: ServiceCall) -> None:
+        """Set the holiday start/end date of a heating circuit via raw Day/Month/Year parameters.
+
+        Fields are mapped as:
+        - HKx Holiday Start: IDs 283/284/285 (Day/Month/Year)
+        - HKx Holiday End:   IDs 286/287/288 (Day/Month/Year)
+
+        Year is encoded as (calendar year - 2000).
+        A null/empty date resets Year to 0 and Day/Month to 1 ("not set").
+        """
+
+        heating_circuit = int(call.data.get("heating_circuit", 1))
+        target = str(call.data.get("target", "start")).lower()
+        date_str = call.data.get("date")
+
+        if target not in ("start", "end"):
+            _LOGGER.error("set_holiday_date: invalid target=%s", target)
+            return
+
+        # Determine parameter IDs for the selected HK/target
+        if target == "start":
+            base_id = 283
+        else:
+            base_id = 286
+
+        day_id = base_id
+        month_id = base_id + 1
+        year_id = base_id + 2
+
+        bus = heating_circuit
+        modultyp = 6
+
+        # Lookup a coordinating API instance (any entry for this domain)
+        domain_data = hass.data.get(DOMAIN, {})
+        if not domain_data:
+            _LOGGER.error("set_holiday_date: no %s data found in hass.data", DOMAIN)
+            return
+
+        # Use the first config entry's scheduler/coordinator
+        entry_data = next(iter(domain_data.values()))
+        scheduler: WeishauptPollScheduler = entry_data["coordinator"]
+        if heating_circuit not in scheduler.api.circuits:
+            _LOGGER.error("set_holiday_date: invalid heating_circuit=%s", heating_circuit)
+            return
+
+        # Parse date / reset logic
+        if not date_str:
+            # Reset: Year=0, Day=1, Month=1 (WebUI semantics for "not set")
+            day = 1
+            month = 1
+            year_raw = 0
+        else:
+            from datetime import datetime
+
+            try:
+                dt = datetime.strptime(date_str, "%Y-%m-%d")
+            except (ValueError, TypeError):
+                _LOGGER.error("set_holiday_date: invalid date '%s' (expected YYYY-MM-DD)", date_str)
+                return
+
+            day = dt.day
+            month = dt.month
+            year_raw = dt.year - 2000
+            if year_raw < 0 or year_raw > 99:
+                _LOGGER.error("set_holiday_date: year %s out of encodable range (2000-2099)", dt.year)
+                return
+
+        _LOGGER.debug(
+            "set_holiday_date: HK%s %s -> %s (Day=%s, Month=%s, YearRaw=%s)",
+            heating_circuit,
+            target,
+            date_str or "<not set>",
+            day,
+            month,
+            year_raw,
+        )
+
+        # Day, month and year go out together as one multi-telegram request
+        results = await scheduler.async_write_parameters(
+            [
+                (day_id, bus, modultyp, day),
+                (month_id, bus, modultyp, month),
+                (year_id, bus, modultyp, year_raw),
+            ]
+        )
+        if not all(results):
+            _LOGGER.warning("set_holiday_date: WCM-COM did not confirm all writes (%s)", results)
+
+    hass.services.async_register(DOMAIN, "set_holiday_date", async_set_holiday_date)
+
+    async def async_refresh_parameters(call: ServiceCall) -> ServiceResponse:
+        """Read only the given entities/parameters from the WCM-COM.
+
+        Statt alle Blöcke neu zu lesen, wird ein einzelner kleiner Request
+        für genau diese Parameter gestellt und in den Snapshot übernommen.
+        """
+
+        domain_data = hass.data.get(DOMAIN, {})
+        if not domain_data:
+            raise HomeAssistantError(f"No {DOMAIN} config entry loaded")
+
+        # Parameter pro Config-Entry sammeln
+        requested: dict[str, list[str]] = {}
+        registry = er.async_get(hass)
+        for entity_id in call.data[ATTR_ENTITY_ID]:
+            reg_entry = registry.async_get(entity_id)
+            entry_data = domain_data.get(reg_entry.config_entry_id) if reg_entry else None
+            names = entry_data.get("entity_parameters", {}).get(reg_entry.unique_id) if entry_data else None
+            if names is None:
+                raise HomeAssistantError(f"{entity_id} is not a {DOMAIN} entity")
+            requested.setdefault(reg_entry.config_entry_id, []).extend(names)
+
+        if call.data[ATTR_PARAMETERS]:
+            # Parameternamen gelten wie bei set_holiday_date für den ersten Eintrag
+            requested.setdefault(next(iter(domain_data)), []).extend(call.data[ATTR_PARAMETERS])
+
+        if not requested:
+            raise HomeAssistantError("Specify at least one entity_id or parameter")
+
+        values: dict = {}
+        for entry_id, names in requested.items():
+            scheduler: WeishauptPollScheduler = domain_data[entry_id]["coordinator"]
+            try:
+                values.update(await scheduler.async_refresh_parameters(names))
+            except ValueError as err:
+                raise HomeAssistantError(str(err)) from err
+            except Exception as err:  # pylint: disable=broad-except
+                raise HomeAssistantError(f"Error communicating with WCM-COM: {err}") from err
+
+        return {"values": values}
+
+    async def async_apply_profile(call: ServiceCall) -> ServiceResponse:
+        """Apply a set of parameter values (e.g. summer/winter/absence).
+
+        Nur geänderte Werte werden geschrieben – gemeinsam in einem Request
+        mit einem einzigen Nachlesen.
+        """
+
+        domain_data = hass.data.get(DOMAIN, {})
+        if not domain_data:
+            raise HomeAssistantError(f"No {DOMAIN} config entry loaded")
+
+        # Wie set_holiday_date: erster Config-Entry
+        entry_data = next(iter(domain_data.values()))
+        if not entry_data["coordinator"].allow_write:
+            raise HomeAssistantError("Weishaupt WCM-COM integration is in read-only mode.")
+
+        scheduler: WeishauptPollScheduler = entry_data["coordinator"]
+        try:
+            result = await scheduler.async_apply_settings(call.data[ATTR_VALUES])
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+
+        if result["failed"]:
+            _LOGGER.warning("apply_profile: WCM-COM did not confirm %s", result["failed"])
+        return result
+
+    async def async_backup(call: ServiceCall) -> ServiceResponse:
+        """Save all settings of the first config entry to a JSON file."""
+
+        domain_data = hass.data.get(DOMAIN, {})
+        if not domain_data:
+            raise HomeAssistantError(f"No {DOMAIN} config entry loaded")
+
+        scheduler: WeishauptPollScheduler = next(iter(domain_data.values()))["coordinator"]
+        filename = call.data.get(ATTR_FILENAME) or default_backup_filename()
+        try:
+            return await async_backup_configuration(hass, scheduler, filename)
+        except HomeAssistantError:
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            raise HomeAssistantError(f"Backup failed: {err}") from err
+
+    async def async_restore(call: ServiceCall) -> ServiceResponse:
+        """Write back the settings from a backup file that differ from the device."""
+
+        domain_data = hass.data.get(DOMAIN, {})
+        if not domain_data:
+            raise HomeAssistantError(f"No {DOMAIN} config entry loaded")
+
+        entry_data = next(iter(domain_data.values()))
+        if not entry_data["coordinator"].allow_write:
+            raise HomeAssistantError("Weishaupt WCM-COM integration is in read-only mode.")
+
+        scheduler: WeishauptPollScheduler = entry_data["coordinator"]
+        try:
+            result = await async_restore_configuration(hass, scheduler, call.data[ATTR_FILENAME])
+        except HomeAssistantError:
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            raise HomeAssistantError(f"Restore failed: {err}") from err
+
+        if result["failed"]:
+            _LOGGER.warning("restore_configuration: WCM-COM did not confirm %s", result["failed"])
+        return result
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKUP_CONFIGURATION,
+        async_backup,
+        schema=BACKUP_CONFIGURATION_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE_CONFIGURATION,
+        async_restore,
+        schema=RESTORE_CONFIGURATION_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_read_telegrams(call: ServiceCall) -> ServiceResponse:
+        """Read arbitrary [modultyp, bus, id] addresses from the WCM-COM."""
+
+        domain_data = hass.data.get(DOMAIN, {})
+        if not domain_data:
+            raise HomeAssistantError(f"No {DOMAIN} config entry loaded")
+
+        scheduler: WeishauptPollScheduler = next(iter(domain_data.values()))["coordinator"]
+        try:
+            results = await scheduler.async_read_telegrams(call.data[ATTR_TELEGRAMS])
+        except Exception as err:  # pylint: disable=broad-except
+            raise HomeAssistantError(f"Error communicating with WCM-COM: {err}") from err
+        return {"telegrams": results}
+
+    async def async_write_telegrams(call: ServiceCall) -> ServiceResponse:
+        """Write raw [modultyp, bus, id, value] telegrams to the WCM-COM."""
+
+        domain_data = hass.data.get(DOMAIN, {})
+        if not domain_data:
+            raise HomeAssistantError(f"No {DOMAIN} config entry loaded")
+
+        entry_data = next(iter(domain_data.values()))
+        if not entry_data["coordinator"].allow_write:
+            raise HomeAssistantError("Weishaupt WCM-COM integration is in read-only mode.")
+
+        scheduler: WeishauptPollScheduler = entry_data["coordinator"]
+        results = await scheduler.async_write_telegrams(call.data[ATTR_TELEGRAMS])
+        if not all(result["ok"] for result in results):
+            _LOGGER.warning("write_telegrams: WCM-COM did not confirm all writes (%s)", results)
+        return {"telegrams": results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_READ_TELEGRAMS,
+        async_read_telegrams,
+        schema=READ_TELEGRAMS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WRITE_TELEGRAMS,
+        async_write_telegrams,
+        schema=WRITE_TELEGRAMS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PROFILE,
+        async_apply_profile,
+        schema=APPLY_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH_PARAMETERS,
+        async_refresh_parameters,
+        schema=REFRESH_PARAMETERS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok and entry.entry_id in hass.data.get(DOMAIN, {}):
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Snapshot sofort sichern, damit ein Reload direkt darauf aufsetzt
+        await entry_data["store"].async_save()
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached snapshot of a deleted config entry."""
+
+    api = WeishauptAPI(entry.data.get("host"))
+    await WeishauptSnapshotStore(hass, entry.entry_id, api).async_remove()
+
+
+def _heating_circuits(entry: ConfigEntry) -> tuple[int, ...]:
+    """Return the configured heating circuits (options override the detected ones)."""
+    circuits = entry.options.get(CONF_HEATING_CIRCUITS, entry.data.get(CONF_HEATING_CIRCUITS, DEFAULT_HEATING_CIRCUITS))
+    return tuple(sorted(int(circuit) for circuit in circuits))
+
+
+def _cascade_members(entry: ConfigEntry) -> tuple[int, ...]:
+    """Return the address codes of the configured cascade boilers."""
+    return tuple(sorted(int(member) for member in entry.options.get(CONF_CASCADE_MEMBERS, DEFAULT_CASCADE_MEMBERS)))
+
+
+def _connection(entry: ConfigEntry) -> tuple[str | None, str | None, str | None]:
+    """Return host and credentials; the options flow may override the entry data."""
+    return tuple(
+        entry.options.get(key, entry.data.get(key)) or None
+        for key in (CONF_HOST, CONF_USERNAME, CONF_PASSWORD)
+    )
+
+
+async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle options update.
+
+    Intervalle, Logging, Schreibfreigabe und Schreib-Limits werden live
+    übernommen; neu geladen wird nur bei geändertem Host, Zugangsdaten,
+    Heizkreisen oder Kaskaden-Kesseln.
+    """
+
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if not entry_data:
+        return
+
+    if _connection(entry) != entry_data["connection"]:
+        _LOGGER.info("Connection settings of %s changed, reloading", entry.entry_id)
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    api: WeishauptAPI = entry_data["api"]
+    if _heating_circuits(entry) != api.circuits or _cascade_members(entry) != api.cascade_members:
+        _LOGGER.info("Heating circuits or cascade of %s changed, reloading", entry.entry_id)
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    options = entry.options
+    scheduler: WeishauptPollScheduler = entry_data["coordinator"]
+
+    scan_interval: int = options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    scheduler.set_intervals(
+        scan_interval,
+        options.get(CONF_ACTIVE_SCAN_INTERVAL, DEFAULT_ACTIVE_SCAN_INTERVAL),
+        options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL),
+        options.get(CONF_POLL_BUDGET, DEFAULT_POLL_BUDGET),
+    )
+    api.set_tier_intervals(
+        {
+            POLL_TIER_SLOW: options.get(CONF_SLOW_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL),
+            POLL_TIER_VERY_SLOW: options.get(CONF_VERSION_SCAN_INTERVAL, DEFAULT_VERSION_SCAN_INTERVAL),
+        }
+    )
+    api.write_skip_max_age = options.get(CONF_WRITE_SKIP_MAX_AGE, DEFAULT_WRITE_SKIP_MAX_AGE)
+    scheduler.writer.limiter.configure(
+        rate=options.get(CONF_WRITE_RATE, DEFAULT_WRITE_RATE),
+        burst=options.get(CONF_WRITE_BURST, DEFAULT_WRITE_BURST),
+        min_spacing=options.get(CONF_WRITE_MIN_SPACING, DEFAULT_WRITE_MIN_SPACING),
+    )
+
+    scheduler.allow_write = options.get(CONF_ALLOW_WRITE, DEFAULT_ALLOW_WRITE)
+    advanced_logging: bool = options.get(CONF_ADVANCED_LOGGING, DEFAULT_ADVANCED_LOGGING)
+    api.advanced_logging = advanced_logging
+    scheduler.stats.enabled = advanced_logging
+    entry_data["advanced_logging"] = advanced_logging
+
+    # Neuen Takt sofort übernehmen; gelesen werden nur fällige Gruppen
+    await scheduler.async_request_refresh()
+
+    _LOGGER.info(
+        "Applied options for %s (scan_interval=%s, allow_write=%s, advanced_logging=%s)",
+        entry.entry_id,
+        scan_interval,
+        scheduler.allow_write,
+        advanced_logging,
+    )
@@ -1,495 +1,105 @@
 """Number platform for Weishaupt WCM-COM expert parameters.
 
-Currently used for:
-- Expert Corr Outside Sensor (P20, ID 3103) as a -4..+4 K slider.
+Die Slider stehen in zwei Tabellen: Kessel-/Fachmann-Parameter und
+Heizkreis-Parameter (ohne "HKn "-Präfix, für jeden Heizkreis angelegt).
 """
 
 from __future__ import annotations
 
-from typing import Any
+import logging
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.const import UnitOfTemperature, UnitOfTime, PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
 
-from .base_entity import WeishauptBaseEntity
-from .const import DOMAIN
+from .base_entity import WeishauptBaseEntity, register_entity_parameters
+from .coordinator import WeishauptPollScheduler
+from .const import DOMAIN, NUMBER_WRITE_DEBOUNCE
+from .devices import WeishauptDevices
+from .entity_metadata import number_icon
+from .protocol import encode_setting, telegram_address, writable_parameter
 
+_LOGGER = logging.getLogger(__name__)
 
-async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up number entities for a config entry."""
-
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: DataUpdateCoordinator = entry_data["coordinator"]
-    api = entry_data["api"]
-    allow_write: bool = entry_data.get("allow_write", False)
-
-    numbers: list[WeishauptExpertNumber] = []
 
+# (Name, min, max, step, scale, unit) der Kessel-/Fachmann-Parameter
+_BOILER_NUMBERS = (
     # Expert Spec Level Heating Mode (P18 / ID 3102) – Sonderniveau Heizbetrieb
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "Expert Spec Level Heating Mode",
-            parameter_id=3102,
-            min_value=8,
-            max_value=85,
-            step=1,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
+    ("Expert Spec Level Heating Mode", 8, 85, 1, 1.0, UnitOfTemperature.CELSIUS),
     # Expert Corr Outside Sensor (P20 / ID 3103) – Außentemperatur-Korrektur
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "Expert Corr Outside Sensor",
-            parameter_id=3103,
-            min_value=-4,
-            max_value=4,
-            step=1,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
+    ("Expert Corr Outside Sensor", -4, 4, 1, 1.0, UnitOfTemperature.CELSIUS),
     # Expert Min/Max VL Target (P30/P31 / ID 31/39) – Min/Max Vorlauf-Solltemp.
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "Expert Min VL Target",
-            parameter_id=31,
-            min_value=8.0,
-            max_value=85.0,
-            step=1.0,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "Expert Max VL Target",
-            parameter_id=39,
-            min_value=8.0,
-            max_value=85.0,
-            step=1.0,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
+    ("Expert Min VL Target", 8.0, 85.0, 1.0, 1.0, UnitOfTemperature.CELSIUS),
+    ("Expert Max VL Target", 8.0, 85.0, 1.0, 1.0, UnitOfTemperature.CELSIUS),
     # Expert Switch Diff VL (P32 / ID 34) – Schaltdifferenz Vorlauf
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "Expert Switch Diff VL",
-            parameter_id=34,
-            min_value=-7.0,
-            max_value=7.0,
-            step=1.0,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
+    ("Expert Switch Diff VL", -7.0, 7.0, 1.0, 1.0, UnitOfTemperature.CELSIUS),
     # Expert Burner Pulse Lock (P34 / ID 323) – Brenner-Taktsperre in Minuten
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "Expert Burner Pulse Lock",
-            parameter_id=323,
-            min_value=1,
-            max_value=15,
-            step=1,
-            scale=1.0,
-            unit=UnitOfTime.MINUTES,
-            allow_write=allow_write,
-        )
-    )
-
+    ("Expert Burner Pulse Lock", 1, 15, 1, 1.0, UnitOfTime.MINUTES),
     # Expert Max Power Heating / WW (P37/P38 / ID 319/345) – Prozentwerte
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "Expert Max Power Heating",
-            parameter_id=319,
-            min_value=20.0,
-            max_value=100.0,
-            step=1.0,
-            scale=1.0,
-            unit=PERCENTAGE,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "Expert Max Power WW",
-            parameter_id=345,
-            min_value=20.0,
-            max_value=100.0,
-            step=1.0,
-            scale=1.0,
-            unit=PERCENTAGE,
-            allow_write=allow_write,
-        )
-    )
-
+    ("Expert Max Power Heating", 20.0, 100.0, 1.0, 1.0, PERCENTAGE),
+    ("Expert Max Power WW", 20.0, 100.0, 1.0, 1.0, PERCENTAGE),
     # Expert Max Charge Time WW (P52 / ID 384) – max. WW-Ladezeit in Minuten
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "Expert Max Charge Time WW",
-            parameter_id=384,
-            min_value=10,
-            max_value=180,
-            step=1,
-            scale=1.0,
-            unit=UnitOfTime.MINUTES,
-            allow_write=allow_write,
-        )
-    )
+    ("Expert Max Charge Time WW", 10, 180, 1, 1.0, UnitOfTime.MINUTES),
+)
 
+# Je Heizkreis, der Name bekommt das Präfix "HKn "
+_CIRCUIT_NUMBERS = (
     # Frostheizgrenze (ID 702) – Fachmann / Heizung, -20..0 °C
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK1 Expert Frostheizgrenze",
-            parameter_id=702,
-            min_value=-20.0,
-            max_value=0.0,
-            step=1.0,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            bus=1,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK2 Expert Frostheizgrenze",
-            parameter_id=702,
-            min_value=-20.0,
-            max_value=0.0,
-            step=1.0,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            bus=2,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    # Ein Opti MAX (ID 272) – Fachmann / Heizung, 0..240 Minuten in 15er-Schritten
+    ("Expert Frostheizgrenze", -20.0, 0.0, 1.0, 1.0, UnitOfTemperature.CELSIUS),
+    # Ein Opti MAX (ID 272) – Fachmann / Heizung, 0..240 Minuten in 15er-Schritten.
     # Rohwert kommt in 15-Minuten-Blöcken, in HA wollen wir echte Minuten sehen.
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK1 Expert Ein Opti MAX",
-            parameter_id=272,
-            min_value=0.0,
-            max_value=240.0,
-            step=15.0,              # Schrittweite in Minuten
-            scale=(1.0 / 15.0),     # Rohwert = 15-Minuten-Blöcke → in HA Minuten
-            unit=UnitOfTime.MINUTES,
-            bus=1,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK2 Expert Ein Opti MAX",
-            parameter_id=272,
-            min_value=0.0,
-            max_value=240.0,
-            step=15.0,              # Schrittweite in Minuten
-            scale=(1.0 / 15.0),     # Rohwert = 15-Minuten-Blöcke → in HA Minuten
-            unit=UnitOfTime.MINUTES,
-            bus=2,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    # HK1/HK2 User heating parameters (Form_Heizung_Benutzer)
-    # HK1 (Bus=1)
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK1 User Normal Raumtemperatur",
-            parameter_id=5,
-            min_value=10.0,
-            max_value=35.0,
-            step=0.5,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK1 User Absenk Raumtemperatur",
-            parameter_id=8,
-            min_value=10.0,
-            max_value=35.0,
-            step=0.5,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK1 User Normal VL Soll",
-            parameter_id=297,
-            min_value=8.0,
-            max_value=85.0,
-            step=1.0,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK1 User Absenk VL Soll",
-            parameter_id=298,
-            min_value=8.0,
-            max_value=85.0,
-            step=1.0,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK1 User Steilheit",
-            parameter_id=270,
-            min_value=2.5,
-            max_value=40.0,
-            step=0.5,
-            scale=1.0,
-            unit=None,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK1 User Raumfrosttemperatur",
-            parameter_id=2580,
-            min_value=4.0,
-            max_value=35.0,
-            step=0.5,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK1 User SoWi Umschaltung",
-            parameter_id=278,
-            min_value=8.0,
-            max_value=30.0,
-            step=1.0,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK1 User Sollwert Solar",
-            parameter_id=129,
-            min_value=0.0,
-            max_value=10.0,
-            step=0.1,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
-    # HK2 (Bus=2)
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK2 User Normal Raumtemperatur",
-            parameter_id=5,
-            min_value=10.0,
-            max_value=35.0,
-            step=0.5,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK2 User Absenk Raumtemperatur",
-            parameter_id=8,
-            min_value=10.0,
-            max_value=35.0,
-            step=0.5,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
+    ("Expert Ein Opti MAX", 0.0, 240.0, 15.0, 1.0 / 15.0, UnitOfTime.MINUTES),
+    # User heating parameters (Form_Heizung_Benutzer)
+    ("User Normal Raumtemperatur", 10.0, 35.0, 0.5, 1.0, UnitOfTemperature.CELSIUS),
+    ("User Absenk Raumtemperatur", 10.0, 35.0, 0.5, 1.0, UnitOfTemperature.CELSIUS),
+    ("User Normal VL Soll", 8.0, 85.0, 1.0, 1.0, UnitOfTemperature.CELSIUS),
+    ("User Absenk VL Soll", 8.0, 85.0, 1.0, 1.0, UnitOfTemperature.CELSIUS),
+    ("User Steilheit", 2.5, 40.0, 0.5, 1.0, None),
+    ("User Raumfrosttemperatur", 4.0, 35.0, 0.5, 1.0, UnitOfTemperature.CELSIUS),
+    ("User SoWi Umschaltung", 8.0, 30.0, 1.0, 1.0, UnitOfTemperature.CELSIUS),
+    ("User Sollwert Solar", 0.0, 10.0, 0.1, 1.0, UnitOfTemperature.CELSIUS),
+)
 
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK2 User Normal VL Soll",
-            parameter_id=297,
-            min_value=8.0,
-            max_value=85.0,
-            step=1.0,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
 
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK2 User Absenk VL Soll",
-            parameter_id=298,
-            min_value=8.0,
-            max_value=85.0,
-            step=1.0,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK2 User Steilheit",
-            parameter_id=270,
-            min_value=2.5,
-            max_value=40.0,
-            step=0.5,
-            scale=1.0,
-            unit=None,
-            allow_write=allow_write,
-        )
-    )
-
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK2 User Raumfrosttemperatur",
-            parameter_id=2580,
-            min_value=4.0,
-            max_value=35.0,
-            step=0.5,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up number entities for a config entry."""
 
-    numbers.append(
-        WeishauptExpertNumber(
-            coordinator,
-            api,
-            "HK2 User SoWi Umschaltung",
-            parameter_id=278,
-            min_value=8.0,
-            max_value=30.0,
-            step=1.0,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
-        )
-    )
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    scheduler: WeishauptPollScheduler = entry_data["coordinator"]
+    api = entry_data["api"]
+    devices: WeishauptDevices = entry_data["devices"]
 
-    numbers.append(
+    descriptions = list(_BOILER_NUMBERS) + [
+        (f"HK{circuit} {name}", *limits)
+        for name, *limits in _CIRCUIT_NUMBERS
+        for circuit in api.circuits
+    ]
+    numbers = [
         WeishauptExpertNumber(
-            coordinator,
+            scheduler,
             api,
-            "HK2 User Sollwert Solar",
-            parameter_id=129,
-            min_value=0.0,
-            max_value=10.0,
-            step=0.1,
-            scale=1.0,
-            unit=UnitOfTemperature.CELSIUS,
-            allow_write=allow_write,
+            devices,
+            name,
+            min_value=min_value,
+            max_value=max_value,
+            step=step,
+            scale=scale,
+            unit=unit,
         )
-    )
+        for name, min_value, max_value, step, scale, unit in descriptions
+    ]
 
+    register_entity_parameters(entry_data, numbers)
     async_add_entities(numbers)
 
 
@@ -500,30 +110,32 @@ class WeishauptExpertNumber(CoordinatorEntity, WeishauptBaseEntity, NumberEntity
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        scheduler: WeishauptPollScheduler,
         api,
+        devices: WeishauptDevices,
         sensor_name: str,
-        parameter_id: int,
         min_value: float,
         max_value: float,
         step: float,
         scale: float = 1.0,
         unit: str | None = None,
-        allow_write: bool = False,
-        bus: int = 0,
-        modultyp: int = 10,
     ) -> None:
         """Initialize the expert number entity."""
 
-        CoordinatorEntity.__init__(self, coordinator)
+        # Nur auf die Gruppe des eigenen Parameters hören
+        CoordinatorEntity.__init__(self, scheduler.coordinator_for(sensor_name))
         WeishauptBaseEntity.__init__(self, api)
+        self._scheduler = scheduler
 
         self._sensor_name = sensor_name
-        self._parameter_id = parameter_id
         self._scale = float(scale) if scale else 1.0
-        self._allow_write = allow_write
-        self._bus = bus
-        self._modultyp = modultyp
+        self._unsub_debounce: CALLBACK_TYPE | None = None
+
+        # Adresse und Kodierung kommen aus dem Parameterkatalog, wie bei
+        # apply_profile, Restore und Climate (siehe protocol.encode_setting)
+        param = writable_parameter(sensor_name)
+        self._parameter_id = param["id"]
+        self._modultyp, self._bus = telegram_address(param)
 
         slug = self._sensor_name.lower().replace(" ", "_")
         self._attr_translation_key = slug
@@ -538,79 +150,24 @@ class WeishauptExpertNumber(CoordinatorEntity, WeishauptBaseEntity, NumberEntity
         if unit is not None:
             self._attr_native_unit_of_measurement = unit
 
-        # Icon je nach Parameter leicht variieren
-        name = sensor_name
-
-        # Fachmann / Heizung
-        if "Frostheizgrenze" in name:
-            self._attr_icon = "mdi:snowflake-thermometer"
-        elif "Ein Opti MAX" in name:
-            self._attr_icon = "mdi:clock-outline"
-
-        # Allgemeine Expert-Parameter
-        elif "Corr Outside Sensor" in name:
-            self._attr_icon = "mdi:thermometer-minus"
-        elif "Spec Level Heating Mode" in name:
-            self._attr_icon = "mdi:thermometer"
-        elif "Min VL Target" in name or "Max VL Target" in name:
-            self._attr_icon = "mdi:thermometer"
-        elif "Switch Diff VL" in name:
-            self._attr_icon = "mdi:thermometer-lines"
-        elif "Power" in name:
-            self._attr_icon = "mdi:gauge"
-        elif "Pulse Lock" in name or "Charge Time" in name:
-            self._attr_icon = "mdi:clock-outline"
-
-        # HK1/HK2 User Heizparameter (Form_Heizung_Benutzer)
-        elif "HK1 User Normal Raumtemperatur" in name or "HK2 User Normal Raumtemperatur" in name:
-            self._attr_icon = "mdi:home-thermometer"
-        elif "HK1 User Absenk Raumtemperatur" in name or "HK2 User Absenk Raumtemperatur" in name:
-            self._attr_icon = "mdi:home-thermometer-outline"
-        elif "HK1 User Normal VL Soll" in name or "HK2 User Normal VL Soll" in name:
-            self._attr_icon = "mdi:thermostat"
-        elif "HK1 User Absenk VL Soll" in name or "HK2 User Absenk VL Soll" in name:
-            # etwas abgesetzter Thermostat für den Absenk-Bereich
-            self._attr_icon = "mdi:thermostat-box-outline"
-        elif "HK1 User Steilheit" in name or "HK2 User Steilheit" in name:
-            self._attr_icon = "mdi:chart-bell-curve"
-        elif "HK1 User Raumfrosttemperatur" in name or "HK2 User Raumfrosttemperatur" in name:
-            self._attr_icon = "mdi:snowflake-thermometer"
-        elif "HK1 User SoWi Umschaltung" in name or "HK2 User SoWi Umschaltung" in name:
-            self._attr_icon = "mdi:weather-sunny-alert"
-        elif "HK1 User Sollwert Solar" in name or "HK2 User Sollwert Solar" in name:
-            self._attr_icon = "mdi:solar-power"
-
-        # Fallback: generisches Tuning-Icon für sonstige Slider
-        else:
-            self._attr_icon = "mdi:tune-variant"
-
-    @property
-    def device_info(self):
-        """Attach numbers to the appropriate device (boiler or HK1/HK2)."""
-
-        name = self._sensor_name or ""
-        slug = name.lower().replace(" ", "_")
-
-        if slug.startswith("hk1_"):
-            ident = "weishaupt_hk1"
-            dev_name = "Weishaupt Heizkreis 1"
-        elif slug.startswith("hk2_"):
-            ident = "weishaupt_hk2"
-            dev_name = "Weishaupt Heizkreis 2"
-        else:
-            ident = "weishaupt_kessel"
-            dev_name = "Weishaupt Kessel"
-
-        return {
-            "identifiers": {(DOMAIN, ident)},
-            "name": dev_name,
-            "manufacturer": "Weishaupt",
-            "model": "WCM-COM",
-        }
+        self._attr_icon = number_icon(sensor_name)
+        # Gemeinsames DeviceInfo des Geräts (Kessel, HK1, HK2)
+        self._attr_device_info = devices.device_info(sensor_name)
 
     @property
     def native_value(self) -> float | None:
-        """Return the current value from the coordinator data."""
+        """Return the current value (optimistic while a write is pending)."""
+
+        if self._optimistic_value is not None:
+            return self._optimistic_value
+        return self._reported_value()
+
+    def _value_matches(self, reported, requested) -> bool:
+        """Compare with half a step tolerance (scaled raw values)."""
+        return reported is not None and abs(reported - requested) < self._attr_native_step / 2
+
+    def _reported_value(self) -> float | None:
+        """Return the value currently reported by the WCM-COM."""
 
         data = self.coordinator.data or {}
         value = data.get(self._sensor_name)
@@ -637,25 +194,46 @@ class WeishauptExpertNumber(CoordinatorEntity, WeishauptBaseEntity, NumberEntity
         """Handle value changes from Home Assistant."""
 
         if not self._allow_write:
-            from homeassistant.exceptions import HomeAssistantError
             raise HomeAssistantError("Weishaupt WCM-COM integration is in read-only mode.")
 
         # Clamp to allowed range just in case
         value = max(self._attr_native_min_value, min(self._attr_native_max_value, value))
 
-        # Skalierten Rohwert berechnen (DIV=10 etc. analog zur WebApp-Logik)
-        code = int(round(value * self._scale))
-
-        # Für globale Expert-Parameter bleibt bus=0/modultyp=10, für
-        # Heizkreis-spezifische Parameter (z.B. Frostheizgrenze/Opti MAX)
-        # werden bus/modultyp über den Konstruktor gesetzt.
-        await self.hass.async_add_executor_job(
-            self.api.write_parameter,
-            self._parameter_id,
-            self._bus,
-            self._modultyp,
-            code,
-        )
+        # Anzeigewert -> Snapshot-Wert -> Rohcode (DIV=10 etc. analog zur WebApp-Logik)
+        code = encode_setting(self._sensor_name, value * self._scale)[3]
+
+        # Slider-Bewegungen erzeugen viele Aufrufe: Wert sofort anzeigen,
+        # aber erst schreiben, wenn die Eingabe zur Ruhe gekommen ist. Ein
+        # neuer Wert ersetzt den noch nicht gesendeten vorherigen.
+        # Schreib-Limits schon hier prüfen, damit die Ablehnung beim
+        # Aufrufer ankommt und nicht erst im verzögerten Write.
+        self._cancel_debounce()
+        self._scheduler.async_check_write(self._parameter_id, self._bus, self._modultyp)
+        self._optimistic_value = value
+        self.async_write_ha_state()
+
+        async def _async_write(value: float, code: int) -> None:
+            try:
+                await self._async_write_optimistic(value, code)
+            except HomeAssistantError as err:
+                _LOGGER.warning("Write of %s = %s failed: %s", self._sensor_name, value, err)
+
+        @callback
+        def _async_write_debounced(_now) -> None:
+            self._unsub_debounce = None
+            self.hass.async_create_task(_async_write(value, code))
+
+        self._unsub_debounce = async_call_later(self.hass, NUMBER_WRITE_DEBOUNCE, _async_write_debounced)
+
+    @callback
+    def _cancel_debounce(self) -> None:
+        """Drop a pending, not yet sent write."""
+        if self._unsub_debounce is not None:
+            self._unsub_debounce()
+            self._unsub_debounce = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel pending writes when the entity is removed."""
+        self._cancel_debounce()
+        await super().async_will_remove_from_hass()
 
-        # Nach dem Schreiben den Coordinator aktualisieren
-        await self.coordinator.async_request_refresh()
@@ -0,0 +1,66 @@
+"""Polling policies for the Weishaupt WCM-COM integration."""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import timedelta
+
+from .const import ACTIVITY_HOLD_TIME, ACTIVITY_KEYS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ActivityPollingPolicy:
+    """Choose the polling interval from the boiler activity in a snapshot.
+
+    Solange Flamme, Heizung oder Warmwasser aktiv sind, wird das aktive
+    (kurze) Intervall verwendet. Zurück auf das Ruhe-Intervall geht es erst,
+    wenn ACTIVITY_HOLD_TIME lang keine Aktivität mehr gemeldet wurde.
+    """
+
+    def __init__(
+        self,
+        idle_interval: int,
+        active_interval: int,
+        hold_time: float = ACTIVITY_HOLD_TIME,
+    ) -> None:
+        """Initialize the policy with intervals in seconds."""
+        # Ein "aktives" Intervall länger als das Ruhe-Intervall ergibt keinen Sinn
+        self.set_intervals(idle_interval, active_interval)
+        self._hold_time = hold_time
+        self._last_active: float | None = None
+        self._active = False
+
+    @property
+    def active(self) -> bool:
+        """Return True while the active interval is in use."""
+        return self._active
+
+    @property
+    def interval(self) -> timedelta:
+        """Return the interval currently in use."""
+        return self.active_interval if self._active else self.idle_interval
+
+    def set_intervals(self, idle_interval: int, active_interval: int) -> None:
+        """Change the intervals (seconds) without losing the activity state."""
+        self.idle_interval = timedelta(seconds=idle_interval)
+        self.active_interval = timedelta(seconds=min(active_interval, idle_interval))
+
+    def next_interval(self, data: dict) -> timedelta:
+        """Return the interval to use after the given snapshot."""
+
+        now = time.monotonic()
+        if any(data.get(key) for key in ACTIVITY_KEYS):
+            self._last_active = now
+
+        active = self._last_active is not None and now - self._last_active < self._hold_time
+        if active != self._active:
+            self._active = active
+            _LOGGER.debug(
+                "Boiler %s, switching poll interval to %s",
+                "active" if active else "idle",
+                self.active_interval if active else self.idle_interval,
+            )
+
+        return self.active_interval if active else self.idle_interval
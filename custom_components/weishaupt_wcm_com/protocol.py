@@ -0,0 +1,646 @@
+"""WCM-COM CoCo protocol without Home Assistant dependencies.
+
+Parameterkatalog, Telegramm-Kodierung/-Dekodierung und der HTTP-Transport
+liegen hier, damit sie auch in Skripten, Tests oder einem Prozess-Pool
+nutzbar sind, ohne Home Assistant zu laden. ``requests`` wird erst beim
+ersten Request importiert; die Integration (WeishauptAPI) baut darauf auf.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+
+from .const import (
+    PARAMETERS,
+    MAX_HEATING_CIRCUITS,
+    ERROR_CODE_MAP,
+    WARNING_CODE_MAP,
+    GROUP_PROCESS,
+    GROUP_HK_PROCESS,
+    GROUP_VERSIONS,
+    GROUP_CONFIG,
+    GROUP_USER,
+    GROUP_DATE,
+    GROUP_EXPERT,
+    HEARTBEAT_KEYS,
+    EXPERT_BOILER_ADDRESS_MAP,
+    VIRTUAL_PARAMETER_SOURCES,
+    SETTING_GROUPS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Timeout für reguläre Requests (das Gerät ist träge)
+REQUEST_TIMEOUT = 60
+
+# Maximale Anzahl Telegramme pro Request, für Abfragen wie für Schreib-
+# zugriffe. Mit zwei Heizkreisen passt jede Gruppe (max. 23 Telegramme) wie
+# bisher in einen Request; größere Gruppen werden aufgeteilt.
+MAX_TELEGRAMS_PER_REQUEST = 24
+
+_CIRCUIT_PREFIX = re.compile(r"^HK(\d+) ")
+
+
+def circuit_of(name: str) -> int | None:
+    """Return the heating circuit number of a parameter name (None = boiler)."""
+    match = _CIRCUIT_PREFIX.match(name)
+    return int(match.group(1)) if match else None
+
+
+def circuit_suffix(name: str) -> str:
+    """Return the parameter name without its "HKn " prefix."""
+    return _CIRCUIT_PREFIX.sub("", name, count=1)
+
+
+def in_circuits(name: str, circuits) -> bool:
+    """Return True for boiler parameters and those of the given circuits."""
+    circuit = circuit_of(name)
+    return circuit is None or circuit in circuits
+
+
+# Kaskaden-Kessel: "Kessel A " .. "Kessel E " (Adresscode 1..5)
+_CASCADE_ADDRESSES = {address: code for code, address in EXPERT_BOILER_ADDRESS_MAP.items() if code}
+_CASCADE_PREFIX = re.compile(rf"^Kessel ([{''.join(_CASCADE_ADDRESSES)}]) ")
+
+
+def cascade_member_of(name: str) -> int | None:
+    """Return the cascade address code of a parameter name (None = main boiler)."""
+    match = _CASCADE_PREFIX.match(name)
+    return _CASCADE_ADDRESSES[match.group(1)] if match else None
+
+
+def cascade_suffix(name: str) -> str:
+    """Return the parameter name without its "Kessel <Adresse> " prefix."""
+    return _CASCADE_PREFIX.sub("", name, count=1)
+
+
+def is_active(name: str, circuits, members) -> bool:
+    """Return True if ``name`` belongs to the configured circuits and cascade members."""
+    member = cascade_member_of(name)
+    return in_circuits(name, circuits) and (member is None or member in members)
+
+
+def _partition_parameters(parameters):
+    """Split the parameter catalog into the request groups used for polling.
+
+    Split in mehrere Requests, damit der WCM-COM alle Telegramme
+    beantwortet (begrenzte Anzahl pro Antwort).
+     - globale Prozesswerte (Kessel und Kaskaden-Kessel)
+     - Heizkreis-Prozesswerte (je Heizkreis)
+     - Versionsparameter (FS/EM High/Low)
+     - Heizkreis-Konfig-Parameter (Pumpen, Spannungen, HK-Typ, Ext. Fühler, Urlaub)
+     - HK-User-Parameter (Betriebsarten & User-Temperaturen)
+     - Datum/Zeit/Sommerzeit
+     - Fachmann-/Expert-Parameter (P10, P12, P18, ...)
+    """
+
+    global_params = [
+        p for p in parameters
+        if (("bus" not in p and "modultyp" not in p) or cascade_member_of(p["name"]))
+        and not p["name"].startswith("Expert ")
+        and not p.get("virtual")
+    ]
+    expert_params = [
+        p for p in parameters
+        if p["name"].startswith("Expert ")
+    ]
+    # Heizkreis-Prozesswerte (Temperaturen/Sollwerte) priorisieren, damit sie
+    # bei begrenzter Telegrammzahl nicht von zusätzlichen Konfig/User-Parametern
+    # verdrängt werden.
+    hk_process_params = [
+        p
+        for p in parameters
+        if ("bus" in p or "modultyp" in p)
+        and not cascade_member_of(p["name"])
+        and not (circuit_of(p["name"]) and circuit_suffix(p["name"]).startswith(("Config", "User")))
+        and not p.get("internal")
+        and not p.get("virtual")
+    ]
+
+    # Spezielle Gruppe für Holiday Temp Level + System Date/Time + DST,
+    # damit diese nicht in einem übervollen Prozess-Telegramm untergehen.
+    date_params = [
+        p
+        for p in parameters
+        if not p.get("virtual")
+        and (
+            p["name"].startswith("System Date ")
+            or p["name"].startswith("System Time ")
+            or p["name"].startswith("DST ")
+            or (circuit_of(p["name"]) and circuit_suffix(p["name"]) == "Holiday Temp Level")
+        )
+    ]
+    # Versions-Parameter (FS/EM High/Low) separat abfragen, damit sie immer
+    # vollständig geliefert werden.
+    hk_version_params = [
+        p
+        for p in parameters
+        if p.get("internal")
+        and "Version" in p["name"]
+    ]
+    # HK-Userparameter (Form_Heizung_Benutzer) explizit trennen, damit sie
+    # in eigenen, kleinen Requests wie in der Original-WebApp abgefragt werden.
+    hk_user_params = [
+        p
+        for p in parameters
+        if circuit_of(p["name"]) and circuit_suffix(p["name"]).startswith("User ")
+    ]
+    # HK-Konfig (Pumpen/Spannung/HK-Typ/Ext. Raumfühler, Urlaub etc.). Die
+    # Datumsparameter werden nur noch über ihre eigene Gruppe abgefragt, damit
+    # jeder Parameter genau einer Gruppe (und damit einer Polling-Stufe) angehört.
+    hk_config_params = [
+        p
+        for p in parameters
+        if ("bus" in p or "modultyp" in p)
+        and not cascade_member_of(p["name"])
+        and p not in hk_process_params
+        and p not in hk_version_params
+        and p not in date_params
+        and p not in hk_user_params
+    ]
+
+    # Reihenfolge entspricht der bisherigen Abfragereihenfolge
+    return {
+        GROUP_PROCESS: global_params,
+        GROUP_HK_PROCESS: hk_process_params,
+        GROUP_VERSIONS: hk_version_params,
+        GROUP_CONFIG: hk_config_params,
+        GROUP_USER: hk_user_params,
+        GROUP_DATE: date_params,
+        GROUP_EXPERT: expert_params,
+    }
+
+
+PARAMETER_GROUPS = _partition_parameters(PARAMETERS)
+
+# Zuordnung Parametername -> Gruppe (virtuelle Parameter über ihre Rohwerte)
+PARAMETER_GROUP_BY_NAME = {
+    p["name"]: group
+    for group, params in PARAMETER_GROUPS.items()
+    for p in params
+}
+for _virtual, _sources in VIRTUAL_PARAMETER_SOURCES.items():
+    PARAMETER_GROUP_BY_NAME[_virtual] = PARAMETER_GROUP_BY_NAME[_sources[0]]
+
+
+def active_parameter_groups(circuits, members=()) -> dict[str, list]:
+    """Return PARAMETER_GROUPS restricted to the configured circuits and cascade members."""
+    return {
+        group: [p for p in params if is_active(p["name"], circuits, members)]
+        for group, params in PARAMETER_GROUPS.items()
+    }
+
+
+def pack_telegrams(telegrams: list, limit: int = MAX_TELEGRAMS_PER_REQUEST) -> list[list]:
+    """Split the telegrams of a group into as few, evenly filled requests as possible.
+
+    Mit zwei Heizkreisen und ohne Kaskade passt jede Gruppe in einen
+    Request; weitere Heizkreise bzw. Kaskaden-Kessel teilen sich die
+    Requests ihrer Gruppe, statt je einen eigenen zu brauchen.
+    """
+    if len(telegrams) <= limit:
+        return [telegrams]
+    size = math.ceil(len(telegrams) / math.ceil(len(telegrams) / limit))
+    return [telegrams[start:start + size] for start in range(0, len(telegrams), size)]
+
+
+def group_for_parameter(name: str) -> str:
+    """Return the polling group a (possibly virtual) parameter belongs to."""
+    return PARAMETER_GROUP_BY_NAME.get(name, GROUP_PROCESS)
+
+
+def is_polled(name: str) -> bool:
+    """Return True if ``name`` shows up in the polled values under its own name.
+
+    Virtuelle Parameter werden erst in den Entitäten aus ihren Rohwerten
+    berechnet und lassen sich daher nicht direkt nachlesen.
+    """
+    return name in PARAMETER_GROUP_BY_NAME and name not in VIRTUAL_PARAMETER_SOURCES
+
+
+def resolve_parameters(names):
+    """Return the catalog entries that have to be read for the given names.
+
+    Virtuelle Parameter werden in ihre Rohwerte aufgelöst, Duplikate
+    entfernt. Unbekannte Namen führen zu einem ValueError.
+    """
+
+    by_name = {p["name"]: p for p in PARAMETERS if not p.get("virtual")}
+    resolved = []
+    for name in names:
+        for source in VIRTUAL_PARAMETER_SOURCES.get(name, (name,)):
+            param = by_name.get(source)
+            if param is None:
+                raise ValueError(f"Unknown parameter '{name}'")
+            if param not in resolved:
+                resolved.append(param)
+    return resolved
+
+
+def _is_setting(name: str) -> bool:
+    """Return True if ``name`` is a setting stored in the controller.
+
+    Einstellungen sind Konfig/User/Datum/Expert sowie die HK-spezifischen
+    Expert-Parameter, die mit den Prozesswerten gelesen werden.
+    """
+    if name == "Expert Device Conf":
+        # Gerätekennung (Text wie "WAP P3"), keine Einstellung
+        return False
+    return group_for_parameter(name) in SETTING_GROUPS or name.split(" ", 1)[-1].startswith("Expert ")
+
+
+def writable_parameter(name: str):
+    """Return the catalog entry of a writable setting or raise ValueError."""
+
+    param = next((p for p in PARAMETERS if p["name"] == name and not p.get("virtual")), None)
+    if param is None:
+        raise ValueError(f"Unknown parameter '{name}'")
+    if not _is_setting(name):
+        raise ValueError(f"Parameter '{name}' is read-only")
+    return param
+
+
+def shared_addresses(names) -> list[list[str]]:
+    """Return the groups of ``names`` that resolve to the same telegram address.
+
+    Solche Namen liefern beim Lesen nur einen Wert und würden beim
+    Schreiben zu einem Telegramm zusammengefasst.
+    """
+
+    by_address: dict[tuple[int, int, int], list[str]] = {}
+    for name in dict.fromkeys(names):
+        param = next((p for p in PARAMETERS if p["name"] == name and not p.get("virtual")), None)
+        if param is not None:
+            by_address.setdefault((*telegram_address(param), param["id"]), []).append(name)
+    return [group for group in by_address.values() if len(group) > 1]
+
+
+# Einstellungen für Backup/Restore – ohne Systemdatum/-uhrzeit, die beim
+# Zurückspielen die Uhr des Reglers verstellen würden
+BACKUP_PARAMETERS = [
+    p["name"]
+    for p in PARAMETERS
+    if not p.get("virtual")
+    and _is_setting(p["name"])
+    and not p["name"].startswith(("System Date ", "System Time "))
+]
+
+
+def restorable_settings(parameters: dict, circuits) -> tuple[dict, list[str]]:
+    """Split the parameters of a backup into those to restore and skipped ones.
+
+    Übersprungen werden Parameter nicht (mehr) konfigurierter Heizkreise;
+    unbekannte Namen lösen einen ValueError aus.
+    """
+    unknown = [name for name in parameters if name not in BACKUP_PARAMETERS]
+    if unknown:
+        raise ValueError(f"Unknown parameters in backup: {', '.join(unknown)}")
+    restore = {name: value for name, value in parameters.items() if in_circuits(name, circuits)}
+    return restore, [name for name in parameters if name not in restore]
+
+
+def encode_value(param, value) -> int:
+    """Convert a snapshot value back to its raw telegram code.
+
+    Umkehrung der Dekodierung: Temperaturen (und P37/P38) werden mit 10
+    multipliziert, negative Werte im Zweierkomplement übertragen.
+    """
+
+    if isinstance(value, str):
+        raise ValueError(f"Parameter '{param['name']}' expects a number, got '{value}'")
+    if param["type"] == "temperature" or (param["type"] == "percent" and param["id"] in (319, 345)):
+        code = int(round(float(value) * 10))
+    else:
+        code = int(round(float(value)))
+    if not -32768 <= code <= 65535:
+        raise ValueError(f"Value {value} out of range for '{param['name']}'")
+    return code & 0xFFFF
+
+
+def encode_setting(name: str, value) -> tuple[int, int, int, int]:
+    """Return the (parameter_id, bus, modultyp, code) write of a setting.
+
+    Einziger Weg vom Snapshot-Wert zum Schreibtelegramm: Adresse aus dem
+    Katalog (wie beim Lesen), Kodierung über ``encode_value``.
+    """
+
+    param = writable_parameter(name)
+    modultyp, bus = telegram_address(param)
+    return param["id"], bus, modultyp, encode_value(param, value)
+
+
+def changed_settings(data: dict, values: dict) -> dict:
+    """Return the entries of ``values`` that differ from the snapshot ``data``.
+
+    Verglichen wird auf Telegramm-Ebene, 21.0 und 21 gelten also als
+    gleich. Raises ValueError for unknown or read-only parameters and for
+    names that share a telegram address.
+    """
+
+    shared = shared_addresses(values)
+    if shared:
+        raise ValueError(f"Parameters share a telegram address and cannot be written together: {shared}")
+    changed = {}
+    for name, value in values.items():
+        param = writable_parameter(name)
+        code = encode_value(param, value)
+        current = data.get(name)
+        if current is None or isinstance(current, str) or encode_value(param, current) != code:
+            changed[name] = value
+    return changed
+
+
+class WeishauptError(Exception):
+    """Raised when the WCM-COM does not return a usable response."""
+
+
+class WeishauptConnectionError(WeishauptError):
+    """Raised when the WCM-COM cannot be reached."""
+
+
+class WeishauptAuthError(WeishauptError):
+    """Raised when the WCM-COM rejects the credentials."""
+
+    def __init__(self, message: str, challenge: str = "") -> None:
+        """Keep the login challenge (WWW-Authenticate and Server header)."""
+        super().__init__(message)
+        self.challenge = challenge
+
+
+class WeishauptBusyError(WeishauptError):
+    """Raised when the WCM-COM (or the request lock) is busy."""
+
+
+class WeishauptResponseError(WeishauptError):
+    """Raised when the WCM-COM answers with an empty or invalid body."""
+
+
+# Parameter des Heartbeat-Requests (Status, Flamme, Betriebsphase, Pumpe)
+HEARTBEAT_PARAMETERS = [p for p in PARAMETERS if p["name"] in HEARTBEAT_KEYS]
+
+
+def telegram_address(param):
+    """Return the (modultyp, bus) pair used to address a parameter."""
+
+    # Default behaviour: use destination=10 as module type and no specific
+    # bus assignment. Heizkreis-Prozesswerte use a concrete module type and
+    # bus id like the original web UI (HK1 = bus 1, ...).
+    modultyp = param.get("destination", 10)
+    if "modultyp" in param:
+        modultyp = param["modultyp"]
+    return modultyp, param.get("bus", 0)
+
+
+def build_telegram(params):
+    """Build a CoCo read request for the given parameters.
+
+    Build CoCo telegrams based on parameter metadata and original
+    Elster webApp format (see webApp.js / OBJTELEGRAMM).
+
+    Index mapping:
+      0: TEL_MODULTYP   (module type / destination)
+      1: TEL_BUSKENNUNG (bus id / Heizkreis)
+      2: TEL_COMMAND    (1 = read)
+      3: TEL_INFONR     (parameter id)
+      4: TEL_INDEX      (unused here)
+      5: TEL_PROT       (unused here)
+      6: TEL_DATA low   (0 for read)
+      7: TEL_DATA high  (0 for read)
+    """
+
+    telegram = {"prot": "coco", "telegramm": []}
+    for param in params:
+        modultyp, bus = telegram_address(param)
+        telegram["telegramm"].append([
+            modultyp,      # TEL_MODULTYP
+            bus,           # TEL_BUSKENNUNG
+            1,             # TEL_COMMAND (read)
+            param["id"],  # TEL_INFONR
+            0,             # TEL_INDEX
+            0,             # TEL_PROT
+            0,             # TEL_DATA low
+            0,             # TEL_DATA high
+        ])
+    return telegram
+
+
+def read_telegram(modultyp: int, bus: int, parameter_id: int) -> list:
+    """Return a read telegram for a raw (modultyp, bus, id) address."""
+    return [modultyp, bus, 1, parameter_id, 0, 0, 0, 0]
+
+
+def write_telegram(modultyp: int, bus: int, parameter_id: int, code: int) -> list:
+    """Return a write telegram (TEL_COMMAND = 2) carrying ``code``."""
+    return [
+        modultyp,  # TEL_MODULTYP (destination)
+        bus,       # TEL_BUSKENNUNG (HK1 = 1)
+        2,         # TEL_COMMAND (2 = write)
+        parameter_id,  # TEL_INFONR
+        0,         # TEL_INDEX
+        0,         # TEL_PROT
+        code & 0xFF,      # TEL_DATA low
+        (code >> 8) & 0xFF,  # TEL_DATA high
+    ]
+
+
+def telegram_code(message) -> int | None:
+    """Return the 16-bit raw code of a telegram, or None for text values."""
+    if len(message) >= 8 and isinstance(message[6], int) and isinstance(message[7], int):
+        return message[6] + 256 * message[7]
+    return None
+
+
+# Katalogeinträge je Parameter-ID für die Zuordnung der Antworttelegramme
+_PARAMETERS_BY_ID: dict[int, list] = {}
+for _param in PARAMETERS:
+    if not _param.get("virtual"):
+        _PARAMETERS_BY_ID.setdefault(_param["id"], []).append(_param)
+
+
+def find_parameter(modultyp: int, bus: int, parameter_id: int):
+    """Return the catalog entry a response telegram refers to, or None.
+
+    Zuordnung des Parameters:
+    1. Bevorzuge HK-spezifische Einträge mit explizitem "bus" == bus_id
+       und passenden "modultyp" (FS/MS), damit 409/410 sauber
+       zwischen FS- und EM-Versionen getrennt werden.
+    2. Fallback: Einträge mit passendem "bus" (ohne modultyp).
+    3. Fallback: globaler Eintrag ohne "bus" (z.B. Kesselwerte)
+    """
+
+    candidates = _PARAMETERS_BY_ID.get(parameter_id, ())
+    param = next((p for p in candidates if p.get("bus") == bus and p.get("modultyp") == modultyp), None)
+    if param is None:
+        param = next((p for p in candidates if p.get("bus") == bus and "modultyp" not in p), None)
+    if param is None:
+        param = next((p for p in candidates if "bus" not in p), None)
+    return param
+
+
+def decode_temperature(low_byte: int, high_byte: int) -> float:
+    """Calculate a temperature (0.1 °C, two's complement) from two bytes."""
+    raw_value = low_byte + 256 * high_byte
+    if high_byte < 128:
+        return raw_value / 10
+    return (raw_value - 65536) / 10
+
+
+def decode_telegram(message, previous_values: dict | None = None):
+    """Decode a single response telegram into a (name, value) pair.
+
+    ``previous_values`` liefert den Rückfallwert für ungültige Temperaturen.
+    Returns None for malformed telegrams or unknown parameters.
+    """
+
+    # Erwartete Formate:
+    #  - Standard: [modultyp, bus, cmd, id, index, prot, data_low, data_high]
+    #  - Spezialfall (z.B. 3794/Device Conf): [modultyp, bus, cmd, id, index, prot, text]
+    if len(message) < 7:
+        _LOGGER.warning("Received malformed telegram from WCM-COM (len=%s): %s", len(message), message)
+        return None
+
+    param = find_parameter(message[0], message[1], message[3])
+    if not param:
+        return None
+
+    if telegram_code(message) is not None:
+        low_byte, high_byte = message[6], message[7]
+    else:
+        # Keine getrennten Bytes vorhanden (z.B. Textwert) -> Dummy-Bytes
+        low_byte = 0
+        high_byte = 0
+    name = param["name"]
+    previous_values = previous_values or {}
+
+    # Spezialfall: Device Conf (3794) liefert einen Text wie "WAP P3" im letzten Feld.
+    if param["id"] == 3794 and isinstance(message[6], str):
+        value = message[6]
+
+    elif param["type"] == "temperature":
+        value = decode_temperature(low_byte, high_byte)
+
+        # Bekannter Weishaupt-Sentinelwert für "kein gültiger Wert": -3276.8 °C
+        # -> leise auf vorherigen Wert oder None zurückfallen, ohne Log-Spam.
+        if value == -3276.8:
+            value = previous_values.get(name)
+
+        # Plausibilitätsprüfung für Temperaturwerte (z. B. -50 bis 150 °C)
+        elif value < -50 or value > 150:
+            _LOGGER.warning(
+                "Unplausibler Temperaturwert für %s: %s. Nutze vorherigen Wert oder setze auf 'unavailable'.",
+                name,
+                value,
+            )
+            value = previous_values.get(name)
+
+    elif param["type"] == "percent":
+        value = low_byte + 256 * high_byte
+        # P37/P38 (Max Power Heating/WW) kommen als x10 -> auf % skalieren
+        if param["id"] in (319, 345):
+            value = value / 10
+
+    elif param["type"] == "binary":
+        value = bool(low_byte + 256 * high_byte)
+    else:
+        # value, code und Fallback: 16-Bit-Rohwert
+        value = low_byte + 256 * high_byte
+
+    return name, value
+
+
+def compute_versions(data: dict) -> None:
+    """Versionen für FS/EM aus den Rohwerten (High/Low) berechnen."""
+
+    # Kessel (Bus 0) – nur FS-Version (EM ist bei Manuel N/V)
+    kessel_fs_high = data.get("Kessel Version FS High")
+    kessel_fs_low = data.get("Kessel Version FS Low")
+    if kessel_fs_high is not None and kessel_fs_low is not None and kessel_fs_high != 0:
+        data["Kessel Config Version FS"] = f"{kessel_fs_high}.{kessel_fs_low}"
+
+    # Heizkreise – FS/EM-Version pro Kreis
+    for hk in range(1, MAX_HEATING_CIRCUITS + 1):
+        fs_high = data.get(f"HK{hk} Version FS High")
+        fs_low = data.get(f"HK{hk} Version FS Low")
+        em_high = data.get(f"HK{hk} Version EM High")
+        em_low = data.get(f"HK{hk} Version EM Low")
+
+        if fs_high is not None and fs_low is not None and fs_high != 0:
+            data[f"HK{hk} Config Version FS"] = f"{fs_high}.{fs_low}"
+
+        if em_high is not None and em_low is not None and em_high != 0:
+            data[f"HK{hk} Config Version EM"] = f"{em_high}.{em_low}"
+
+
+# "HK-Typ" je Heizkreis: beim Einrichten werden die Heizkreise übernommen,
+# für die der Regler einen anderen Typ als "n/v" (0/3) meldet
+CIRCUIT_DETECTION_PARAMETERS = [
+    p for p in PARAMETERS if circuit_of(p["name"]) and circuit_suffix(p["name"]) == "Config HK Type"
+]
+_CIRCUIT_NOT_PRESENT = (0, 3)
+
+
+def detect_heating_circuits(values: dict) -> list[int]:
+    """Return the heating circuits that report a configured "HK-Typ"."""
+    return [
+        circuit_of(p["name"])
+        for p in CIRCUIT_DETECTION_PARAMETERS
+        if isinstance(values.get(p["name"]), int) and values[p["name"]] not in _CIRCUIT_NOT_PRESENT
+    ]
+
+
+def process_code(code) -> str:
+    """Return the text of an error or warning code."""
+    if code in ERROR_CODE_MAP:
+        return ERROR_CODE_MAP[code]
+    if code in WARNING_CODE_MAP:
+        return WARNING_CODE_MAP[code]
+    return f"Unbekannter Code ({code})"
+
+
+def post_telegrams(
+    host: str,
+    telegrams: list,
+    username: str | None = None,
+    password: str | None = None,
+    timeout: float = REQUEST_TIMEOUT,
+) -> list:
+    """Send telegrams to ``/parameter.json`` in one request; return the response telegrams.
+
+    Raises WeishauptAuthError (401/403), WeishauptConnectionError (network or
+    HTTP errors), WeishauptBusyError (HTML "server busy" page) or
+    WeishauptResponseError (empty or invalid body).
+    """
+
+    # Erst hier importieren: Katalog und Decoder brauchen kein requests
+    import requests  # pylint: disable=import-outside-toplevel
+    from requests.auth import HTTPDigestAuth  # pylint: disable=import-outside-toplevel
+
+    try:
+        req = requests.post(
+            f"http://{host}/parameter.json",
+            auth=HTTPDigestAuth(username, password) if username and password else None,
+            data=json.dumps({"prot": "coco", "telegramm": telegrams}),
+            headers={"Content-Type": "application/json"},
+            timeout=timeout,
+        )
+        req.raise_for_status()
+    except requests.exceptions.HTTPError as err:
+        if err.response is not None and err.response.status_code in (401, 403):
+            headers = err.response.headers
+            challenge = " ".join(filter(None, (headers.get("WWW-Authenticate"), headers.get("Server"))))
+            raise WeishauptAuthError(f"WCM-COM rejected the credentials: {err}", challenge) from err
+        raise WeishauptConnectionError(f"Unexpected HTTP response from WCM-COM: {err}") from err
+    except requests.exceptions.RequestException as err:
+        raise WeishauptConnectionError(f"Cannot reach WCM-COM at {host}: {err}") from err
+
+    if req.text.strip() == "":
+        raise WeishauptResponseError("Empty response from WCM-COM")
+    if "<HTML>" in req.text.upper():
+        raise WeishauptBusyError("WCM-COM is busy")
+    try:
+        return req.json().get("telegramm", [])
+    except ValueError as err:
+        raise WeishauptResponseError(f"Invalid JSON from WCM-COM: {err}. Response content: {req.text}") from err
@@ -1,11 +1,11 @@
-"""Select platform for Weishaupt WCM-COM HK1 configuration.
-
-This exposes read/write dropdowns for:
-- HK1 Config HK Type (id 16)
-- HK1 Config Regelvariante (id 2419)
-- HK1 Config Ext Room Sensor (id 321)
-
-Initially only HK1 is supported; HK2 can be added later using the same pattern.
+"""Select platform for Weishaupt WCM-COM heating circuit configuration.
+
+This exposes read/write dropdowns per heating circuit for:
+- Config HK Type (id 16)
+- Config Regelvariante (id 2419)
+- Config Ext Room Sensor (id 321)
+- User Betriebsart HK/WW (id 274)
+- Urlaubstemperaturniveau (P142 / id 317)
 """
 
 from __future__ import annotations
@@ -16,357 +16,147 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DOMAIN,
-    PARAMETERS,
     HK_CONFIG_HK_TYPE_MAP,
     HK_CONFIG_REGELVARIANTE_MAP,
     HK_CONFIG_EXT_ROOM_SENSOR_MAP,
     HK_USER_OPERATION_MODE_MAP,
-    WW_USER_OPERATION_MODE_MAP,
     HOLIDAY_TEMP_LEVEL_MAP,
 )
-from .base_entity import WeishauptBaseEntity
+from .base_entity import WeishauptBaseEntity, register_entity_parameters
+from .coordinator import WeishauptPollScheduler
+from .devices import WeishauptDevices
+from .entity_metadata import OptionMap
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Je Heizkreis (modultyp 6, Bus = Heizkreis): Parameter ohne "HKn "-Präfix,
+# ID, Slug für die unique_id, Anzeigename ohne "Config"-Präfix, Icon und
+# Optionen. Die Optionen werden einmal aufgebaut und von allen Heizkreisen
+# geteilt.
+_CIRCUIT_SELECTS = (
+    ("Config HK Type", 16, "config_hk_type", "HK-Typ", "mdi:radiator", OptionMap(HK_CONFIG_HK_TYPE_MAP)),
+    ("Config Regelvariante", 2419, "config_regelvariante", "Regelvariante", "mdi:chart-bell-curve",
+     OptionMap(HK_CONFIG_REGELVARIANTE_MAP)),
+    ("Config Ext Room Sensor", 321, "config_ext_room_sensor", "Externer Raumfühler", "mdi:home-thermometer-outline",
+     OptionMap(HK_CONFIG_EXT_ROOM_SENSOR_MAP)),
+    # HK user operation mode select (Form_Heizung_Benutzer); WW fehlt, bis
+    # der Katalog eine eigene ID dafür kennt (siehe const.py)
+    ("User Betriebsart HK", 274, "user_op_mode_hk", "Betriebsart Heizung", "mdi:home-thermometer",
+     OptionMap(HK_USER_OPERATION_MODE_MAP)),
+    # Holiday temperature level (P142 / ID 317)
+    ("Urlaubstemperaturniveau", 317, "urlaubstemperaturniveau", "Urlaubstemperaturniveau", "mdi:snowflake",
+     OptionMap(HOLIDAY_TEMP_LEVEL_MAP)),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up select entities for HK1 configuration."""
+    """Set up select entities for the heating circuit configuration."""
 
     entry_data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: DataUpdateCoordinator = entry_data["coordinator"]
+    scheduler: WeishauptPollScheduler = entry_data["coordinator"]
     api = entry_data["api"]
-    allow_write: bool = entry_data.get("allow_write", False)
-
-    selects: list[WeishauptHK1ConfigSelect] = []
-
-    # HK1 uses bus=1 in PARAMETERS; we use the sensor names as keys
-    # HK1
-    selects.append(
-        WeishauptHKConfigSelect(
-            coordinator,
-            api,
-            "HK1 Config HK Type",
-            "hk1_config_hk_type",
-            HK_CONFIG_HK_TYPE_MAP,
-            parameter_id=16,
-            bus=1,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    selects.append(
-        WeishauptHKConfigSelect(
-            coordinator,
-            api,
-            "HK1 Config Regelvariante",
-            "hk1_config_regelvariante",
-            HK_CONFIG_REGELVARIANTE_MAP,
-            parameter_id=2419,
-            bus=1,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    selects.append(
-        WeishauptHKConfigSelect(
-            coordinator,
-            api,
-            "HK1 Config Ext Room Sensor",
-            "hk1_config_ext_room_sensor",
-            HK_CONFIG_EXT_ROOM_SENSOR_MAP,
-            parameter_id=321,
-            bus=1,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    # HK2
-    selects.append(
-        WeishauptHKConfigSelect(
-            coordinator,
-            api,
-            "HK2 Config HK Type",
-            "hk2_config_hk_type",
-            HK_CONFIG_HK_TYPE_MAP,
-            parameter_id=16,
-            bus=2,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    selects.append(
-        WeishauptHKConfigSelect(
-            coordinator,
-            api,
-            "HK2 Config Regelvariante",
-            "hk2_config_regelvariante",
-            HK_CONFIG_REGELVARIANTE_MAP,
-            parameter_id=2419,
-            bus=2,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    selects.append(
-        WeishauptHKConfigSelect(
-            coordinator,
-            api,
-            "HK2 Config Ext Room Sensor",
-            "hk2_config_ext_room_sensor",
-            HK_CONFIG_EXT_ROOM_SENSOR_MAP,
-            parameter_id=321,
-            bus=2,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    # HK/WW user operation mode selects (Form_Heizung_Benutzer)
-    selects.append(
-        WeishauptHKConfigSelect(
-            coordinator,
-            api,
-            "HK1 User Betriebsart HK",
-            "hk1_user_op_mode_hk",
-            HK_USER_OPERATION_MODE_MAP,
-            parameter_id=274,
-            bus=1,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
+    devices: WeishauptDevices = entry_data["devices"]
 
-    selects.append(
+    selects = [
         WeishauptHKConfigSelect(
-            coordinator,
+            scheduler,
             api,
-            "HK1 User Betriebsart WW",
-            "hk1_user_op_mode_ww",
-            WW_USER_OPERATION_MODE_MAP,
-            parameter_id=274,
-            bus=1,
-            modultyp=6,
-            allow_write=allow_write,
+            devices,
+            f"HK{circuit} {parameter}",
+            parameter_id,
+            f"hk{circuit}_{slug}",
+            f"HK{circuit} {name}",
+            icon,
+            options,
+            bus=circuit,
         )
-    )
-
-    selects.append(
-        WeishauptHKConfigSelect(
-            coordinator,
-            api,
-            "HK2 User Betriebsart HK",
-            "hk2_user_op_mode_hk",
-            HK_USER_OPERATION_MODE_MAP,
-            parameter_id=274,
-            bus=2,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    selects.append(
-        WeishauptHKConfigSelect(
-            coordinator,
-            api,
-            "HK2 User Betriebsart WW",
-            "hk2_user_op_mode_ww",
-            WW_USER_OPERATION_MODE_MAP,
-            parameter_id=274,
-            bus=2,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    # HK1 holiday temperature level (P142 / ID 317)
-    selects.append(
-        WeishauptHKConfigSelect(
-            coordinator,
-            api,
-            "HK1 Urlaubstemperaturniveau",
-            "hk1_urlaubstemperaturniveau",
-            HOLIDAY_TEMP_LEVEL_MAP,
-            parameter_id=317,
-            bus=1,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
-
-    # HK2 holiday temperature level (P142 / ID 317, bus=2)
-    selects.append(
-        WeishauptHKConfigSelect(
-            coordinator,
-            api,
-            "HK2 Urlaubstemperaturniveau",
-            "hk2_urlaubstemperaturniveau",
-            HOLIDAY_TEMP_LEVEL_MAP,
-            parameter_id=317,
-            bus=2,
-            modultyp=6,
-            allow_write=allow_write,
-        )
-    )
+        for circuit in api.circuits
+        for parameter, parameter_id, slug, name, icon, options in _CIRCUIT_SELECTS
+    ]
 
+    register_entity_parameters(entry_data, selects)
     async_add_entities(selects)
 
 
 class WeishauptHKConfigSelect(CoordinatorEntity, WeishauptBaseEntity, SelectEntity):
-    """Select entity for HK1/HK2 configuration parameters."""
+    """Select entity for heating circuit configuration parameters."""
 
     _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        scheduler: WeishauptPollScheduler,
         api,
+        devices: WeishauptDevices,
         sensor_name: str,
-        slug: str,
-        value_map: dict[int, str],
         parameter_id: int,
+        slug: str,
+        name: str,
+        icon: str,
+        options: OptionMap,
         bus: int,
-        modultyp: int,
-        allow_write: bool = False,
+        modultyp: int = 6,
     ) -> None:
         """Initialize the select entity."""
 
-        CoordinatorEntity.__init__(self, coordinator)
+        # Nur auf die Gruppe des eigenen Parameters hören
+        CoordinatorEntity.__init__(self, scheduler.coordinator_for(sensor_name))
         WeishauptBaseEntity.__init__(self, api)
+        self._scheduler = scheduler
 
         self._sensor_name = sensor_name
         self._attr_unique_id = f"weishaupt_{slug}_select"
-        self._value_map = value_map
+        self._option_map = options
         self._parameter_id = parameter_id
         self._bus = bus
         self._modultyp = modultyp
-        self._allow_write = allow_write
 
         # Schönerer Anzeigename ohne "Config"-Präfix + passende Icons
-        if sensor_name == "HK1 Config HK Type":
-            self._attr_name = "HK1 HK-Typ"
-            self._attr_icon = "mdi:radiator"
-        elif sensor_name == "HK1 Config Regelvariante":
-            self._attr_name = "HK1 Regelvariante"
-            self._attr_icon = "mdi:chart-bell-curve"
-        elif sensor_name == "HK1 Config Ext Room Sensor":
-            self._attr_name = "HK1 Externer Raumfühler"
-            self._attr_icon = "mdi:home-thermometer-outline"
-        elif sensor_name == "HK2 Config HK Type":
-            self._attr_name = "HK2 HK-Typ"
-            self._attr_icon = "mdi:radiator"
-        elif sensor_name == "HK2 Config Regelvariante":
-            self._attr_name = "HK2 Regelvariante"
-            self._attr_icon = "mdi:chart-bell-curve"
-        elif sensor_name == "HK2 Config Ext Room Sensor":
-            self._attr_name = "HK2 Externer Raumfühler"
-            self._attr_icon = "mdi:home-thermometer-outline"
-        elif sensor_name == "HK1 User Betriebsart HK":
-            self._attr_name = "HK1 Betriebsart Heizung"
-            self._attr_icon = "mdi:home-thermometer"
-        elif sensor_name == "HK1 User Betriebsart WW":
-            self._attr_name = "HK1 Betriebsart Warmwasser"
-            self._attr_icon = "mdi:water-thermometer"
-        elif sensor_name == "HK2 User Betriebsart HK":
-            self._attr_name = "HK2 Betriebsart Heizung"
-            self._attr_icon = "mdi:home-thermometer"
-        elif sensor_name == "HK2 User Betriebsart WW":
-            self._attr_name = "HK2 Betriebsart Warmwasser"
-            self._attr_icon = "mdi:water-thermometer"
-        elif sensor_name == "HK1 Urlaubstemperaturniveau":
-            self._attr_name = "HK1 Urlaubstemperaturniveau"
-            self._attr_icon = "mdi:snowflake"
-        elif sensor_name == "HK2 Urlaubstemperaturniveau":
-            self._attr_name = "HK2 Urlaubstemperaturniveau"
-            self._attr_icon = "mdi:snowflake"
-        else:
-            self._attr_name = sensor_name
-
-        # Optionen: nur der rechte Teil nach dem Doppelpunkt, z.B.
-        # "Externer Raumfühler: Witterungsführung" -> "Witterungsführung"
-        self._attr_options = [self._extract_option_label(v) for v in value_map.values()]
+        self._attr_name = name
+        self._attr_icon = icon
+        # Optionen: nur der rechte Teil nach dem Doppelpunkt
+        self._attr_options = options.options
+        # Gemeinsames DeviceInfo des Heizkreises
+        self._attr_device_info = devices.device_info(sensor_name)
 
     @property
-    def device_info(self):
-        """Attach to the HK1/HK2 device group."""
-
-        slug = self._sensor_name.lower().replace(" ", "_")
-
-        if slug.startswith("hk1_"):
-            ident = "weishaupt_hk1"
-            name = "Weishaupt Heizkreis 1"
-        elif slug.startswith("hk2_"):
-            ident = "weishaupt_hk2"
-            name = "Weishaupt Heizkreis 2"
-        else:
-            ident = "weishaupt_kessel"
-            name = "Weishaupt Kessel"
-
-        return {
-            "identifiers": {(DOMAIN, ident)},
-            "name": name,
-            "manufacturer": "Weishaupt",
-            "model": "WCM-COM",
-        }
+    def current_option(self) -> str | None:
+        """Return the selected option (optimistic while a write is pending)."""
 
-    @staticmethod
-    def _extract_option_label(text: str) -> str:
-        """Strip the left label part (before ":") from a mapped string."""
-        if not isinstance(text, str):
-            return str(text)
-        if ":" in text:
-            return text.split(":", 1)[1].strip()
-        return text
+        if self._optimistic_value is not None:
+            return self._optimistic_value
+        return self._reported_value()
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the currently selected option based on coordinator data."""
+    def _reported_value(self) -> str | None:
+        """Return the option currently reported by the WCM-COM."""
 
         data = self.coordinator.data or {}
         value = data.get(self._sensor_name)
         if value is None:
             return None
-
-        # Für HK-Konfig-Sensoren liefert der Sensor bereits einen
-        # gemappten String wie "HK-Typ: int. Raumfühler" – wir mappen
-        # das auf den rechten Teil nach dem Doppelpunkt.
-        if isinstance(value, str):
-            label = self._extract_option_label(value)
-            return label if label in self._attr_options else None
-
-        # Fallback: roher Code → Mapping benutzen
-        if isinstance(value, int):
-            mapped = self._value_map.get(value)
-            return self._extract_option_label(mapped) if mapped else None
-
-        return None
+        # Roher Code oder (bei HK-Konfig-Sensoren) ein gemappter String wie
+        # "HK-Typ: int. Raumfühler" -> rechter Teil nach dem Doppelpunkt
+        return self._option_map.label(value)
 
     async def async_select_option(self, option: str) -> None:
         """Handle user selection by sending a write telegram to WCM-COM."""
 
         if not self._allow_write:
-            from homeassistant.exceptions import HomeAssistantError
             raise HomeAssistantError("Weishaupt WCM-COM integration is in read-only mode.")
 
-        # Finde den passenden Roh-Code für das gewählte Label
-        code = None
-        for k, v in self._value_map.items():
-            if self._extract_option_label(v) == option:
-                code = k
-                break
+        # Roh-Code für das gewählte Label
+        code = self._option_map.code(option)
 
         if code is None:
             _LOGGER.warning("Unknown option '%s' for %s", option, self._sensor_name)
@@ -381,14 +171,5 @@ class WeishauptHKConfigSelect(CoordinatorEntity, WeishauptBaseEntity, SelectEnti
             code,
         )
 
-        # Schreiben über die API (synchron, im Executor)
-        await self.hass.async_add_executor_job(
-            self.api.write_parameter,
-            self._parameter_id,
-            self._bus,
-            self._modultyp,
-            code,
-        )
-
-        # Nach dem Schreiben direkt ein Update anstoßen
-        await self.coordinator.async_request_refresh()
+        # Sofort optimistisch anzeigen, Bestätigung per Nachlesen
+        await self._async_write_optimistic(option, code)
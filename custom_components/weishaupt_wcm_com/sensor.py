@@ -1,7 +1,7 @@
 """Sensor platform for the Weishaupt WCM-COM integration.
 
-All sensors are backed by a shared DataUpdateCoordinator which performs
-exactly one request to the WCM-COM device per update interval.
+Each sensor is backed by the coordinator of its parameter group, so it
+updates as soon as that group's block has been read from the WCM-COM.
 """
 
 from __future__ import annotations
@@ -10,17 +10,15 @@ import logging
 from datetime import datetime
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.const import UnitOfTemperature, UnitOfTime, PERCENTAGE
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 
 from .const import (
     DOMAIN,
-    NAME_PREFIX,
     PARAMETERS,
     ERROR_CODE_KEY,
     OPERATION_MODE_MAP,
@@ -31,14 +29,28 @@ from .const import (
     HK_CONFIG_REGELVARIANTE_MAP,
     HK_CONFIG_EXT_ROOM_SENSOR_MAP,
     HK_USER_OPERATION_MODE_MAP,
-    WW_USER_OPERATION_MODE_MAP,
     EXPERT_BOILER_ADDRESS_MAP,
     HOLIDAY_TEMP_LEVEL_MAP,
+    GROUP_DATE,
 )
-from .base_entity import WeishauptBaseEntity
+from .base_entity import WeishauptBaseEntity, register_entity_parameters
+from .coordinator import WeishauptPollScheduler
+from .devices import WeishauptDevices
+from .entity_metadata import sensor_icon, sensor_is_diagnostic
+from .protocol import cascade_suffix, circuit_of, circuit_suffix, is_active
 
 _LOGGER = logging.getLogger(__name__)
 
+# HK-Konfigurations-Sensoren: Codes auf lesbare Texte abbilden
+# (Parametername ohne "HKn " -> (Map, Text für unbekannte Codes))
+_CIRCUIT_CONFIG_TEXTS = {
+    "Config Pump": (HK_CONFIG_PUMP_MAP, "Pumpe"),
+    "Config Voltage": (HK_CONFIG_VOLTAGE_MAP, "Spannung"),
+    "Config HK Type": (HK_CONFIG_HK_TYPE_MAP, "HK-Typ"),
+    "Config Regelvariante": (HK_CONFIG_REGELVARIANTE_MAP, "Regelvariante"),
+    "Config Ext Room Sensor": (HK_CONFIG_EXT_ROOM_SENSOR_MAP, "Externer Raumfühler"),
+}
+
 
 def _translation_slug(name: str) -> str:
     """Return a Home Assistant compatible translation key."""
@@ -61,14 +73,16 @@ async def async_setup_entry(
     """Set up the sensor platform for a config entry."""
 
     entry_data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: DataUpdateCoordinator = entry_data["coordinator"]
+    scheduler: WeishauptPollScheduler = entry_data["coordinator"]
     api = entry_data["api"]
+    devices: WeishauptDevices = entry_data["devices"]
 
     sensors: list[WeishauptSensor] = []
     for param in PARAMETERS:
         # Interne Rohwerte (z. B. High/Low-Bytes für Versionsnummern)
-        # sollen keine eigenen Sensoren bekommen.
-        if param.get("internal"):
+        # sollen keine eigenen Sensoren bekommen, ebenso wenig nicht
+        # konfigurierte Heizkreise und Kaskaden-Kessel.
+        if param.get("internal") or not is_active(param["name"], api.circuits, api.cascade_members):
             continue
 
         sensor_name = param["name"]
@@ -87,8 +101,9 @@ async def async_setup_entry(
         elif p_type == "minutes":
             unit = UnitOfTime.MINUTES
 
-        sensors.append(WeishauptSensor(coordinator, api, sensor_name, unit))
+        sensors.append(WeishauptSensor(scheduler, api, devices, sensor_name, unit, p_type))
 
+    register_entity_parameters(entry_data, sensors)
     async_add_entities(sensors)
 
 
@@ -97,17 +112,26 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        scheduler: WeishauptPollScheduler,
         api,
+        devices: WeishauptDevices,
         sensor_name: str,
         unit,
+        param_type: str | None = None,
     ) -> None:
         """Initialize the sensor."""
 
-        CoordinatorEntity.__init__(self, coordinator)
+        # Nur auf die Gruppe des eigenen Parameters hören
+        CoordinatorEntity.__init__(self, scheduler.coordinator_for(sensor_name))
         WeishauptBaseEntity.__init__(self, api)
+        self._scheduler = scheduler
 
         self._sensor_name = sensor_name
+        # Heizkreis (None = Kessel) und Parametername ohne "HKn " bzw.
+        # ohne "Kessel <Adresse> " bei Kaskaden-Kesseln
+        self._circuit = circuit_of(sensor_name)
+        self._suffix = circuit_suffix(sensor_name)
+        self._boiler_name = cascade_suffix(sensor_name)
         # Slug für Übersetzungs-Key und eindeutige IDs
         slug = self._sensor_name.lower().replace(" ", "_")
 
@@ -126,150 +150,31 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
         # Beispiel: weishaupt_hk1_gemischte_außentemperatur
         self._attr_unique_id = f"weishaupt_{slug}"
 
-        # Expert-/Fachmann-Werte als Diagnose-Entities kennzeichnen,
-        # damit sie im Gerät in einem eigenen Abschnitt erscheinen.
-        if slug.startswith("expert_"):
+        # Expert-/Fachmann-Werte und Firmwareversionen als Diagnose-Entities
+        # kennzeichnen, damit sie im Gerät in einem eigenen Abschnitt erscheinen.
+        if sensor_is_diagnostic(self._sensor_name):
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_icon = sensor_icon(self._sensor_name)
 
-        # Firmware-/Versionsanzeigen als Diagnose-Entities behandeln
-        if self._sensor_name in (
-            "Kessel Config Version FS",
-            "HK1 Config Version FS",
-            "HK2 Config Version FS",
-            "HK1 Config Version EM",
-            "HK2 Config Version EM",
-        ):
-            self._attr_entity_category = EntityCategory.DIAGNOSTIC
-            self._attr_icon = "mdi:chip"
-
-        # HK-Konfigurations-Sensoren: eigene Icons
-        if self._sensor_name in ("HK1 Config Pump", "HK2 Config Pump"):
-            self._attr_icon = "mdi:pump"
-        elif self._sensor_name in ("HK1 Config Voltage", "HK2 Config Voltage"):
-            self._attr_icon = "mdi:flash-triangle-outline"
-        elif self._sensor_name in ("HK1 Config HK Type", "HK2 Config HK Type"):
-            self._attr_icon = "mdi:radiator"
-        elif self._sensor_name in ("HK1 Config Regelvariante", "HK2 Config Regelvariante"):
-            self._attr_icon = "mdi:chart-bell-curve"
-        elif self._sensor_name in ("HK1 Config Ext Room Sensor", "HK2 Config Ext Room Sensor"):
-            self._attr_icon = "mdi:home-thermometer-outline"
-
-        # Kessel-/HK-Prozesswerte: Icons, wo es eindeutig ist
-        if self._sensor_name == "Status":
-            self._attr_icon = "mdi:alert-circle-outline"
-        elif self._sensor_name == "Außentemperatur":
-            self._attr_icon = "mdi:thermometer"
-        elif self._sensor_name == "Warmwassertemperatur":
-            self._attr_icon = "mdi:thermometer-water"
-        elif self._sensor_name == "Flamme":
-            self._attr_icon = "mdi:fire"
-        elif self._sensor_name == "Heizung":
-            self._attr_icon = "mdi:radiator"
-        elif self._sensor_name == "Warmwasser":
-            self._attr_icon = "mdi:water-thermometer"
-        elif self._sensor_name == "Kesseltemperatur":
-            self._attr_icon = "mdi:thermometer"
-        elif self._sensor_name == "Betriebsphase":
-            self._attr_icon = "mdi:cog-play"
-        elif self._sensor_name == "Puffer Oben":
-            self._attr_icon = "mdi:thermometer-lines"
-        elif self._sensor_name == "Laststellung":
-            self._attr_icon = "mdi:chart-line"
-        elif self._sensor_name == "Gedämpfte Außentemperatur":
-            self._attr_icon = "mdi:thermometer"
-        elif self._sensor_name == "Schaltspielzahl Brenner":
-            self._attr_icon = "mdi:counter"
-        elif self._sensor_name == "Betriebsstunden Brenner":
-            self._attr_icon = "mdi:clock-time-eight-outline"
-        elif self._sensor_name == "Zeit seit letzter Wartung":
-            self._attr_icon = "mdi:calendar-clock"
-
-        # Systemzeit / Datum / Holiday / DST (abgeleitete Textsensoren)
-        elif self._sensor_name == "System Date":
-            self._attr_icon = "mdi:calendar-clock"
-        elif self._sensor_name == "System Time":
-            self._attr_icon = "mdi:clock-time-four-outline"
-        elif self._sensor_name in ("HK1 Holiday Start", "HK1 Holiday End", "HK2 Holiday Start", "HK2 Holiday End"):
-            self._attr_icon = "mdi:calendar-star"
-        elif self._sensor_name in ("HK1 Urlaubstemperaturniveau", "HK2 Urlaubstemperaturniveau"):
-            self._attr_icon = "mdi:snowflake"
-        elif self._sensor_name in ("DST Start", "DST End"):
-            self._attr_icon = "mdi:calendar-clock"
-
-        elif self._sensor_name in ("HK1 Gemischte Außentemperatur", "HK2 Gemischte Außentemperatur"):
-            self._attr_icon = "mdi:thermometer"
-        elif self._sensor_name in ("HK1 Raumtemperatur", "HK2 Raumtemperatur"):
-            self._attr_icon = "mdi:home-thermometer"
-        elif self._sensor_name in ("HK1 Vorlauftemperatur", "HK2 Vorlauftemperatur"):
-            self._attr_icon = "mdi:thermometer"
-        elif self._sensor_name in ("HK1 Warmwassertemperatur", "HK2 Warmwassertemperatur"):
-            self._attr_icon = "mdi:thermometer-water"
-        elif self._sensor_name in ("HK1 Zirkulationstemperatur", "HK2 Zirkulationstemperatur"):
-            self._attr_icon = "mdi:pipe"
-        elif self._sensor_name in ("HK1 Solltemperatur", "HK2 Solltemperatur", "HK1 Solltemperatur System", "HK2 Solltemperatur System"):
-            self._attr_icon = "mdi:thermostat"
+        # Gemeinsames DeviceInfo des Geräts (Kessel, Kaskaden-Kessel bzw. Heizkreis)
+        self._attr_device_info = devices.device_info(self._sensor_name)
+        self._param_type = param_type
 
         # Entity-ID wird von Home Assistant aus name/unique_id generiert.
         # Wir erzwingen sie NICHT manuell, um Probleme mit Umlauten
         # und zukünftigen Slug-Regeln zu vermeiden.
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for grouping sensors (Kessel, HK1, HK2)."""
+    def _date_reference(self) -> datetime:
+        """Return the time the date group was read (falls back to now).
 
-        slug = self._sensor_name.lower().replace(" ", "_")
+        Die Datumsgruppe wird in der langsamen Stufe abgefragt. Für den
+        Abgleich mit der WCM-Uhr zählt daher der Abrufzeitpunkt, nicht "jetzt".
+        """
 
-        data = self.coordinator.data or {}
-        sw_version: str | None = None
-
-        # FS/EM-Versionen auf die jeweiligen Geräte mappen:
-        # - Kessel: EM-Version (falls vorhanden)
-        # - HK1/HK2: FS-Version des jeweiligen Heizkreises
-        if slug.startswith("hk1_"):
-            ident = "weishaupt_hk1"
-            name = "Weishaupt Heizkreis 1"
-            fs = data.get("HK1 Config Version FS")
-            em = data.get("HK1 Config Version EM")
-            if fs and em:
-                sw_version = f"FS {fs}, EM {em}"
-            elif fs:
-                sw_version = f"FS {fs}"
-            elif em:
-                sw_version = f"EM {em}"
-        elif slug.startswith("hk2_"):
-            ident = "weishaupt_hk2"
-            name = "Weishaupt Heizkreis 2"
-            fs = data.get("HK2 Config Version FS")
-            em = data.get("HK2 Config Version EM")
-            if fs and em:
-                sw_version = f"FS {fs}, EM {em}"
-            elif fs:
-                sw_version = f"FS {fs}"
-            elif em:
-                sw_version = f"EM {em}"
-        else:
-            # Kessel + Fachmann-Werte im selben Gerät "Weishaupt Kessel" bündeln
-            ident = "weishaupt_kessel"
-            name = "Weishaupt Kessel"
-            fs = data.get("Kessel Config Version FS")
-            em = None  # Bus 0 EM ist bei dir N/V
-            if fs and em:
-                sw_version = f"FS {fs}, EM {em}"
-            elif fs:
-                sw_version = f"FS {fs}"  # z.B. "FS 327.30"
-
-        info_kwargs = {
-            "identifiers": {(DOMAIN, ident)},
-            "name": name,
-            "manufacturer": "Weishaupt",
-            "model": "WCM-COM",
-        }
-
-        # Firmware-Version nur setzen, wenn wir einen String haben
-        if isinstance(sw_version, str) and sw_version:
-            info_kwargs["sw_version"] = sw_version
-
-        return DeviceInfo(**info_kwargs)
+        fetched_at = self.api.group_fetched_at(GROUP_DATE)
+        if fetched_at is None:
+            return datetime.now()
+        return datetime.fromtimestamp(fetched_at)
 
     @property
     def native_value(self):
@@ -291,7 +196,7 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
                 try:
                     year = 2000 + int(year_raw)
                     d = datetime(year, int(month), int(day))
-                    today = datetime.now().date()
+                    today = self._date_reference().date()
                     # Health-Check: Datum muss mit dem echten Systemdatum übereinstimmen,
                     # sonst geben wir das WCM-Datum als YYYY-MM-DD aus.
                     self._attr_available = True
@@ -315,7 +220,7 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
                         self._attr_available = False
                         return None
 
-                    now = datetime.now()
+                    now = self._date_reference()
                     wcm_minutes = h * 60 + m
                     now_minutes = now.hour * 60 + now.minute
                     drift = abs(now_minutes - wcm_minutes)
@@ -329,10 +234,10 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
                     self._attr_available = False
                     return None
 
-            if self._sensor_name == "HK1 Holiday Start":
-                day = data.get("HK1 Holiday Start Day")
-                month = data.get("HK1 Holiday Start Month")
-                year_raw = data.get("HK1 Holiday Start Year")
+            if self._circuit and self._suffix in ("Holiday Start", "Holiday End"):
+                day = data.get(f"{self._sensor_name} Day")
+                month = data.get(f"{self._sensor_name} Month")
+                year_raw = data.get(f"{self._sensor_name} Year")
                 # Jahr 0 bedeutet "nicht gesetzt"
                 if not year_raw:
                     self._attr_available = True
@@ -348,70 +253,8 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
                     self._attr_available = False
                     return None
 
-            if self._sensor_name == "HK1 Holiday End":
-                day = data.get("HK1 Holiday End Day")
-                month = data.get("HK1 Holiday End Month")
-                year_raw = data.get("HK1 Holiday End Year")
-                if not year_raw:
-                    self._attr_available = True
-                    return "--"
-                if not day or not month:
-                    self._attr_available = False
-                    return None
-                year = 2000 + year_raw
-                try:
-                    self._attr_available = True
-                    return f"{year:04d}-{int(month):02d}-{int(day):02d}"
-                except (TypeError, ValueError):
-                    self._attr_available = False
-                    return None
-
-            if self._sensor_name == "HK1 Urlaubstemperaturniveau":
-                level = data.get("HK1 Holiday Temp Level")
-                if level is None:
-                    self._attr_available = False
-                    return None
-                self._attr_available = True
-                return HOLIDAY_TEMP_LEVEL_MAP.get(level, f"Unknown ({level})")
-
-            if self._sensor_name == "HK2 Holiday Start":
-                day = data.get("HK2 Holiday Start Day")
-                month = data.get("HK2 Holiday Start Month")
-                year_raw = data.get("HK2 Holiday Start Year")
-                if not year_raw:
-                    self._attr_available = True
-                    return "--"
-                if not day or not month:
-                    self._attr_available = False
-                    return None
-                year = 2000 + year_raw
-                try:
-                    self._attr_available = True
-                    return f"{year:04d}-{int(month):02d}-{int(day):02d}"
-                except (TypeError, ValueError):
-                    self._attr_available = False
-                    return None
-
-            if self._sensor_name == "HK2 Holiday End":
-                day = data.get("HK2 Holiday End Day")
-                month = data.get("HK2 Holiday End Month")
-                year_raw = data.get("HK2 Holiday End Year")
-                if not year_raw:
-                    self._attr_available = True
-                    return "--"
-                if not day or not month:
-                    self._attr_available = False
-                    return None
-                year = 2000 + year_raw
-                try:
-                    self._attr_available = True
-                    return f"{year:04d}-{int(month):02d}-{int(day):02d}"
-                except (TypeError, ValueError):
-                    self._attr_available = False
-                    return None
-
-            if self._sensor_name == "HK2 Urlaubstemperaturniveau":
-                level = data.get("HK2 Holiday Temp Level")
+            if self._circuit and self._suffix == "Urlaubstemperaturniveau":
+                level = data.get(f"HK{self._circuit} Holiday Temp Level")
                 if level is None:
                     self._attr_available = False
                     return None
@@ -455,34 +298,26 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
             self._attr_available = True
 
             # Special handling for certain sensors
-            if self._sensor_name == ERROR_CODE_KEY:
+            if self._boiler_name == ERROR_CODE_KEY:
                 # Map error codes to human readable text
                 return self.api.process_codes(value)
 
-            if self._sensor_name == "Betriebsmodus":
+            if self._boiler_name == "Betriebsmodus":
                 return OPERATION_MODE_MAP.get(
                     value,
                     f"Unbekannter Modus ({value})",
                 )
 
-            if self._sensor_name == "Betriebsphase":
+            if self._boiler_name == "Betriebsphase":
                 return OPERATION_PHASE_MAP.get(
                     value,
                     f"Unbekannte Phase ({value})",
                 )
 
-            # HK/WW user operation modes (Form_Heizung_Benutzer): Codes → Texte
-            if self._sensor_name in (
-                "HK1 User Betriebsart HK",
-                "HK2 User Betriebsart HK",
-            ):
+            # HK user operation mode (Form_Heizung_Benutzer): Codes → Texte
+            if self._circuit and self._suffix == "User Betriebsart HK":
                 return HK_USER_OPERATION_MODE_MAP.get(value, f"Code {value}")
 
-            if self._sensor_name in (
-                "HK1 User Betriebsart WW",
-                "HK2 User Betriebsart WW",
-            ):
-                return WW_USER_OPERATION_MODE_MAP.get(value, f"Code {value}")
 
             # Virtuelle, human readable Sensoren (Date/Time/Holiday/DST)
             if self._sensor_name == "System Date":
@@ -508,41 +343,6 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
                 except (TypeError, ValueError):
                     return "--:--"
 
-            if self._sensor_name == "HK1 Holiday Start":
-                day = data.get("HK1 Holiday Start Day")
-                month = data.get("HK1 Holiday Start Month")
-                year_raw = data.get("HK1 Holiday Start Year")
-                # Jahr 0 bedeutet "nicht gesetzt"
-                if not year_raw:
-                    return "--"
-                year = 2000 + year_raw
-                if not day or not month:
-                    return "--"
-                try:
-                    return f"{year:04d}-{int(month):02d}-{int(day):02d}"
-                except (TypeError, ValueError):
-                    return "--"
-
-            if self._sensor_name == "HK1 Holiday End":
-                day = data.get("HK1 Holiday End Day")
-                month = data.get("HK1 Holiday End Month")
-                year_raw = data.get("HK1 Holiday End Year")
-                if not year_raw:
-                    return "--"
-                year = 2000 + year_raw
-                if not day or not month:
-                    return "--"
-                try:
-                    return f"{year:04d}-{int(month):02d}-{int(day):02d}"
-                except (TypeError, ValueError):
-                    return "--"
-
-            if self._sensor_name == "HK1 Holiday Temp Level Text":
-                level = data.get("HK1 Holiday Temp Level")
-                if level is None:
-                    return None
-                return HOLIDAY_TEMP_LEVEL_MAP.get(level, f"Unknown ({level})")
-
             if self._sensor_name == "DST Start":
                 day = data.get("DST Start Day")
                 month = data.get("DST Start Month")
@@ -565,20 +365,9 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
                     return "--"
 
             # HK-Konfigurations-Sensoren: Codes auf lesbare Texte abbilden
-            if self._sensor_name in ("HK1 Config Pump", "HK2 Config Pump"):
-                return HK_CONFIG_PUMP_MAP.get(value, f"Pumpe (Code {value})")
-
-            if self._sensor_name in ("HK1 Config Voltage", "HK2 Config Voltage"):
-                return HK_CONFIG_VOLTAGE_MAP.get(value, f"Spannung (Code {value})")
-
-            if self._sensor_name in ("HK1 Config HK Type", "HK2 Config HK Type"):
-                return HK_CONFIG_HK_TYPE_MAP.get(value, f"HK-Typ (Code {value})")
-
-            if self._sensor_name in ("HK1 Config Regelvariante", "HK2 Config Regelvariante"):
-                return HK_CONFIG_REGELVARIANTE_MAP.get(value, f"Regelvariante (Code {value})")
-
-            if self._sensor_name in ("HK1 Config Ext Room Sensor", "HK2 Config Ext Room Sensor"):
-                return HK_CONFIG_EXT_ROOM_SENSOR_MAP.get(value, f"Externer Raumfühler (Code {value})")
+            if self._circuit and self._suffix in _CIRCUIT_CONFIG_TEXTS:
+                mapping, fallback = _CIRCUIT_CONFIG_TEXTS[self._suffix]
+                return mapping.get(value, f"{fallback} (Code {value})")
 
             # Fachmann-Adresse (P12 / ID 376) als 1/A/B/C/D/E darstellen
             if self._sensor_name == "Expert Boiler Address":
@@ -593,10 +382,7 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
 
             # Fachmann / Heizung – Ein Opti MAX (ID 272): Rohwert = 15-Minuten-Blöcke
             # Die Sensoransicht soll – genau wie die Number-Entity – echte Minuten anzeigen.
-            if self._sensor_name in (
-                "HK1 Expert Ein Opti MAX",
-                "HK2 Expert Ein Opti MAX",
-            ):
+            if self._circuit and self._suffix == "Expert Ein Opti MAX":
                 try:
                     return float(value) * 15.0
                 except (TypeError, ValueError):
@@ -604,10 +390,7 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
 
             # Fachmann / Heizung – Frostheizgrenze (ID 702): Rohwert 10 = "nicht gesetzt".
             # In der Sensor-Ansicht behandeln wir diesen Sentinel wie in den Number-Entities.
-            if self._sensor_name in (
-                "HK1 Expert Frostheizgrenze",
-                "HK2 Expert Frostheizgrenze",
-            ):
+            if self._circuit and self._suffix == "Expert Frostheizgrenze":
                 try:
                     raw = float(value)
                 except (TypeError, ValueError):
@@ -622,10 +405,7 @@ class WeishauptSensor(CoordinatorEntity, WeishauptBaseEntity, SensorEntity):
 
                 return raw
 
-            param_type = next(
-                (p["type"] for p in PARAMETERS if p["name"] == self._sensor_name),
-                None,
-            )
+            param_type = self._param_type
 
             if param_type == "binary":
                 return "Ein" if value else "Aus"
@@ -0,0 +1,56 @@
+"""Persisted snapshot cache for the Weishaupt WCM-COM integration.
+
+Der letzte Snapshot samt letzten gültigen Werten wird in einem HA-Store
+abgelegt, damit die Entitäten nach einem Neustart sofort Werte haben und
+die erste Live-Abfrage im Hintergrund laufen kann.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_VERSION
+from .weishaupt_api import WeishauptAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WeishauptSnapshotStore:
+    """Load and (debounced) save the API snapshot of one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, api: WeishauptAPI) -> None:
+        """Initialize the store."""
+        self.api = api
+        self._store: Store[dict] = Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+
+    async def async_load(self) -> bool:
+        """Restore the persisted snapshot into the API; return True if one was found."""
+
+        try:
+            snapshot = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Cannot load cached WCM-COM snapshot: %s", err)
+            return False
+
+        if not snapshot or not snapshot.get("data"):
+            return False
+        self.api.restore_snapshot(snapshot)
+        _LOGGER.debug("Restored %s cached WCM-COM values", len(self.api.data))
+        return True
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the snapshot after SNAPSHOT_SAVE_DELAY (coalesces updates)."""
+        self._store.async_delay_save(self.api.export_snapshot, SNAPSHOT_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save the snapshot now (on unload)."""
+        if self.api.data:
+            await self._store.async_save(self.api.export_snapshot())
+
+    async def async_remove(self) -> None:
+        """Remove the stored snapshot (when the entry is deleted)."""
+        await self._store.async_remove()
@@ -0,0 +1,92 @@
+"""Water heater platform for Weishaupt WCM-COM hot water.
+
+Eine Warmwasser-Entität pro Heizkreis aus der Sicht des Heizkreises:
+Warmwassertemperatur (am Heizkreis, sonst am Kessel). Weder einen WW-Sollwert
+noch eine eigene Adresse für die Betriebsart WW kennt der Katalog bisher
+(274 ist die Betriebsart HK), daher ist die Entität nur lesbar.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.components.water_heater import WaterHeaterEntity, WaterHeaterEntityFeature
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTemperature
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .base_entity import WeishauptBaseEntity, register_entity_parameters
+from .circuits import CircuitView, circuit_view_parameters
+from .const import DOMAIN
+from .coordinator import WeishauptCircuitCoordinator, WeishauptPollScheduler
+from .devices import WeishauptDevices
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up one water heater entity per heating circuit."""
+
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    scheduler: WeishauptPollScheduler = entry_data["coordinator"]
+    devices: WeishauptDevices = entry_data["devices"]
+
+    entities = [
+        WeishauptHotWater(scheduler, entry_data["api"], devices, coordinator)
+        for coordinator in scheduler.circuit_coordinators.values()
+    ]
+
+    register_entity_parameters(entry_data, entities)
+    async_add_entities(entities)
+
+
+class WeishauptHotWater(CoordinatorEntity, WeishauptBaseEntity, WaterHeaterEntity):
+    """Hot water of a heating circuit as a water heater entity."""
+
+    _attr_supported_features = WaterHeaterEntityFeature(0)
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_icon = "mdi:water-thermometer"
+
+    def __init__(
+        self,
+        scheduler: WeishauptPollScheduler,
+        api,
+        devices: WeishauptDevices,
+        coordinator: WeishauptCircuitCoordinator,
+    ) -> None:
+        """Initialize the water heater entity."""
+
+        CoordinatorEntity.__init__(self, coordinator)
+        WeishauptBaseEntity.__init__(self, api)
+        self._scheduler = scheduler
+
+        circuit = coordinator.circuit
+        self._attr_name = f"HK{circuit} Warmwasser"
+        self._attr_unique_id = f"weishaupt_hk{circuit}_water_heater"
+        self._attr_device_info = devices.device_info(f"HK{circuit} Warmwasser")
+
+    @property
+    def parameter_names(self) -> list[str]:
+        """Return the parameters the circuit view is built from."""
+        return circuit_view_parameters(self.coordinator.circuit)
+
+    @property
+    def _view(self) -> CircuitView:
+        """Return the current view of the heating circuit."""
+        return self.coordinator.data
+
+    @property
+    def available(self) -> bool:
+        """Return True once the hot water temperature is known."""
+        return super().available and self._view.hot_water_temperature is not None
+
+    @property
+    def current_temperature(self) -> float | None:
+        """Return the hot water temperature."""
+        return self._view.hot_water_temperature
@@ -1,464 +1,593 @@
-"""Weishaupt API for WCM-COM communication."""
+"""Weishaupt API for WCM-COM communication.
+
+Snapshot, Polling-Stufen und Schreibpfad; Katalog, Telegramme und Transport
+kommen aus dem HA-freien Modul ``protocol``.
+"""
 import logging
 import json
-import requests
+import time
 import threading
-from requests.auth import HTTPDigestAuth
-from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import PARAMETERS, ERROR_CODE_MAP, WARNING_CODE_MAP
+from .const import (
+    PARAMETERS,
+    GROUP_POLL_TIERS,
+    POLL_TIER_FAST,
+    DEFAULT_HEATING_CIRCUITS,
+    DEFAULT_CASCADE_MEMBERS,
+)
+from .protocol import (
+    CIRCUIT_DETECTION_PARAMETERS,
+    HEARTBEAT_PARAMETERS,
+    MAX_TELEGRAMS_PER_REQUEST,
+    REQUEST_TIMEOUT,
+    WeishauptAuthError,
+    WeishauptBusyError,
+    WeishauptConnectionError,
+    WeishauptError,
+    WeishauptResponseError,
+    build_telegram,
+    active_parameter_groups,
+    circuit_of,
+    compute_versions,
+    decode_telegram,
+    find_parameter,
+    pack_telegrams,
+    post_telegrams,
+    process_code,
+    read_telegram,
+    resolve_parameters,
+    telegram_address,
+    telegram_code,
+    write_telegram,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 # Lock initialisieren, um sicherzustellen, dass nur eine Anfrage gleichzeitig erfolgt
 _lock = threading.Lock()
 
-class WeishauptAPI(RestoreEntity):
+# Toleranz in Sekunden, damit eine Gruppe wegen Jitter im Coordinator-Takt
+# nicht erst einen ganzen Zyklus später fällig wird.
+_DUE_TOLERANCE = 2.0
+
+
+# Timeout für den Heartbeat – kurz, damit er den Takt nicht aufhält
+_HEARTBEAT_TIMEOUT = 10
+
+# Timeout für den Verbindungstest im Config Flow
+_PROBE_TIMEOUT = 10
+
+# Timeout für reguläre Requests (das Gerät ist träge) und Untergrenze, wenn
+# das Zeitbudget eines Zyklus fast aufgebraucht ist
+_REQUEST_TIMEOUT = REQUEST_TIMEOUT
+_MIN_REQUEST_TIMEOUT = 5
+
+
+class WeishauptAPI:
     """API class for interacting with the Weishaupt WCM-COM."""
 
-    def __init__(self, host, username=None, password=None, advanced_logging: bool = False):
+    def __init__(
+        self,
+        host,
+        username=None,
+        password=None,
+        advanced_logging: bool = False,
+        tier_intervals: dict[str, int] | None = None,
+        write_skip_max_age: int = 0,
+        circuits=DEFAULT_HEATING_CIRCUITS,
+        cascade_members=DEFAULT_CASCADE_MEMBERS,
+    ):
         """Initialize the API."""
         self._host = host
         self._username = username
         self._password = password
         self._data = {}
         self.previous_values = {}
-        self._state = None
         # Optionaler Modus für zusätzliche Debug-Logs
         self.advanced_logging = advanced_logging
-
-    async def async_added_to_hass(self):
-        await super().async_added_to_hass()
-        if (old_state := await self.async_get_last_state()) is not None:
-            self._data = old_state.attributes.get("data", {})
-            self.previous_values = old_state.attributes.get("previous_values", {})
+        # Abfrageintervall je Polling-Stufe in Sekunden. Die schnelle Stufe
+        # (0) wird bei jedem Update abgefragt, also im Coordinator-Takt.
+        self._tier_intervals: dict[str, int] = {POLL_TIER_FAST: 0}
+        if tier_intervals:
+            self._tier_intervals.update(tier_intervals)
+        # Zeitpunkt des letzten erfolgreichen Abrufs je Gruppe
+        # (monotonic für die Planung, Wall-Clock für Plausibilitätsprüfungen)
+        self._group_last_fetch: dict[str, float] = {}
+        self._group_fetched_at: dict[str, float] = {}
+        # Zuletzt gelesener Rohcode je Telegramm-Adresse (modultyp, bus, id)
+        # samt Zeitpunkt (monotonic), um wirkungslose Writes zu erkennen
+        self._raw_codes: dict[tuple[int, int, int], tuple[int, float]] = {}
+        self.write_skip_max_age = write_skip_max_age
+        self.skipped_writes = 0
+        # Aktive Heizkreise und Kaskaden-Kessel (Adresscode); nur deren
+        # Parameter werden abgefragt
+        self.circuits = tuple(sorted(circuits))
+        self.cascade_members = tuple(sorted(cascade_members))
+        self._groups = active_parameter_groups(self.circuits, self.cascade_members)
 
     @property
     def data(self):
         """Return the latest data."""
         return self._data
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
+    def export_snapshot(self) -> dict:
+        """Return the snapshot, last-good values and fetch times for persisting."""
         return {
-            "data": self._data,
-            "previous_values": self.previous_values
+            "data": dict(self._data),
+            "previous_values": dict(self.previous_values),
+            "fetched_at": dict(self._group_fetched_at),
         }
 
-    def update(self):
-        """Fetch new data from the WCM-COM."""
-        # Logik zur Datenabfrage mit Synchronisierung
+    def restore_snapshot(self, snapshot: dict) -> None:
+        """Load a persisted snapshot before the first live poll.
+
+        Langsame Gruppen, deren gespeicherter Abruf noch innerhalb ihres
+        Intervalls liegt, gelten als frisch und werden beim Start nicht sofort
+        gelesen; Prozesswerte werden immer live abgefragt.
+        """
+
+        self._data = dict(snapshot.get("data") or {})
+        self.previous_values = dict(snapshot.get("previous_values") or {})
+
+        now = time.time()
+        monotonic_now = time.monotonic()
+        for group, fetched_at in (snapshot.get("fetched_at") or {}).items():
+            age = now - fetched_at
+            if group not in self._groups or GROUP_POLL_TIERS[group] == POLL_TIER_FAST or age < 0:
+                continue
+            self._group_fetched_at[group] = fetched_at
+            self._group_last_fetch[group] = monotonic_now - age
+
+    def set_tier_intervals(self, tier_intervals: dict[str, int]) -> None:
+        """Update the refresh interval (seconds) of one or more polling tiers."""
+        self._tier_intervals.update(tier_intervals)
+
+    def due_groups(self) -> list[str]:
+        """Return the due parameter groups, most overdue first.
+
+        Überfälligkeit = Zeit seit dem letzten Abruf / Zielintervall der Stufe.
+        Nie abgefragte Gruppen kommen zuerst; bei Gleichstand bleibt die
+        Reihenfolge der Parametergruppen erhalten.
+        """
+
+        now = time.monotonic()
+        due = []
+        for group in self._groups:
+            interval = self._tier_intervals.get(GROUP_POLL_TIERS[group], 0)
+            last = self._group_last_fetch.get(group)
+            if last is None:
+                due.append((float("inf"), group))
+                continue
+            elapsed = now - last
+            if elapsed >= interval - _DUE_TOLERANCE:
+                due.append((elapsed / max(interval, 1), group))
+
+        due.sort(key=lambda item: item[0], reverse=True)
+        return [group for _, group in due]
+
+    def next_due_in(self) -> float | None:
+        """Return the seconds until the next polled group becomes due.
+
+        Nie oder erfolglos abgefragte Gruppen zählen nicht: sie werden im
+        regulären Takt erneut versucht, nicht schneller.
+        """
+
+        now = time.monotonic()
+        waits = [
+            max(0.0, last + self._tier_intervals.get(GROUP_POLL_TIERS[group], 0) - _DUE_TOLERANCE - now)
+            for group, last in self._group_last_fetch.items()
+            if group in self._groups
+        ]
+        return min(waits, default=None)
+
+    def invalidate_group(self, group: str) -> None:
+        """Mark a parameter group as due so the next update fetches it."""
+        self._group_last_fetch.pop(group, None)
+
+    def invalidate_tier(self, tier: str) -> None:
+        """Mark every group of a polling tier as due."""
+        for group, group_tier in GROUP_POLL_TIERS.items():
+            if group_tier == tier:
+                self.invalidate_group(group)
+
+    def invalidate_parameter(self, parameter_id: int, bus: int, modultyp: int) -> None:
+        """Mark every group containing the given parameter as due.
+
+        Prefers an exact telegram address match; falls back to the parameter
+        id alone so that writes with a generic address still refresh the
+        right group.
+        """
+
+        groups = {
+            group
+            for group, params in self._groups.items()
+            for p in params
+            if p["id"] == parameter_id and telegram_address(p) == (modultyp, bus)
+        }
+        if not groups:
+            groups = {
+                group
+                for group, params in self._groups.items()
+                for p in params
+                if p["id"] == parameter_id
+            }
+        for group in groups:
+            self.invalidate_group(group)
+
+    def group_fetched_at(self, group: str) -> float | None:
+        """Return the wall-clock timestamp of the last successful fetch of a group."""
+        return self._group_fetched_at.get(group)
+
+    def update_group(self, group: str, deadline: float | None = None) -> bool:
+        """Fetch a single parameter group; return True on success.
+
+        ``deadline`` (time.monotonic()) bounds timeouts and retries so that a
+        slow device cannot stretch a budgeted poll cycle indefinitely.
+        """
         with _lock:
-            self._fetch_data()
+            return group in self._fetch_data([group], deadline)
+
+    def heartbeat(self) -> bool:
+        """Read the heartbeat values; return True if a value changed.
 
-    def get_data(self):
-        """Fetch and return data from WCM-COM (used for testing connectivity)."""
-        # Verwende dieselbe Methode wie update(), um Daten abzurufen
+        If the heartbeat differs from the current snapshot, the fast tier
+        should be refreshed immediately instead of waiting for its interval.
+        """
         with _lock:
-            self._fetch_data()
-        return self._data
+            return self._fetch_heartbeat()
 
-    def _fetch_data(self):
-        """Actual data fetching logic."""
-        _LOGGER.debug("Fetching new data")
-        ENDPOINT = "/parameter.json"
+    def read_parameters(self, names) -> dict:
+        """Read only the given parameters and merge them into the snapshot.
 
-        # Build CoCo telegrams based on parameter metadata and original
-        # Elster webApp format (see webApp.js / OBJTELEGRAMM).
-        #
-        # Index mapping:
-        #   0: TEL_MODULTYP   (module type / destination)
-        #   1: TEL_BUSKENNUNG (bus id / Heizkreis)
-        #   2: TEL_COMMAND    (1 = read)
-        #   3: TEL_INFONR     (parameter id)
-        #   4: TEL_INDEX      (unused here)
-        #   5: TEL_PROT       (unused here)
-        #   6: TEL_DATA low   (0 for read)
-        #   7: TEL_DATA high  (0 for read)
-
-        def build_telegram(params):
-            telegram = {"prot": "coco", "telegramm": []}
-            for param in params:
-                # Default behaviour (existing implementation): use destination=10
-                # as module type and no specific bus assignment.
-                modultyp = param.get("destination", 10)
-                bus = 0
-
-                # Special handling for Heizkreis-Prozesswerte where the original
-                # web UI uses a concrete module type and bus id (HK1 = bus 1, ...).
-                if "modultyp" in param:
-                    modultyp = param["modultyp"]
-                if "bus" in param:
-                    bus = param["bus"]
-
-                telegram["telegramm"].append([
-                    modultyp,      # TEL_MODULTYP
-                    bus,           # TEL_BUSKENNUNG
-                    1,             # TEL_COMMAND (read)
-                    param["id"],  # TEL_INFONR
-                    0,             # TEL_INDEX
-                    0,             # TEL_PROT
-                    0,             # TEL_DATA low
-                    0,             # TEL_DATA high
-                ])
-            return telegram
-
-        # Split in mehrere Requests, damit der WCM-COM alle Telegramme
-        # beantwortet (begrenzte Anzahl pro Antwort).
-        #  - globale Prozesswerte (Kessel)
-        #  - Heizkreis-Prozesswerte (HK1/HK2)
-        #  - Heizkreis-Konfig-Parameter (Pumpen, Spannungen, HK-Typ, Ext. Fühler)
-        #  - HK-User-Parameter (Betriebsarten & User-Temperaturen)
-        #  - Fachmann-/Expert-Parameter (P10, P12, P18, ...)
-        global_params = [
-            p for p in PARAMETERS
-            if "bus" not in p and "modultyp" not in p and not p["name"].startswith("Expert ") and not p.get("virtual")
-        ]
-        expert_params = [
-            p for p in PARAMETERS
-            if p["name"].startswith("Expert ")
-        ]
-        # Heizkreis-Prozesswerte (Temperaturen/Sollwerte) priorisieren, damit sie
-        # bei begrenzter Telegrammzahl nicht von zusätzlichen Konfig/User-Parametern
-        # verdrängt werden.
-        hk_process_params = [
-            p
-            for p in PARAMETERS
-            if ("bus" in p or "modultyp" in p)
-            and not p["name"].startswith("HK1 Config")
-            and not p["name"].startswith("HK2 Config")
-            and not p["name"].startswith("HK1 User")
-            and not p["name"].startswith("HK2 User")
-            and not p.get("internal")
-            and not p.get("virtual")
-        ]
+        All parameters go into as few requests as possible (usually one).
+        Returns the decoded values by parameter name; raises WeishauptError
+        if the device does not answer.
+        """
 
-        # Spezielle Gruppe für HK1 Holiday Temp Level + System Date/Time + DST,
-        # damit diese nicht in einem übervollen Prozess-Telegramm untergehen.
-        date_params = [
-            p
-            for p in PARAMETERS
-            if not p.get("virtual")
-            and (
-                p["name"].startswith("System Date ")
-                or p["name"].startswith("System Time ")
-                or p["name"].startswith("DST ")
-                or p["name"] == "HK1 Holiday Temp Level"
-            )
-        ]
-        # Versions-Parameter (FS/EM High/Low) separat abfragen, damit sie immer
-        # vollständig geliefert werden.
-        hk_version_params = [
-            p
-            for p in PARAMETERS
-            if p.get("internal")
-            and "Version" in p["name"]
-        ]
-        # HK-Konfig (Pumpen/Spannung/HK-Typ/Ext. Raumfühler etc., inkl. HKx User Betriebsart)
-        hk_config_params = [
-            p
-            for p in PARAMETERS
-            if ("bus" in p or "modultyp" in p)
-            and p not in hk_process_params
-            and p not in hk_version_params
-            and not p["name"].startswith("HK1 User ")
-            and not p["name"].startswith("HK2 User ")
-        ]
-        # HK-Userparameter (Form_Heizung_Benutzer) explizit trennen, damit sie
-        # in eigenen, kleinen Requests wie in der Original-WebApp abgefragt werden.
-        hk_user_params = [
-            p
-            for p in PARAMETERS
-            if p["name"].startswith("HK1 User ") or p["name"].startswith("HK2 User ")
-        ]
+        params = resolve_parameters(names)
+        with _lock:
+            return self._read_params(params)
 
-        url = f"http://{self._host}{ENDPOINT}"
+    def read_telegrams(self, addresses) -> list[dict]:
+        """Read arbitrary (modultyp, bus, id) addresses, also outside PARAMETERS.
+
+        Wie read_parameters in so wenigen Requests wie möglich und unter
+        demselben Lock; bekannte Parameter landen zusätzlich im Snapshot.
+        Returns one entry per response telegram with the raw code and, for
+        known parameters, the decoded name and value.
+        """
 
-        # Check if authentication is required
-        if self._username and self._password:
-            auth = HTTPDigestAuth(self._username, self._password)
+        telegrams = [read_telegram(modultyp, bus, parameter_id) for modultyp, bus, parameter_id in addresses]
+        results = []
+        values = {}
+        with _lock:
+            for start in range(0, len(telegrams), MAX_TELEGRAMS_PER_REQUEST):
+                for message in self._post_telegrams(telegrams[start:start + MAX_TELEGRAMS_PER_REQUEST]):
+                    if not isinstance(message, list) or len(message) < 7:
+                        continue
+                    decoded = self._decode_message(message)
+                    if decoded is not None:
+                        values[decoded[0]] = decoded[1]
+                    results.append(self._describe_telegram(message, decoded))
+            self._merge_values(values)
+        return results
+
+    def raw_code(self, parameter_id: int, bus: int, modultyp: int) -> int | None:
+        """Return the last raw code read or echoed for an address."""
+        cached = self._raw_codes.get((modultyp, bus, parameter_id))
+        return cached[0] if cached else None
+
+    @staticmethod
+    def _describe_telegram(message, decoded) -> dict:
+        """Describe a response telegram for the raw telegram services."""
+
+        result = {"modultyp": message[0], "bus": message[1], "id": message[3]}
+        raw = telegram_code(message)
+        if raw is not None:
+            result["raw"] = raw
+            # Vorzeichenbehaftet (Zweierkomplement) für Temperaturen o.ä.
+            result["signed"] = raw - 0x10000 if raw & 0x8000 else raw
         else:
-            auth = None
+            result["raw"] = message[6]
+        if decoded is not None:
+            result["name"], result["value"] = decoded
+        return result
+
+    def probe(self, timeout: float = _PROBE_TIMEOUT) -> dict:
+        """Check the connection with one small request and return its values.
+
+        Liest nur den HK-Typ aller möglichen Heizkreise (ein Request, kurzer
+        Timeout, keine Wiederholung), siehe ``detect_heating_circuits``.
+        Raises WeishauptConnectionError, WeishauptAuthError or
+        WeishauptBusyError.
+        """
+
+        # Nicht hinter einem laufenden Abruf einer anderen Instanz warten
+        if not _lock.acquire(timeout=timeout):
+            raise WeishauptBusyError("Another request to the WCM-COM is still running")
+        try:
+            messages = self._post_telegrams(
+                build_telegram(CIRCUIT_DETECTION_PARAMETERS)["telegramm"], timeout
+            )
+        finally:
+            _lock.release()
+
+        values = {}
+        for message in messages:
+            decoded = self._decode_message(message)
+            if decoded is not None:
+                values[decoded[0]] = decoded[1]
+        if not values:
+            raise WeishauptError("WCM-COM answered without any known parameter")
+        return values
+
+    def _fetch_data(self, groups, deadline: float | None = None):
+        """Actual data fetching logic for the given parameter groups.
+
+        Values of groups that are not part of this cycle are kept from the
+        previous snapshot, so slow tiers do not flap to unavailable. Returns
+        the list of groups that were fetched successfully.
+        """
+        _LOGGER.debug("Fetching new data for groups %s", groups)
 
         for attempt in range(3):  # Bis zu 3 Versuche, falls die Anfrage fehlschlägt
+            # Kein weiterer Versuch, wenn das Zeitbudget des Zyklus aufgebraucht ist
+            if attempt and deadline is not None and time.monotonic() >= deadline:
+                break
             try:
                 result = {}
+                fetched = []
 
-                # Mehrere Requests: globale Parameter, Heizkreis-Prozesswerte,
-                # Versionsparameter, Heizkreis-Konfig/User-Parameter und
-                # Fachmann-/Expert-Parameter separat, analog zur WebApp.
-                for params in (
-                    global_params,
-                    hk_process_params,
-                    hk_version_params,
-                    hk_config_params,
-                    hk_user_params,  # eigener Block nur für HK1/HK2 User-Parameter
-                    date_params,     # HK1 Holiday Temp Level + System Date/Time + DST
-                    expert_params,
-                ):
+                # Ein Request pro fälliger Gruppe, analog zur WebApp; bei
+                # vielen Heizkreisen wird die Gruppe auf mehrere Requests
+                # verteilt (pack_telegrams).
+                for group in groups:
+                    params = self._groups.get(group)
                     if not params:
                         continue
 
-                    req = requests.post(
-                        url,
-                        auth=auth,
-                        data=json.dumps(build_telegram(params)),
-                        headers={'Content-Type': 'application/json'},
-                        timeout=60  # Timeout auf 60 Sekunden erhöhen
-                    )
-                    req.raise_for_status()
-
-                    # Prüfen, ob die Antwort gültig ist
-                    if req.text.strip() == "":
-                        _LOGGER.warning("Received empty response from Weishaupt WCM-COM, retrying...")
-                        self._data = {}
-                        continue  # Versuchen Sie es erneut
-
-                    # Prüfen, ob der Server überlastet ist (Server antwortet mit HTML)
-                    if "<HTML>" in req.text.upper():
-                        _LOGGER.warning("Received 'server busy' response, retrying...")
-                        self._data = {}
-                        continue  # Versuchen Sie es erneut
-
-                    # Versuchen, die Antwort als JSON zu dekodieren
+                    # Bei ungültigen Antworten (leer, "server busy" als HTML,
+                    # kaputtes JSON) bleibt die Gruppe fällig und wird im
+                    # nächsten Zyklus erneut abgefragt.
+                    response_data = []
                     try:
-                        response_json = req.json()
-                    except json.JSONDecodeError as e:
-                        _LOGGER.error(f"JSON decode error: {e}. Response content: {req.text}")
-                        self._data = {}
-                        continue  # Versuchen Sie es erneut
+                        for chunk in pack_telegrams(build_telegram(params)["telegramm"]):
+                            response_data.extend(self._post_telegrams(chunk, self._request_timeout(deadline)))
+                    except WeishauptBusyError:
+                        _LOGGER.warning("Received 'server busy' response, skipping group %s until the next cycle", group)
+                        continue
+                    except WeishauptResponseError as err:
+                        _LOGGER.warning("%s, skipping group %s until the next cycle", err, group)
+                        continue
 
                     # Verarbeiten der empfangenen Daten
-                    response_data = response_json.get("telegramm", [])
                     _LOGGER.debug(f"Raw response data: {response_data}")
 
                     for message in response_data:
-                        # Erwartete Formate:
-                        #  - Standard: [modultyp, bus, cmd, id, index, prot, data_low, data_high]
-                        #  - Spezialfall (z.B. 3794/Device Conf): [modultyp, bus, cmd, id, index, prot, text]
-                        if len(message) < 7:
-                            _LOGGER.warning("Received malformed telegram from WCM-COM (len=%s): %s", len(message), message)
-                            continue
-
-                        param_id = message[3]
-                        bus_id = message[1]
-
-                        if len(message) >= 8:
-                            low_byte = message[6]
-                            high_byte = message[7]
-                        else:
-                            # Keine getrennten Bytes vorhanden (z.B. Textwert) -> Dummy-Bytes
-                            low_byte = 0
-                            high_byte = 0
-
-                        # Zuordnung des Parameters:
-                        # 1. Bevorzuge HK-spezifische Einträge mit explizitem "bus" == bus_id
-                        #    und passenden "modultyp" (FS/MS), damit 409/410 sauber
-                        #    zwischen FS- und EM-Versionen getrennt werden.
-                        # 2. Fallback: Einträge mit passendem "bus" (ohne modultyp).
-                        # 3. Fallback: globaler Eintrag ohne "bus" (z.B. Kesselwerte)
-                        candidates = [p for p in PARAMETERS if p["id"] == param_id]
-                        param = next(
-                            (p for p in candidates if p.get("bus") == bus_id and p.get("modultyp") == message[0]),
-                            None,
-                        )
-                        if param is None:
-                            param = next((p for p in candidates if p.get("bus") == bus_id and "modultyp" not in p), None)
-                        if param is None:
-                            param = next((p for p in candidates if "bus" not in p), None)
-
-                        if param:
-                            # Spezialfall: Device Conf (3794) liefert einen Text wie "WAP P3" im letzten Feld.
-                            if param["id"] == 3794 and len(message) >= 7 and isinstance(message[6], str):
-                                value = message[6]
-
-                            elif param["type"] == "temperature":
-                                raw_value = self.get_temperature(low_byte, high_byte)
-                                value = raw_value
-
-                                # Für Debugging von HK2 User-Parametern explizit loggen, was ankommt
-                                if getattr(self, "advanced_logging", False) and param["name"].startswith("HK2 User"):
-                                    _LOGGER.debug(
-                                        "HK2 User parameter %s (id=%s, bus=%s) raw temperature=%s",
-                                        param["name"],
-                                        param["id"],
-                                        bus_id,
-                                        raw_value,
-                                    )
-
-                                # Bekannter Weishaupt-Sentinelwert für "kein gültiger Wert": -3276.8 °C
-                                # -> leise auf vorherigen Wert oder None zurückfallen, ohne Log-Spam.
-                                if value == -3276.8:
-                                    if param["name"] in self.previous_values:
-                                        value = self.previous_values[param["name"]]
-                                    else:
-                                        value = None
-
-                                # Plausibilitätsprüfung für Temperaturwerte (z. B. -50 bis 150 °C)
-                                elif value < -50 or value > 150:
-                                    _LOGGER.warning(
-                                        "Unplausibler Temperaturwert für %s: %s. Nutze vorherigen Wert oder setze auf 'unavailable'.",
-                                        param["name"],
-                                        value,
-                                    )
-                                    if param["name"] in self.previous_values:
-                                        value = self.previous_values[param["name"]]
-                                    else:
-                                        value = None
-
-                            elif param["type"] == "value":
-                                value = self.get_value(low_byte, high_byte)
-                                # Numerische Prüfung für 'value'
-                                if not isinstance(value, (int, float)):
-                                    _LOGGER.warning(f"Nicht-numerischer Wert erkannt: {value}. Setze auf 0.")
-                                    value = 0  # Fallback auf 0 bei nicht-numerischen Werten
-
-                            elif param["type"] == "percent":
-                                value = self.get_value(low_byte, high_byte)
-                                # P37/P38 (Max Power Heating/WW) kommen als x10 -> auf % skalieren
-                                if param["id"] in (319, 345):
-                                    value = value / 10
-
-                            elif param["type"] == "binary":
-                                value = self.get_binary(low_byte, high_byte)
-                            elif param["type"] == "code":
-                                value = self.get_code(low_byte, high_byte)
-                            else:
-                                value = low_byte + 256 * high_byte  # Fallback
-
+                        decoded = self._decode_message(message)
+                        if decoded is not None:
                             # Speichern/Mergen der Werte
-                            result[param["name"]] = value
-                            self.previous_values[param["name"]] = value
+                            name, value = decoded
+                            result[name] = value
+                            self.previous_values[name] = value
+
+                    fetched.append(group)
 
                 _LOGGER.debug(f"Received data: {result}")
 
-                # Versionen für FS/EM aus den Rohwerten (High/Low) berechnen
-
-                # Kessel (Bus 0) – nur FS-Version (EM ist bei Manuel N/V)
-                kessel_fs_high = result.get("Kessel Version FS High")
-                kessel_fs_low = result.get("Kessel Version FS Low")
-                if kessel_fs_high is not None and kessel_fs_low is not None and kessel_fs_high != 0:
-                    result["Kessel Config Version FS"] = f"{kessel_fs_high}.{kessel_fs_low}"
-
-                # Heizkreise HK1/HK2 – FS/EM-Version pro Kreis
-                for hk in (1, 2):
-                    fs_high = result.get(f"HK{hk} Version FS High")
-                    fs_low = result.get(f"HK{hk} Version FS Low")
-                    em_high = result.get(f"HK{hk} Version EM High")
-                    em_low = result.get(f"HK{hk} Version EM Low")
-
-                    if fs_high is not None and fs_low is not None and fs_high != 0:
-                        result[f"HK{hk} Config Version FS"] = f"{fs_high}.{fs_low}"
-
-                    if em_high is not None and em_low is not None and em_high != 0:
-                        result[f"HK{hk} Config Version EM"] = f"{em_high}.{em_low}"
-
-                _LOGGER.debug(f"Received data (with versions): {result}")
-                self._data = result  # Speichern Sie die aktualisierten Daten
-                return  # Erfolgreiches Ende der Schleife, Daten erfolgreich abgerufen
-
-            except requests.exceptions.HTTPError as err:
-                if req.status_code == 401:
-                    _LOGGER.error("Authentication failed. Please check your username and password.")
-                else:
-                    _LOGGER.error(f"HTTP error occurred: {err}")
-                self._data = {}
-            except requests.exceptions.RequestException as e:
+                # Mit dem letzten Snapshot mergen, damit Gruppen langsamer
+                # Stufen ihre Werte bis zum nächsten Abruf behalten.
+                data = dict(self._data)
+                data.update(result)
+                compute_versions(data)
+
+                _LOGGER.debug(f"Received data (with versions): {data}")
+                self._data = data  # Speichern Sie die aktualisierten Daten
+
+                now = time.monotonic()
+                wall = time.time()
+                for group in fetched:
+                    self._group_last_fetch[group] = now
+                    self._group_fetched_at[group] = wall
+                return fetched  # Erfolgreiches Ende der Schleife, Daten erfolgreich abgerufen
+
+            except WeishauptAuthError:
+                _LOGGER.error("Authentication failed. Please check your username and password.")
+            except WeishauptConnectionError as e:
                 _LOGGER.error(f"HTTP request error: {e}")
-                self._data = {}
             except Exception as e:
                 _LOGGER.error(f"Unexpected error: {e}")
-                self._data = {}
 
-        # Wenn alle Versuche fehlschlagen
+        # Wenn alle Versuche fehlschlagen: die Gruppen bleiben fällig und
+        # werden beim nächsten Update erneut abgefragt.
         _LOGGER.error("Failed to fetch data from Weishaupt WCM-COM after multiple attempts.")
-        self._data = {}
-
-    def get_temperature(self, low_byte, high_byte):
-        """Calculate temperature from two bytes."""
-        raw_value = low_byte + 256 * high_byte
-        if high_byte < 128:
-            return raw_value / 10
-        else:
-            return (raw_value - 65536) / 10
-
-    def write_parameter(self, parameter_id: int, bus: int, modultyp: int, code: int) -> None:
-        """Write a simple enum parameter (HK1 config) via CoCo telegram.
-
-        This mirrors the structure used in the read path, but with
-        TEL_COMMAND set to write (2) and the code in the low byte.
-        The high byte is 0 because all our enums are small.
+        for group in groups:
+            self.invalidate_group(group)
+        return []
+
+    def _post_telegrams(self, telegrams, timeout: float = _REQUEST_TIMEOUT) -> list:
+        """Send raw telegrams in one request and return the response telegrams."""
+        return post_telegrams(self._host, telegrams, self._username, self._password, timeout)
+
+    def _read_params(self, params) -> dict:
+        """Read the given catalog entries in chunked requests and merge them."""
+        return self._read_telegrams(build_telegram(params)["telegramm"])
+
+    def _read_telegrams(self, telegrams) -> dict:
+        """Send read telegrams in chunked requests and merge the results."""
+
+        values = {}
+        for start in range(0, len(telegrams), MAX_TELEGRAMS_PER_REQUEST):
+            for message in self._post_telegrams(telegrams[start:start + MAX_TELEGRAMS_PER_REQUEST]):
+                decoded = self._decode_message(message)
+                if decoded is not None:
+                    values[decoded[0]] = decoded[1]
+
+        self._merge_values(values)
+        return values
+
+    def _merge_values(self, values: dict) -> None:
+        """Merge freshly read values into a copy of the snapshot."""
+
+        data = dict(self._data)
+        data.update(values)
+        compute_versions(data)
+        self._data = data
+        self.previous_values.update(values)
+
+    @staticmethod
+    def _request_timeout(deadline: float | None) -> float:
+        """Return the request timeout, capped by the remaining cycle budget."""
+        if deadline is None:
+            return _REQUEST_TIMEOUT
+        remaining = deadline - time.monotonic()
+        return max(_MIN_REQUEST_TIMEOUT, min(_REQUEST_TIMEOUT, remaining))
+
+    def _fetch_heartbeat(self) -> bool:
+        """Read the heartbeat parameters in a single small request.
+
+        Die Werte werden direkt in den Snapshot übernommen. Gibt True zurück,
+        wenn sich ein Wert geändert hat – oder wenn der Heartbeat fehlschlägt,
+        damit der reguläre Abruf samt Fehlerbehandlung übernimmt.
         """
 
-        ENDPOINT = "/parameter.json"
-        url = f"http://{self._host}{ENDPOINT}"
-
-        telegram = {
-            "prot": "coco",
-            "telegramm": [
-                [
-                    modultyp,  # TEL_MODULTYP (destination)
-                    bus,       # TEL_BUSKENNUNG (HK1 = 1)
-                    2,         # TEL_COMMAND (2 = write)
-                    parameter_id,  # TEL_INFONR
-                    0,         # TEL_INDEX
-                    0,         # TEL_PROT
-                    code & 0xFF,      # TEL_DATA low
-                    (code >> 8) & 0xFF,  # TEL_DATA high
-                ]
-            ],
-        }
-
-        _LOGGER.debug("Writing parameter %s (bus=%s, modultyp=%s) with code %s", parameter_id, bus, modultyp, code)
-
-        # Optional Auth wie im Read-Pfad
-        if self._username and self._password:
-            auth = HTTPDigestAuth(self._username, self._password)
-        else:
-            auth = None
-
         try:
-            req = requests.post(
-                url,
-                auth=auth,
-                data=json.dumps(telegram),
-                headers={"Content-Type": "application/json"},
-                timeout=30,
-            )
+            response_data = self._post_telegrams(build_telegram(HEARTBEAT_PARAMETERS)["telegramm"], _HEARTBEAT_TIMEOUT)
+        except WeishauptError as err:
+            _LOGGER.debug("Heartbeat request failed: %s", err)
+            return True
+
+        values = {}
+        for message in response_data:
+            decoded = self._decode_message(message)
+            if decoded is not None:
+                values[decoded[0]] = decoded[1]
+
+        if len(values) < len(HEARTBEAT_PARAMETERS):
+            return True
+
+        changed = any(self._data.get(name) != value for name, value in values.items())
+        if changed and getattr(self, "advanced_logging", False):
+            _LOGGER.debug("Heartbeat change detected: %s", values)
+
+        data = dict(self._data)
+        data.update(values)
+        self._data = data
+        self.previous_values.update(values)
+        return changed
+
+    def _decode_message(self, message):
+        """Decode a response telegram and remember its raw code.
+
+        Returns None for malformed telegrams or unknown parameters.
+        """
 
-            # "Server busy"-Antworten (HTML) nicht als harten Fehler werten,
-            # sondern nur warnen – das Gerät ist träge und lässt sich ggf.
-            # mit dem nächsten regulären Poll wieder einfangen.
-            if "<HTML>" in req.text.upper():
-                _LOGGER.warning("WCM-COM returned 'server busy' on write for parameter %s", parameter_id)
-                return
+        decoded = decode_telegram(message, self.previous_values)
+        code = telegram_code(message)
+        if code is not None:
+            self._raw_codes[(message[0], message[1], message[3])] = (code, time.monotonic())
 
-            req.raise_for_status()
-            _LOGGER.debug("Write result: %s", req.text)
-        except Exception as err:  # pragma: no cover
-            _LOGGER.error("Error writing parameter %s: %s", parameter_id, err)
+        # Für Debugging der HK-Userparameter explizit loggen, was ankommt
+        if decoded is not None and self.advanced_logging and circuit_of(decoded[0]) and " User " in decoded[0]:
+            _LOGGER.debug("HK User parameter %s (id=%s, bus=%s) value=%s", decoded[0], message[3], message[1], decoded[1])
+        return decoded
 
-    def get_value(self, low_byte, high_byte):
-        """Calculate a value from two bytes."""
-        return low_byte + 256 * high_byte
+    def write_is_noop(self, parameter_id: int, bus: int, modultyp: int, code: int) -> bool:
+        """Return True (and count it) if ``code`` is already the device value.
 
-    def get_binary(self, low_byte, high_byte):
-        """Return binary status as True or False."""
-        return bool(low_byte + 256 * high_byte)
+        Nur Werte, die innerhalb von ``write_skip_max_age`` gelesen oder
+        bestätigt wurden, gelten als aktuell genug.
+        """
 
-    def get_code(self, low_byte, high_byte):
-        """Calculate a code value from two bytes."""
-        return low_byte + 256 * high_byte
+        if not self.write_skip_max_age:
+            return False
+        cached = self._raw_codes.get((modultyp, bus, parameter_id))
+        if cached is None or cached[0] != code:
+            return False
+        if time.monotonic() - cached[1] > self.write_skip_max_age:
+            return False
+
+        self.skipped_writes += 1
+        _LOGGER.debug("Skipping write of parameter %s (bus=%s): value %s is already set", parameter_id, bus, code)
+        return True
+
+    def write_parameters(self, writes) -> tuple[list[bool], dict]:
+        """Write several parameters in one multi-telegram request.
+
+        ``writes`` is a list of (parameter_id, bus, modultyp, code) tuples.
+        Aufbau wie im Lesepfad, aber mit TEL_COMMAND = 2 (write) und dem
+        Code in Low/High-Byte. Busy/invalid responses raise WeishauptError.
+
+        Returns one result per write and the confirmed values by parameter
+        name. A write counts as successful if the echo carries the written
+        code; all other written addresses (no echo, empty response, other
+        code) are read back in a single request and succeed only if the
+        device then reports the written code.
+        """
+
+        results: list[bool | None] = []
+        confirmed: dict = {}
+        read_back: list[tuple[int, int, int]] = []
+        with _lock:
+            for start in range(0, len(writes), MAX_TELEGRAMS_PER_REQUEST):
+                chunk = writes[start:start + MAX_TELEGRAMS_PER_REQUEST]
+                telegrams = [write_telegram(modultyp, bus, parameter_id, code) for parameter_id, bus, modultyp, code in chunk]
+                _LOGGER.debug("Writing %s telegram(s): %s", len(telegrams), telegrams)
+
+                response = self._post_telegrams(telegrams, timeout=30)
+                _LOGGER.debug("Write result: %s", response)
+
+                echoed = {
+                    (message[0], message[1], message[3]): message
+                    for message in response
+                    if isinstance(message, list) and len(message) >= 4
+                }
+                for parameter_id, bus, modultyp, code in chunk:
+                    address = (modultyp, bus, parameter_id)
+                    # Gibt das Gerät den geschriebenen Wert zurück, genügt das
+                    # Echo als Bestätigung; sonst gezielt nachlesen.
+                    echo = echoed.get(address)
+                    if echo is not None and telegram_code(echo) == code:
+                        results.append(True)
+                        decoded = self._decode_message(echo)
+                        if decoded is not None:
+                            confirmed[decoded[0]] = decoded[1]
+                    else:
+                        results.append(None)
+                        read_back.append(address)
+
+            if confirmed:
+                self._merge_values(confirmed)
+
+            if read_back:
+                read_at = time.monotonic()
+                telegrams = [read_telegram(modultyp, bus, parameter_id) for modultyp, bus, parameter_id in read_back]
+                try:
+                    values = self._read_telegrams(telegrams)
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.warning("Read-back after write failed: %s", err)
+                    values = {}
+                confirmed.update(values)
+                # Ohne Katalogwert (Fehler, keine Antwort, unbekannte Adresse)
+                # die Gruppen des Parameters beim nächsten Zyklus lesen
+                for modultyp, bus, parameter_id in read_back:
+                    param = find_parameter(modultyp, bus, parameter_id)
+                    if param is None or param["name"] not in values:
+                        self.invalidate_parameter(parameter_id, bus, modultyp)
+
+        # Ohne passendes Echo zählt nur der nachgelesene Rohwert
+        for index, (parameter_id, bus, modultyp, code) in enumerate(writes):
+            if results[index] is None:
+                cached = self._raw_codes.get((modultyp, bus, parameter_id))
+                results[index] = cached is not None and cached[1] >= read_at and cached[0] == code
+                if not results[index]:
+                    _LOGGER.warning("WCM-COM did not confirm write of parameter %s (bus=%s)", parameter_id, bus)
+
+        return results, confirmed
 
     def process_codes(self, code):
         """Process error and warning codes."""
-        if code in ERROR_CODE_MAP:
-            return ERROR_CODE_MAP[code]
-        elif code in WARNING_CODE_MAP:
-            return WARNING_CODE_MAP[code]
-        else:
-            return f"Unbekannter Code ({code})"
+        return process_code(code)
 
     def get_curl_command(self):
         """Generate a curl command for testing the API request."""
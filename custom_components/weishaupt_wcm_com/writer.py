@@ -0,0 +1,222 @@
+"""Write batching for the Weishaupt WCM-COM integration.
+
+Writes issued within a short window (e.g. day/month/year of a holiday date
+or several sliders changed by one automation) are collected and sent to
+the WCM-COM as one ``telegramm`` array instead of one POST per parameter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DEFAULT_WRITE_BURST,
+    DEFAULT_WRITE_MIN_SPACING,
+    DEFAULT_WRITE_RATE,
+    WRITE_BATCH_WINDOW,
+)
+from .weishaupt_api import WeishauptAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WriteRateLimitError(HomeAssistantError):
+    """Raised when a write is refused by the write rate limiter."""
+
+
+class WriteRateLimiter:
+    """Token bucket per device plus a minimum spacing per parameter.
+
+    Jeder Write verbraucht ein Token; Tokens laufen mit ``rate`` pro Minute
+    bis maximal ``burst`` nach. Derselbe Parameter darf außerdem erst nach
+    ``min_spacing`` Sekunden erneut geschrieben werden, weil jeder Write im
+    EEPROM des Reglers landet. 0 deaktiviert die jeweilige Grenze.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_WRITE_RATE,
+        burst: int = DEFAULT_WRITE_BURST,
+        min_spacing: float = DEFAULT_WRITE_MIN_SPACING,
+    ) -> None:
+        """Initialize the limiter with a full bucket."""
+        self.rate = rate
+        self.burst = burst
+        self.min_spacing = min_spacing
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._last_write: dict[tuple[int, int, int], float] = {}
+        self.rejected = 0
+
+    def configure(self, rate: float, burst: int, min_spacing: float) -> None:
+        """Change the limits at runtime (options flow)."""
+        self._refill(time.monotonic())
+        self.rate = rate
+        self.burst = burst
+        self.min_spacing = min_spacing
+        self._tokens = min(self._tokens, float(burst))
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update."""
+        if self.rate:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate / 60)
+        self._updated = now
+
+    @callback
+    def async_check(self, keys) -> None:
+        """Raise WriteRateLimitError if ``keys`` (modultyp, bus, id) may not be written now."""
+
+        now = time.monotonic()
+        self._refill(now)
+
+        if self.min_spacing:
+            for key in keys:
+                last = self._last_write.get(key)
+                if last is not None and now - last < self.min_spacing:
+                    self.rejected += 1
+                    raise WriteRateLimitError(
+                        f"Parameter {key[2]} (bus {key[1]}) was written {now - last:.0f} s ago; "
+                        f"wait {self.min_spacing - (now - last):.0f} s before writing it again"
+                    )
+
+        if self.rate and self.burst and len(keys) > self._tokens:
+            self.rejected += 1
+            wait = (len(keys) - self._tokens) * 60 / self.rate
+            raise WriteRateLimitError(
+                f"Write rate limit reached ({self.rate:g} writes/min, burst {self.burst}); "
+                f"try again in {wait:.0f} s"
+            )
+
+    @callback
+    def async_acquire(self, keys) -> None:
+        """Check the limits and book the writes for ``keys``."""
+
+        if not keys:
+            return
+        self.async_check(keys)
+        if self.rate and self.burst:
+            self._tokens -= len(keys)
+        for key in keys:
+            self._last_write[key] = self._updated
+
+
+class WeishauptWriteBatcher:
+    """Collect write telegrams and flush them in a single request."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: WeishauptAPI,
+        on_confirmed: Callable[[list[str]], None],
+        limiter: WriteRateLimiter | None = None,
+        window: float = WRITE_BATCH_WINDOW,
+    ) -> None:
+        """Initialize the batcher.
+
+        ``on_confirmed`` is called with the names of the parameters whose new
+        value has been read back and merged into the snapshot.
+        """
+        self.hass = hass
+        self.api = api
+        self._on_confirmed = on_confirmed
+        self._window = window
+        self.limiter = limiter or WriteRateLimiter()
+        # (modultyp, bus, id) -> (code, futures); ein späterer Wert für
+        # denselben Parameter ersetzt den früheren im selben Fenster.
+        self._pending: dict[tuple[int, int, int], tuple[int, list[asyncio.Future]]] = {}
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+    async def async_write(self, parameter_id: int, bus: int, modultyp: int, code: int) -> bool:
+        """Queue a single write and wait for its result.
+
+        Writes of the value the device already reports return immediately.
+        Raises WriteRateLimitError if the write limits do not allow it.
+        """
+        return (await self.async_write_many([(parameter_id, bus, modultyp, code)]))[0]
+
+    async def async_write_many(self, writes) -> list[bool]:
+        """Queue several (parameter_id, bus, modultyp, code) writes together.
+
+        Die Limits werden für alle Writes gemeinsam geprüft: entweder geht
+        der ganze Satz in die Warteschlange oder keiner.
+        """
+
+        results: list[bool | asyncio.Future] = []
+        to_queue = []
+        for parameter_id, bus, modultyp, code in writes:
+            key = (modultyp, bus, parameter_id)
+            # Nur überspringen, wenn kein anderer Wert für denselben Parameter
+            # in der Warteschlange steht
+            if key not in self._pending and self.api.write_is_noop(parameter_id, bus, modultyp, code):
+                results.append(True)
+            else:
+                results.append(key)
+                to_queue.append(key)
+
+        # Ein Wert, der einen noch nicht gesendeten ersetzt, kostet keinen
+        # zusätzlichen Write
+        self.limiter.async_acquire([key for key in to_queue if key not in self._pending])
+
+        codes = {(modultyp, bus, parameter_id): code for parameter_id, bus, modultyp, code in writes}
+        results = [result if result is True else self._queue(result, codes[result]) for result in results]
+
+        if to_queue and self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self.hass, self._window, self._async_schedule_flush)
+        return [result if result is True else await result for result in results]
+
+    def _queue(self, key: tuple[int, int, int], code: int) -> asyncio.Future:
+        """Add a write to the pending batch and return its future."""
+
+        future = self.hass.loop.create_future()
+        _code, futures = self._pending.get(key, (code, []))
+        futures.append(future)
+        self._pending[key] = (code, futures)
+        return future
+
+    @callback
+    def _async_schedule_flush(self, _now) -> None:
+        """Flush the pending writes once the window has passed."""
+        self._unsub_flush = None
+        self.hass.async_create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        """Send all pending writes as one multi-telegram request."""
+
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        writes = [(parameter_id, bus, modultyp, code) for (modultyp, bus, parameter_id), (code, _f) in pending.items()]
+        try:
+            results, confirmed = await self.hass.async_add_executor_job(self.api.write_parameters, writes)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Error writing parameters %s: %s", [write[0] for write in writes], err)
+            results, confirmed = [False] * len(writes), {}
+
+        if confirmed:
+            self._on_confirmed(list(confirmed))
+
+        for (_code, futures), ok in zip(pending.values(), results):
+            for future in futures:
+                if not future.done():
+                    future.set_result(ok)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop pending writes (on unload)."""
+
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        for _code, futures in self._pending.values():
+            for future in futures:
+                if not future.done():
+                    future.set_result(False)
+        self._pending = {}
@@ -0,0 +1 @@
+"""Tests for the Weishaupt WCM-COM integration."""
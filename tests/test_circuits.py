@@ -0,0 +1,54 @@
+"""Tests for the per-circuit views behind climate and water_heater."""
+
+import pytest
+
+from custom_components.weishaupt_wcm_com.circuits import (
+    MODE_ABSENK,
+    MODE_NORMAL,
+    CircuitView,
+    circuit_view,
+    circuit_view_parameters,
+    setpoint_field,
+)
+from custom_components.weishaupt_wcm_com.const import MAX_HEATING_CIRCUITS
+from custom_components.weishaupt_wcm_com.protocol import encode_setting
+
+
+@pytest.mark.parametrize("circuit", range(1, MAX_HEATING_CIRCUITS + 1))
+def test_climate_setpoint_is_written_like_the_slider(circuit):
+    # Climate und Number schreiben denselben Sollwert: gleiche Adresse,
+    # gleicher Rohwert
+    view = CircuitView(circuit)
+    assert encode_setting(view.parameter(setpoint_field(MODE_NORMAL)), 21.5) == (5, circuit, 6, 215)
+    assert encode_setting(view.parameter(setpoint_field(MODE_ABSENK)), 17.0) == (8, circuit, 6, 170)
+    assert encode_setting(view.parameter("heating_mode"), MODE_NORMAL) == (274, circuit, 6, MODE_NORMAL)
+
+
+def test_view_parameters_do_not_share_addresses():
+    for circuit in range(1, MAX_HEATING_CIRCUITS + 1):
+        assert len(circuit_view_parameters(circuit)) == len(set(circuit_view_parameters(circuit)))
+
+
+def test_view_from_snapshot():
+    data = {
+        "HK2 Raumtemperatur": 20.5,
+        "HK2 User Normal Raumtemperatur": 21.0,
+        "HK2 User Absenk Raumtemperatur": 17.0,
+        "HK2 User Betriebsart HK": MODE_ABSENK,
+        "Heizung": True,
+        "Warmwasser": False,
+        "Warmwassertemperatur": 48.5,
+    }
+    view = circuit_view(data, 2)
+    assert view.room_temperature == 20.5
+    assert view.heating_mode == MODE_ABSENK
+    assert getattr(view, view.setpoint_field) == 17.0
+    assert view.heating and not view.hot_water
+    # Ohne eigene Warmwassertemperatur gilt die des Kessels
+    assert view.hot_water_temperature == 48.5
+
+
+def test_view_ignores_mapped_texts():
+    view = circuit_view({"HK1 User Betriebsart HK": "Normal", "HK1 Raumtemperatur": True}, 1)
+    assert view.heating_mode is None
+    assert view.room_temperature is None
@@ -0,0 +1,70 @@
+"""Tests for the LAN discovery helpers."""
+
+import pytest
+
+from custom_components.weishaupt_wcm_com import discovery
+from custom_components.weishaupt_wcm_com.const import DISCOVERY_MAX_HOSTS
+from custom_components.weishaupt_wcm_com.discovery import DiscoveredDevice, discovery_hosts, probe_device
+from custom_components.weishaupt_wcm_com.protocol import WeishauptAuthError, WeishauptResponseError
+
+
+def test_hosts_of_a_24_network():
+    hosts = discovery_hosts("192.168.1.0/24")
+    assert len(hosts) == 254
+    assert hosts[0] == "192.168.1.1"
+    assert hosts[-1] == "192.168.1.254"
+
+
+def test_host_bits_are_ignored():
+    assert discovery_hosts("192.168.1.77/30") == ["192.168.1.77", "192.168.1.78"]
+
+
+def test_single_address():
+    assert discovery_hosts("10.0.0.5") == ["10.0.0.5"]
+    assert discovery_hosts("10.0.0.5/32") == ["10.0.0.5"]
+
+
+@pytest.mark.parametrize("network", ["fd00::/120", "not a network", "192.168.300.0/24"])
+def test_invalid_networks(network):
+    with pytest.raises(ValueError):
+        discovery_hosts(network)
+
+
+def test_too_large_network():
+    assert DISCOVERY_MAX_HOSTS < 2048
+    with pytest.raises(ValueError, match="more than"):
+        discovery_hosts("10.0.0.0/21")
+
+
+def _answer_with(monkeypatch, result):
+    """Let post_telegrams return ``result`` or raise it."""
+
+    def post_telegrams(host, telegrams, username=None, password=None, timeout=None):
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(discovery, "post_telegrams", post_telegrams)
+
+
+def test_probe_reads_the_firmware(monkeypatch):
+    _answer_with(monkeypatch, [[6, 0, 1, 409, 0, 0, 3, 0], [6, 0, 1, 410, 0, 0, 27, 0]])
+    assert probe_device("10.0.0.5") == DiscoveredDevice("10.0.0.5", firmware="3.27")
+
+
+def test_probe_lists_a_wcm_com_login(monkeypatch):
+    _answer_with(monkeypatch, WeishauptAuthError("401", 'Digest realm="WCM-COM", nonce="x"'))
+    assert probe_device("10.0.0.5") == DiscoveredDevice("10.0.0.5", auth_required=True)
+
+
+@pytest.mark.parametrize("challenge", ['Basic realm="FRITZ!Box"', 'Digest realm="DiskStation" nginx', ""])
+def test_probe_skips_other_logins(monkeypatch, challenge):
+    _answer_with(monkeypatch, WeishauptAuthError("401", challenge))
+    assert probe_device("10.0.0.1") is None
+
+
+def test_probe_skips_hosts_without_known_parameters(monkeypatch):
+    _answer_with(monkeypatch, [[6, 0, 1, 65000, 0, 0, 1, 0]])
+    assert probe_device("10.0.0.7") is None
+    _answer_with(monkeypatch, WeishauptResponseError("Invalid JSON"))
+    assert probe_device("10.0.0.7") is None
@@ -0,0 +1,54 @@
+"""Tests for the activity based polling policy."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.weishaupt_wcm_com import polling
+from custom_components.weishaupt_wcm_com.polling import ActivityPollingPolicy
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock of the policy with a settable one."""
+    now = [1000.0]
+    monkeypatch.setattr(polling, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_idle_without_activity(clock):
+    policy = ActivityPollingPolicy(60, 10, hold_time=180)
+    assert policy.next_interval({"Flamme": False, "Heizung": 0}) == timedelta(seconds=60)
+    assert not policy.active
+
+
+def test_active_while_burning_and_for_the_hold_time(clock):
+    policy = ActivityPollingPolicy(60, 10, hold_time=180)
+    assert policy.next_interval({"Flamme": True}) == timedelta(seconds=10)
+    assert policy.active
+
+    clock[0] += 179
+    assert policy.next_interval({"Flamme": False}) == timedelta(seconds=10)
+
+    clock[0] += 1
+    assert policy.next_interval({"Flamme": False}) == timedelta(seconds=60)
+    assert policy.interval == timedelta(seconds=60)
+
+
+def test_hot_water_counts_as_activity(clock):
+    policy = ActivityPollingPolicy(60, 10)
+    assert policy.next_interval({"Warmwasser": True}) == timedelta(seconds=10)
+
+
+def test_active_interval_never_exceeds_idle_interval(clock):
+    policy = ActivityPollingPolicy(30, 90)
+    assert policy.next_interval({"Flamme": True}) == timedelta(seconds=30)
+
+
+def test_set_intervals_keeps_the_activity_state(clock):
+    policy = ActivityPollingPolicy(60, 10)
+    policy.next_interval({"Heizung": True})
+    policy.set_intervals(120, 20)
+    assert policy.active
+    assert policy.interval == timedelta(seconds=20)
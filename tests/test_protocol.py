@@ -0,0 +1,166 @@
+"""Tests for the CoCo catalog helpers and telegram coding."""
+
+import pytest
+
+from custom_components.weishaupt_wcm_com.const import PARAMETERS
+from custom_components.weishaupt_wcm_com.protocol import (
+    changed_settings,
+    decode_telegram,
+    encode_setting,
+    encode_value,
+    pack_telegrams,
+    restorable_settings,
+    shared_addresses,
+    telegram_address,
+    write_telegram,
+)
+
+
+def _param(name):
+    return next(p for p in PARAMETERS if p["name"] == name)
+
+
+def _telegram(modultyp, bus, parameter_id, code):
+    return [modultyp, bus, 1, parameter_id, 0, 0, code & 0xFF, (code >> 8) & 0xFF]
+
+
+def test_pack_telegrams_keeps_small_groups_in_one_request():
+    telegrams = list(range(24))
+    assert pack_telegrams(telegrams) == [telegrams]
+    assert pack_telegrams([]) == [[]]
+
+
+def test_pack_telegrams_splits_evenly():
+    telegrams = list(range(50))
+    chunks = pack_telegrams(telegrams)
+    assert [len(chunk) for chunk in chunks] == [17, 17, 16]
+    assert [t for chunk in chunks for t in chunk] == telegrams
+
+
+def test_pack_telegrams_respects_the_limit():
+    for count in range(1, 100):
+        chunks = pack_telegrams(list(range(count)), limit=20)
+        assert all(len(chunk) <= 20 for chunk in chunks)
+        assert len(chunks) == -(-count // 20)
+
+
+def test_decode_temperature():
+    assert decode_telegram(_telegram(6, 1, 5, 215)) == ("HK1 User Normal Raumtemperatur", 21.5)
+
+
+def test_decode_negative_temperature():
+    # Zweierkomplement: 0xFFEC = -2.0 °C
+    assert decode_telegram(_telegram(10, 0, 13, 0xFFEC)) == ("Vorlauftemperatur", -2.0)
+
+
+def test_decode_sentinel_falls_back_to_previous_value():
+    message = _telegram(10, 0, 13, 0x8000)
+    assert decode_telegram(message) == ("Vorlauftemperatur", None)
+    assert decode_telegram(message, {"Vorlauftemperatur": 35.0}) == ("Vorlauftemperatur", 35.0)
+
+
+def test_decode_picks_the_circuit_and_cascade_entries():
+    assert decode_telegram(_telegram(6, 2, 5, 200))[0] == "HK2 User Normal Raumtemperatur"
+    assert decode_telegram(_telegram(10, 1, 13, 400))[0] == "Kessel A Vorlauftemperatur"
+    assert decode_telegram(_telegram(10, 0, 13, 400))[0] == "Vorlauftemperatur"
+
+
+def test_decode_unknown_or_malformed_telegram():
+    assert decode_telegram(_telegram(10, 0, 65000, 1)) is None
+    assert decode_telegram([10, 0, 1, 13]) is None
+
+
+def test_id_274_is_only_the_heating_circuit_mode():
+    # 274 ist die Betriebsart HK; eine Betriebsart WW unter derselben
+    # Adresse würde beim Lesen und Schreiben mit ihr kollidieren.
+    assert decode_telegram(_telegram(6, 1, 274, 3)) == ("HK1 User Betriebsart HK", 3)
+    assert [p["name"] for p in PARAMETERS if p["id"] == 274 and p.get("bus") == 1] == ["HK1 User Betriebsart HK"]
+
+
+def test_catalog_has_no_shared_addresses():
+    assert shared_addresses(p["name"] for p in PARAMETERS) == []
+
+
+def test_encode_value_round_trips_through_decode():
+    for name, value in (
+        ("HK1 User Normal Raumtemperatur", 21.5),
+        ("HK1 User Normal Raumtemperatur", -2.5),
+        ("Expert Max Power Heating", 70.0),
+        ("HK1 User Betriebsart HK", 3),
+    ):
+        param = _param(name)
+        code = encode_value(param, value)
+        message = write_telegram(*telegram_address(param), param["id"], code)
+        assert decode_telegram(message) == (name, value)
+
+
+def test_encode_value_scales_temperatures_and_power():
+    assert encode_value(_param("HK1 User Normal Raumtemperatur"), 21.5) == 215
+    assert encode_value(_param("HK1 User Normal Raumtemperatur"), -0.5) == 0xFFFB
+    assert encode_value(_param("Expert Max Power Heating"), 70) == 700
+    assert encode_value(_param("HK1 User Betriebsart HK"), 3) == 3
+
+
+@pytest.mark.parametrize("value", ["warm", 7000, -3300])
+def test_encode_value_rejects_text_and_out_of_range(value):
+    with pytest.raises(ValueError):
+        encode_value(_param("HK1 User Normal Raumtemperatur"), value)
+
+
+def test_encode_setting_uses_the_catalog_address_and_scaling():
+    assert encode_setting("Expert Max VL Target", 45) == (39, 0, 10, 450)
+    assert encode_setting("Expert Max Power Heating", 70) == (319, 0, 10, 700)
+    assert encode_setting("HK1 User Normal Raumtemperatur", 21.5) == (5, 1, 6, 215)
+    assert encode_setting("HK2 User Normal Raumtemperatur", 21.5) == (5, 2, 6, 215)
+    assert encode_setting("HK1 Expert Ein Opti MAX", 4) == (272, 1, 6, 4)
+
+
+def test_encode_setting_rejects_read_only_and_unknown_names():
+    for name in ("Vorlauftemperatur", "Bogus"):
+        with pytest.raises(ValueError):
+            encode_setting(name, 1)
+
+
+def test_changed_settings_compares_telegram_codes():
+    data = {"HK1 User Normal Raumtemperatur": 21.0, "HK1 User Absenk Raumtemperatur": 18.0}
+    values = {
+        "HK1 User Normal Raumtemperatur": 21,
+        "HK1 User Absenk Raumtemperatur": 17.5,
+        "HK2 User Normal Raumtemperatur": 20.0,
+    }
+    assert changed_settings(data, values) == {
+        "HK1 User Absenk Raumtemperatur": 17.5,
+        "HK2 User Normal Raumtemperatur": 20.0,
+    }
+
+
+def test_changed_settings_writes_over_text_values():
+    assert changed_settings({"HK1 User Betriebsart HK": "Normal"}, {"HK1 User Betriebsart HK": 3}) == {
+        "HK1 User Betriebsart HK": 3
+    }
+
+
+def test_changed_settings_rejects_read_only_parameters():
+    with pytest.raises(ValueError, match="read-only"):
+        changed_settings({}, {"Vorlauftemperatur": 40})
+
+
+def test_restore_skips_settings_of_unconfigured_circuits():
+    backup = {"HK1 User Normal Raumtemperatur": 21.0, "HK3 User Normal Raumtemperatur": 20.0}
+    assert restorable_settings(backup, [1, 2]) == (
+        {"HK1 User Normal Raumtemperatur": 21.0},
+        ["HK3 User Normal Raumtemperatur"],
+    )
+
+
+@pytest.mark.parametrize("name", ["Vorlauftemperatur", "System Date Day", "Unbekannt"])
+def test_restore_rejects_parameters_outside_the_backup(name):
+    with pytest.raises(ValueError, match="Unknown parameters"):
+        restorable_settings({name: 1}, [1, 2])
+
+
+def test_restore_writes_only_the_differences():
+    backup = {"HK1 User Normal Raumtemperatur": 21.0, "HK1 User Absenk Raumtemperatur": 16.0}
+    data = {"HK1 User Normal Raumtemperatur": 21.0, "HK1 User Absenk Raumtemperatur": 18.0}
+    parameters, _ = restorable_settings(backup, [1])
+    assert changed_settings(data, parameters) == {"HK1 User Absenk Raumtemperatur": 16.0}
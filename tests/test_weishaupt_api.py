@@ -0,0 +1,234 @@
+"""Tests for the snapshot, scheduling and write path of WeishauptAPI."""
+
+import pytest
+
+from custom_components.weishaupt_wcm_com import weishaupt_api
+from custom_components.weishaupt_wcm_com.const import (
+    GROUP_POLL_TIERS,
+    GROUP_USER,
+    POLL_TIER_FAST,
+    POLL_TIER_SLOW,
+    POLL_TIER_VERY_SLOW,
+)
+from custom_components.weishaupt_wcm_com.protocol import (
+    CIRCUIT_DETECTION_PARAMETERS,
+    PARAMETER_GROUPS,
+    WeishauptConnectionError,
+    WeishauptError,
+    detect_heating_circuits,
+)
+from custom_components.weishaupt_wcm_com.weishaupt_api import WeishauptAPI
+
+HK1_NORMAL = (6, 1, 5)
+
+TIER_INTERVALS = {POLL_TIER_FAST: 60, POLL_TIER_SLOW: 900, POLL_TIER_VERY_SLOW: 86400}
+
+
+class FakeDevice:
+    """Answers telegrams like a WCM-COM with a dict of raw codes."""
+
+    def __init__(self, codes=None, echo=True, accept=True):
+        self.codes = dict(codes or {})
+        self.echo = echo
+        self.accept = accept
+        self.fail_reads = False
+        self.requests = []
+
+    def __call__(self, telegrams, timeout=None):
+        self.requests.append(telegrams)
+        response = []
+        for telegram in telegrams:
+            address = (telegram[0], telegram[1], telegram[3])
+            if telegram[2] == 2:
+                if self.accept:
+                    self.codes[address] = telegram[6] + 256 * telegram[7]
+                if not self.echo:
+                    continue
+            elif self.fail_reads:
+                raise WeishauptConnectionError("timeout")
+            code = self.codes.get(address, 0)
+            response.append([*address[:2], 1, address[2], 0, 0, code & 0xFF, code >> 8])
+        return response
+
+
+@pytest.fixture
+def device():
+    return FakeDevice({HK1_NORMAL: 215})
+
+
+@pytest.fixture
+def api(device):
+    api = WeishauptAPI("192.168.1.10", tier_intervals=TIER_INTERVALS)
+    api._post_telegrams = device
+    return api
+
+
+class FakeClock:
+    """Stands in for the time module so that tests can advance time."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(weishaupt_api, "time", clock)
+    return clock
+
+
+def _groups(tier):
+    return [group for group in PARAMETER_GROUPS if GROUP_POLL_TIERS[group] == tier]
+
+
+def _poll_all(api):
+    for group in api.due_groups():
+        assert api.update_group(group)
+
+
+def test_echo_confirms_the_write(api, device):
+    results, confirmed = api.write_parameters([(5, 1, 6, 220)])
+    assert results == [True]
+    assert confirmed == {"HK1 User Normal Raumtemperatur": 22.0}
+    assert api.data["HK1 User Normal Raumtemperatur"] == 22.0
+    assert len(device.requests) == 1
+
+
+def test_without_echo_the_write_is_read_back(api, device):
+    device.echo = False
+    results, confirmed = api.write_parameters([(5, 1, 6, 220)])
+    assert results == [True]
+    assert confirmed == {"HK1 User Normal Raumtemperatur": 22.0}
+    assert [telegram[2] for request in device.requests for telegram in request] == [2, 1]
+
+
+def test_ignored_write_is_reported_as_failed(api, device):
+    device.echo = False
+    device.accept = False
+    results, confirmed = api.write_parameters([(5, 1, 6, 220)])
+    assert results == [False]
+    # Der nachgelesene alte Wert landet trotzdem im Snapshot (Rollback)
+    assert confirmed == {"HK1 User Normal Raumtemperatur": 21.5}
+
+
+def test_failed_read_back_marks_the_group_due(api, device):
+    _poll_all(api)
+    assert api.due_groups() == []
+
+    device.echo = False
+    device.fail_reads = True
+    results, _confirmed = api.write_parameters([(5, 1, 6, 220)])
+    assert results == [False]
+    assert GROUP_USER in api.due_groups()
+
+
+def test_read_back_outside_the_catalog_marks_the_group_due(api, device):
+    # (10, 0, 5) ist keine Katalogadresse: das Nachlesen liefert keinen
+    # Namen, also muss die Gruppe des Parameters neu gelesen werden
+    _poll_all(api)
+    device.echo = False
+    results, confirmed = api.write_parameters([(5, 0, 10, 220)])
+    assert results == [True]
+    assert confirmed == {}
+    assert GROUP_USER in api.due_groups()
+
+
+def test_writes_are_confirmed_per_address(api, device):
+    results, confirmed = api.write_parameters([(5, 1, 6, 220), (5, 2, 6, 190)])
+    assert results == [True, True]
+    assert confirmed == {"HK1 User Normal Raumtemperatur": 22.0, "HK2 User Normal Raumtemperatur": 19.0}
+
+
+def test_probe_reads_only_the_circuit_types(api, device):
+    device.codes.update({(6, 1, 16): 2, (6, 2, 16): 3, (6, 3, 16): 1})
+    values = api.probe()
+    assert [len(request) for request in device.requests] == [len(CIRCUIT_DETECTION_PARAMETERS)]
+    assert detect_heating_circuits(values) == [1, 3]
+
+
+def test_probe_without_known_parameters(api):
+    api._post_telegrams = lambda telegrams, timeout=None: [[10, 0, 1, 65000, 0, 0, 0, 0]]
+    with pytest.raises(WeishauptError):
+        api.probe()
+
+
+def test_next_due_in_follows_the_earliest_group(api, clock):
+    assert api.next_due_in() is None
+    _poll_all(api)
+    assert api.next_due_in() == pytest.approx(60 - 2)
+    clock.now += 30
+    assert api.next_due_in() == pytest.approx(30 - 2)
+    clock.now += 60
+    assert api.next_due_in() == 0
+
+
+def test_next_due_in_ignores_unfetched_groups(api, clock):
+    _poll_all(api)
+    api.invalidate_tier(POLL_TIER_FAST)
+    assert api.next_due_in() == pytest.approx(900 - 2)
+
+
+def test_never_fetched_groups_are_due_in_group_order(api, clock):
+    assert api.due_groups() == list(PARAMETER_GROUPS)
+    _poll_all(api)
+    assert api.due_groups() == []
+
+
+def test_due_groups_are_ordered_by_staleness(api, clock):
+    _poll_all(api)
+    clock.now += 60
+    assert api.due_groups() == _groups(POLL_TIER_FAST)
+    clock.now += 840
+    # 900 s sind für die schnelle Stufe 15 Intervalle, für die langsame eines
+    assert api.due_groups() == _groups(POLL_TIER_FAST) + _groups(POLL_TIER_SLOW)
+    api.invalidate_group(GROUP_USER)
+    assert api.due_groups()[0] == GROUP_USER
+
+
+def test_groups_left_over_by_the_budget_move_up(api, clock):
+    _poll_all(api)
+    clock.now += 900
+    # Das Budget reicht nur für die schnelle Stufe
+    for group in _groups(POLL_TIER_FAST):
+        assert api.update_group(group)
+    assert api.due_groups() == _groups(POLL_TIER_SLOW)
+    clock.now += 60
+    assert api.due_groups() == _groups(POLL_TIER_SLOW) + _groups(POLL_TIER_FAST)
+
+
+@pytest.fixture
+def skipping_api(device):
+    api = WeishauptAPI("192.168.1.10", tier_intervals=TIER_INTERVALS, write_skip_max_age=300)
+    api._post_telegrams = device
+    return api
+
+
+def test_writing_the_device_value_is_a_noop(skipping_api, clock):
+    _poll_all(skipping_api)
+    assert skipping_api.write_is_noop(5, 1, 6, 215)
+    assert not skipping_api.write_is_noop(5, 1, 6, 220)
+    assert skipping_api.skipped_writes == 1
+
+
+def test_confirmed_write_is_not_repeated(skipping_api, clock):
+    assert not skipping_api.write_is_noop(5, 1, 6, 220)
+    skipping_api.write_parameters([(5, 1, 6, 220)])
+    assert skipping_api.write_is_noop(5, 1, 6, 220)
+
+
+def test_outdated_device_value_is_written(skipping_api, clock):
+    _poll_all(skipping_api)
+    clock.now += 301
+    assert not skipping_api.write_is_noop(5, 1, 6, 215)
+    assert skipping_api.skipped_writes == 0
+
+
+def test_writes_are_never_skipped_by_default(api, clock):
+    _poll_all(api)
+    assert not api.write_is_noop(5, 1, 6, 215)
@@ -0,0 +1,140 @@
+"""Tests for the write rate limiter and the write batcher."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.weishaupt_wcm_com import writer  # noqa: E402
+from custom_components.weishaupt_wcm_com.writer import (  # noqa: E402
+    WeishauptWriteBatcher,
+    WriteRateLimitError,
+    WriteRateLimiter,
+)
+
+HK1_NORMAL = (6, 1, 5)
+HK1_ABSENK = (6, 1, 8)
+HK2_NORMAL = (6, 2, 5)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock of the limiter with a settable one."""
+    now = [1000.0]
+    monkeypatch.setattr(writer, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_burst_then_rate(clock):
+    limiter = WriteRateLimiter(rate=6, burst=2, min_spacing=0)
+    limiter.async_acquire([HK1_NORMAL])
+    limiter.async_acquire([HK1_ABSENK])
+    with pytest.raises(WriteRateLimitError, match="try again in 10 s"):
+        limiter.async_acquire([HK2_NORMAL])
+    assert limiter.rejected == 1
+
+    # 6 pro Minute: nach 10 s ist wieder ein Token da
+    clock[0] += 10
+    limiter.async_acquire([HK2_NORMAL])
+
+
+def test_check_is_all_or_nothing(clock):
+    limiter = WriteRateLimiter(rate=6, burst=2, min_spacing=0)
+    with pytest.raises(WriteRateLimitError):
+        limiter.async_acquire([HK1_NORMAL, HK1_ABSENK, HK2_NORMAL])
+    limiter.async_acquire([HK1_NORMAL, HK1_ABSENK])
+
+
+def test_min_spacing_per_parameter(clock):
+    limiter = WriteRateLimiter(rate=0, burst=0, min_spacing=5)
+    limiter.async_acquire([HK1_NORMAL])
+    limiter.async_acquire([HK2_NORMAL])
+
+    clock[0] += 4
+    with pytest.raises(WriteRateLimitError, match="Parameter 5 \\(bus 1\\)"):
+        limiter.async_check([HK1_NORMAL])
+
+    clock[0] += 1
+    limiter.async_acquire([HK1_NORMAL])
+
+
+def test_zero_disables_the_limits(clock):
+    limiter = WriteRateLimiter(rate=0, burst=0, min_spacing=0)
+    for _ in range(100):
+        limiter.async_acquire([HK1_NORMAL])
+    assert limiter.rejected == 0
+
+
+def test_configure_caps_the_tokens(clock):
+    limiter = WriteRateLimiter(rate=6, burst=20, min_spacing=0)
+    limiter.configure(rate=6, burst=1, min_spacing=0)
+    limiter.async_acquire([HK1_NORMAL])
+    with pytest.raises(WriteRateLimitError):
+        limiter.async_acquire([HK1_ABSENK])
+
+
+class _FakeAPI:
+    """Records the write requests instead of sending them."""
+
+    def __init__(self):
+        self.requests = []
+
+    def write_is_noop(self, parameter_id, bus, modultyp, code):
+        return False
+
+    def write_parameters(self, writes):
+        self.requests.append(writes)
+        return [True] * len(writes), {}
+
+
+class _FakeHass:
+    """Just enough of HomeAssistant for the batcher."""
+
+    def __init__(self, loop):
+        self.loop = loop
+
+    async def async_add_executor_job(self, target, *args):
+        return target(*args)
+
+    def async_create_task(self, coro):
+        return self.loop.create_task(coro)
+
+
+def test_batcher_coalesces_writes_into_one_request(monkeypatch):
+    flushes = []
+    monkeypatch.setattr(writer, "async_call_later", lambda hass, delay, action: flushes.append(action) or (lambda: None))
+    api = _FakeAPI()
+
+    async def run():
+        # Burst 2: der zweite Wert für denselben Parameter ersetzt den
+        # ersten und darf keinen weiteren Write kosten
+        batcher = WeishauptWriteBatcher(
+            _FakeHass(asyncio.get_running_loop()), api, lambda names: None, WriteRateLimiter(6, 2, 0)
+        )
+        writes = [
+            asyncio.ensure_future(batcher.async_write(5, 1, 6, 200)),
+            asyncio.ensure_future(batcher.async_write(5, 1, 6, 215)),
+            asyncio.ensure_future(batcher.async_write(8, 1, 6, 180)),
+        ]
+        await asyncio.sleep(0)
+        assert len(flushes) == 1
+        flushes[0](None)
+        return await asyncio.gather(*writes)
+
+    assert asyncio.run(run()) == [True, True, True]
+    assert api.requests == [[(5, 1, 6, 215), (8, 1, 6, 180)]]
+
+
+def test_batcher_skips_noop_writes(monkeypatch):
+    monkeypatch.setattr(writer, "async_call_later", lambda hass, delay, action: pytest.fail("nothing to flush"))
+    api = _FakeAPI()
+    api.write_is_noop = lambda parameter_id, bus, modultyp, code: True
+
+    async def run():
+        batcher = WeishauptWriteBatcher(_FakeHass(asyncio.get_running_loop()), api, lambda names: None)
+        return await batcher.async_write(5, 1, 6, 215)
+
+    assert asyncio.run(run()) is True
+    assert api.requests == []